@@ -580,6 +580,11 @@ private function extractPriceFromData(array $productData): ?float
      */
     private function extractWeight(array $productData): ?int
     {
+        // 스크래퍼가 단위 변환한 그램 값이 있으면 우선 사용
+        if (isset($productData['weight_g']) && is_numeric($productData['weight_g']) && $productData['weight_g'] > 0) {
+            return (int) round($productData['weight_g']);
+        }
+        
         // 먼저 스크래핑된 weight 데이터 확인
         if (isset($productData['weight']) && $productData['weight'] !== 'N/A' && !empty($productData['weight'])) {
             $weight = (float) $productData['weight'];
@@ -669,6 +674,11 @@ private function extractWeight(array $productData): ?int
      */
     private function extractDimensions(array $productData): ?string
     {
+        // 스크래퍼가 단위 변환한 cm 수치가 있으면 우선 사용
+        if (!empty($productData['dimensions_cm']) && is_array($productData['dimensions_cm']) && count($productData['dimensions_cm']) === 3) {
+            return implode(' x ', $productData['dimensions_cm']) . ' cm';
+        }
+        
         // 이미 dimensions 필드가 있으면 사용
         if (!empty($productData['dimensions'])) {
             return $productData['dimensions'];
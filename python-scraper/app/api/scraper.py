@@ -1,40 +1,115 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional, List
+import asyncio
+import json
+import time
+
+from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi.responses import StreamingResponse
+from typing import Optional, List, Dict, Tuple, Any, AsyncIterator
+
+from app.config.settings import settings
+from app.models.product import Product
 
 from app.core.scraper_factory import ScraperFactory
-from app.core.exceptions import UnsupportedSiteError, ProductNotFoundError, ScrapingError
+from app.core.exceptions import UnsupportedSiteError, ProductNotFoundError, ScrapingError, CircuitOpenError, BlockedPageError
+from app.core.http_client import http_client_manager
+from app.core.rate_limiter import rate_limiter
+from app.core.resilience import resilient_fetcher
+from app.core.single_flight import scrape_single_flight
+from app.core.html_cache import html_cache
+from app.core.product_cache import product_cache
+from app.core.parse_executor import parse_executor
+from app.scrapers.amazon import page_classifier, page_regions, page_context
+from app.services.content_fallback import content_fallback
+from app.services.translation_memory import translation_memory
+from app.services.translation_service import translation_service
+from app.services.translation_jobs import translation_jobs
 
 router = APIRouter(tags=["scraper"])
 
 
+def _circuit_open_exception(e: CircuitOpenError) -> HTTPException:
+    """회로 차단 상태는 상품 없음(404)과 구분해 503 + Retry-After로 응답"""
+    return HTTPException(
+        status_code=503,
+        detail=f"대상 사이트 일시 차단 중: {str(e)}",
+        headers={"Retry-After": str(int(e.retry_after) + 1)}
+    )
+
+
+# translate 파라미터 값 → 번역 모드 (sync: 번역 후 응답, none: 번역 안 함, deferred: 즉시 응답 후 백그라운드 번역)
+TRANSLATE_MODES = {
+    'true': 'sync', '1': 'sync', 'yes': 'sync', 'on': 'sync',
+    'false': 'none', '0': 'none', 'no': 'none', 'off': 'none',
+    'deferred': 'deferred',
+}
+
+
+def _translate_mode(value: str) -> str:
+    mode = TRANSLATE_MODES.get(value.strip().lower())
+    if mode is None:
+        raise HTTPException(status_code=400, detail="translate는 true, false, deferred 중 하나여야 합니다")
+    return mode
+
+
+async def _scrape_response(site: str, params: Dict[str, str], translate: str, max_age: Optional[int],
+                           use_cache: bool, extract_fallback: bool) -> Dict:
+    """단일 상품 스크래핑 응답 (deferred 모드는 원문으로 바로 응답하고 번역 작업 등록)"""
+    mode = _translate_mode(translate)
+    result, coalesced = await _scrape_coalesced(site, params, mode == 'sync', max_age, use_cache, extract_fallback)
+    
+    response = {
+        "success": True,
+        "site": site,
+        "translated": mode == 'sync',
+        "coalesced": coalesced,
+        "data": result.to_laravel_format()
+    }
+    if mode == 'deferred':
+        # 번역 결과는 GET /translations/{job_id}로 조회
+        response["translation_job"] = translation_jobs.submit(site, result).to_summary()
+    return response
+
+
+async def _scrape_coalesced(site: str, params: Dict[str, str], translate: bool,
+                            max_age: Optional[int] = None, use_cache: bool = True,
+                            extract_fallback: bool = True) -> Tuple[Product, bool]:
+    """동일 (사이트, 상품 파라미터, 번역 여부)의 동시 요청은 하나의 스크래핑을 공유
+    
+    Returns:
+        Tuple[상품, 다른 요청과 병합되었는지 여부]
+    """
+    scraper = ScraperFactory.create_scraper(site)
+    key = (site, tuple(sorted(params.items())), translate, max_age, use_cache, extract_fallback)
+    return await scrape_single_flight.do(
+        key, lambda: scraper.scrape_product(**params, translate=translate, max_age=max_age, use_cache=use_cache,
+                                            extract_fallback=extract_fallback)
+    )
+
+
 @router.get("/scrape")
 async def scrape_by_url(
     url: str = Query(..., description="스크래핑할 상품 URL"),
-    translate: bool = Query(True, description="한국어 번역 여부")
+    translate: str = Query("true", description="한국어 번역: true(번역 후 응답) / false / deferred(원문으로 즉시 응답, 번역은 translation_job으로 조회)"),
+    max_age: Optional[int] = Query(None, ge=0, description="이 시간(초) 이내에 캐시된 원본 HTML이 있으면 재사용"),
+    use_cache: bool = Query(True, description="파싱 결과 캐시 사용 여부 (가격/재고는 짧은 주기로 갱신)"),
+    extract_fallback: bool = Query(True, description="설명/특징을 찾지 못하면 trafilatura 본문 추출 시도 (시간 예산 적용)")
 ):
     """URL로 자동 사이트 감지 후 상품 스크래핑"""
     try:
         # URL에서 사이트와 파라미터 추출
         site, params = ScraperFactory.detect_site_from_url(url)
         
-        # 스크래퍼 생성 및 실행
-        scraper = ScraperFactory.create_scraper(site)
-        
-        # 번역 옵션 추가
-        params['translate'] = translate
-        result = await scraper.scrape_product(**params)
-        
-        return {
-            "success": True,
-            "site": site,
-            "translated": translate,
-            "data": result.to_laravel_format()
-        }
+        # 스크래퍼 실행 (동일 요청 진행 중이면 결과 공유)
+        return await _scrape_response(site, params, translate, max_age, use_cache, extract_fallback)
         
     except UnsupportedSiteError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except ProductNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except CircuitOpenError as e:
+        raise _circuit_open_exception(e)
+    except BlockedPageError as e:
+        raise HTTPException(status_code=503, detail=f"차단 페이지 감지 ({e.kind}): {str(e)}")
     except ScrapingError as e:
         raise HTTPException(status_code=500, detail=f"스크래핑 실패: {str(e)}")
 
@@ -46,51 +121,171 @@ async def scrape_by_site_params(
     shopId: Optional[str] = Query(None, description="Rakuten Shop ID"),
     itemCode: Optional[str] = Query(None, description="Rakuten Item Code"),
     productId: Optional[str] = Query(None, description="JINS Product ID"),
-    translate: bool = Query(True, description="한국어 번역 여부")
+    translate: str = Query("true", description="한국어 번역: true(번역 후 응답) / false / deferred(원문으로 즉시 응답, 번역은 translation_job으로 조회)"),
+    max_age: Optional[int] = Query(None, ge=0, description="이 시간(초) 이내에 캐시된 원본 HTML이 있으면 재사용"),
+    use_cache: bool = Query(True, description="파싱 결과 캐시 사용 여부 (가격/재고는 짧은 주기로 갱신)"),
+    extract_fallback: bool = Query(True, description="설명/특징을 찾지 못하면 trafilatura 본문 추출 시도 (시간 예산 적용)")
 ):
     """사이트별 파라미터로 직접 스크래핑"""
     try:
-        scraper = ScraperFactory.create_scraper(site)
+        ScraperFactory.create_scraper(site)
         
         # 사이트별 파라미터 설정
         if site == 'amazon':
             if not asin:
                 raise HTTPException(status_code=400, detail="Amazon은 asin 파라미터가 필요합니다")
-            result = await scraper.scrape_product(asin=asin, translate=translate)
+            params = {'asin': asin}
             
         elif site == 'rakuten':
             if not shopId or not itemCode:
                 raise HTTPException(status_code=400, detail="Rakuten은 shopId와 itemCode 파라미터가 필요합니다")
-            result = await scraper.scrape_product(shopId=shopId, itemCode=itemCode, translate=translate)
+            params = {'shopId': shopId, 'itemCode': itemCode}
             
         elif site == 'jins':
             if not productId:
                 raise HTTPException(status_code=400, detail="JINS는 productId 파라미터가 필요합니다")
-            result = await scraper.scrape_product(productId=productId, translate=translate)
+            params = {'productId': productId}
             
         else:
             raise HTTPException(status_code=400, detail=f"지원하지 않는 사이트: {site}")
         
-        return {
-            "success": True,
-            "site": site,
-            "translated": translate,
-            "data": result.to_laravel_format()
-        }
+        # 스크래퍼 실행 (동일 요청 진행 중이면 결과 공유)
+        return await _scrape_response(site, params, translate, max_age, use_cache, extract_fallback)
         
     except UnsupportedSiteError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except ProductNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except CircuitOpenError as e:
+        raise _circuit_open_exception(e)
+    except BlockedPageError as e:
+        raise HTTPException(status_code=503, detail=f"차단 페이지 감지 ({e.kind}): {str(e)}")
     except ScrapingError as e:
         raise HTTPException(status_code=500, detail=f"스크래핑 실패: {str(e)}")
 
 
+# 일괄 스크래핑에서 URL이 아닌 상품 ID를 받을 수 있는 사이트 → 파라미터 이름 (Rakuten은 URL만 지원)
+BATCH_ID_PARAMS = {'amazon': 'asin', 'jins': 'productId'}
+
+
+def _batch_params(item: str, site: str) -> Tuple[str, Dict[str, str]]:
+    """일괄 스크래핑 항목(URL 또는 상품 ID) → (사이트, 상품 파라미터)"""
+    if item.startswith(('http://', 'https://')):
+        return ScraperFactory.detect_site_from_url(item)
+    param = BATCH_ID_PARAMS.get(site)
+    if param is None:
+        raise HTTPException(status_code=400, detail=f"{site}는 상품 URL로만 일괄 스크래핑할 수 있습니다")
+    return site, {param: item}
+
+
+def _batch_error(e: Exception) -> Dict:
+    """일괄 스크래핑 항목 오류 → 단일 스크래핑 엔드포인트와 같은 상태 코드의 오류 정보"""
+    if isinstance(e, HTTPException):
+        status_code, detail = e.status_code, e.detail
+    elif isinstance(e, UnsupportedSiteError):
+        status_code, detail = 400, str(e)
+    elif isinstance(e, ProductNotFoundError):
+        status_code, detail = 404, str(e)
+    elif isinstance(e, CircuitOpenError):
+        status_code, detail = 503, f"대상 사이트 일시 차단 중: {str(e)}"
+    elif isinstance(e, BlockedPageError):
+        status_code, detail = 503, f"차단 페이지 감지 ({e.kind}): {str(e)}"
+    else:
+        status_code, detail = 500, f"스크래핑 실패: {str(e)}"
+    error = {"success": False, "status_code": status_code, "error": detail, "error_type": type(e).__name__}
+    if isinstance(e, CircuitOpenError):
+        error["retry_after"] = int(e.retry_after) + 1
+    return error
+
+
+async def _stream_batch(items: List[str], site: str, translate: str, concurrency: int, max_age: Optional[int],
+                        use_cache: bool, extract_fallback: bool) -> AsyncIterator[str]:
+    """일괄 스크래핑 결과를 완료되는 순서대로 NDJSON 한 줄씩 생성
+    
+    워커 concurrency개가 항목을 하나씩 꺼내 처리하고, 결과는 크기 제한이 있는 큐를 거쳐 바로
+    내보낸다. 클라이언트가 늦게 읽으면 워커도 멈추므로 배치 크기와 관계없이 메모리에 쌓이는
+    결과는 최대 concurrency개다. 연결이 끊기면 남은 워커를 취소한다.
+    """
+    started = time.monotonic()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+    pending = enumerate(items)
+    
+    async def scrape_item(index: int, item: str) -> Dict:
+        item_started = time.monotonic()
+        try:
+            item_site, params = _batch_params(item.strip(), site)
+            line = await _scrape_response(item_site, params, translate, max_age, use_cache, extract_fallback)
+        except Exception as e:
+            line = _batch_error(e)
+        return {"type": "item", "index": index, "input": item,
+                "elapsed_ms": round((time.monotonic() - item_started) * 1000, 1), **line}
+    
+    async def worker() -> None:
+        # 모든 워커가 같은 이터레이터에서 다음 항목을 가져감
+        for index, item in pending:
+            await queue.put(await scrape_item(index, item))
+    
+    workers = [asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(items)))]
+    succeeded = 0
+    try:
+        for _ in range(len(items)):
+            line = await queue.get()
+            succeeded += 1 if line["success"] else 0
+            yield json.dumps(line, ensure_ascii=False, default=str) + '\n'
+        
+        yield json.dumps({
+            "type": "summary",
+            "total": len(items),
+            "succeeded": succeeded,
+            "failed": len(items) - succeeded,
+            "concurrency": concurrency,
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 1)
+        }, ensure_ascii=False) + '\n'
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+@router.post("/scrape/batch")
+async def scrape_batch(
+    items: List[str] = Body(..., embed=True, description="상품 URL 또는 상품 ID(Amazon ASIN, JINS productId) 목록"),
+    site: str = Query("amazon", description="상품 ID 항목의 사이트 (URL 항목은 URL로 자동 감지)"),
+    translate: str = Query("true", description="한국어 번역: true(번역 후 응답) / false / deferred(원문으로 즉시 응답, 번역은 translation_job으로 조회)"),
+    concurrency: Optional[int] = Query(None, ge=1, description="동시 수집 개수 (기본 BATCH_SCRAPE_CONCURRENCY)"),
+    max_age: Optional[int] = Query(None, ge=0, description="이 시간(초) 이내에 캐시된 원본 HTML이 있으면 재사용"),
+    use_cache: bool = Query(True, description="파싱 결과 캐시 사용 여부 (가격/재고는 짧은 주기로 갱신)"),
+    extract_fallback: bool = Query(True, description="설명/특징을 찾지 못하면 trafilatura 본문 추출 시도 (시간 예산 적용)")
+):
+    """여러 상품 일괄 스크래핑 (NDJSON 스트리밍)
+    
+    항목별 결과(단일 스크래핑 응답 + type/index/input/elapsed_ms, 실패 시 status_code/error)를
+    완료되는 순서대로 한 줄씩 보내고, 마지막 줄에 type=summary 집계를 보낸다.
+    """
+    _translate_mode(translate)
+    items = [item for item in items if item and item.strip()]
+    if not items:
+        raise HTTPException(status_code=400, detail="items가 비어 있습니다")
+    if len(items) > settings.scrape.batch_max_items:
+        raise HTTPException(status_code=400, detail=f"items는 최대 {settings.scrape.batch_max_items}개까지 가능합니다")
+    
+    if concurrency is None:
+        concurrency = settings.scrape.batch_concurrency
+    concurrency = max(1, min(concurrency, settings.scrape.batch_max_concurrency))
+    
+    return StreamingResponse(
+        _stream_batch(items, site, translate, concurrency, max_age, use_cache, extract_fallback),
+        media_type="application/x-ndjson"
+    )
+
+
 @router.get("/scrape/amazon/bestsellers")
 async def scrape_amazon_bestsellers(
     url: str = Query(..., description="Amazon 베스트셀러 페이지 URL"),
     limit: int = Query(20, description="수집할 최대 상품 개수"),
-    translate: bool = Query(True, description="한국어 번역 여부")
+    translate: bool = Query(True, description="한국어 번역 여부"),
+    concurrency: Optional[int] = Query(None, ge=1, description="동시 수집 개수 (1이면 순차 수집)"),
+    max_age: Optional[int] = Query(None, ge=0, description="이 시간(초) 이내에 캐시된 원본 HTML이 있으면 재사용")
 ):
     """Amazon 베스트셀러 페이지에서 상품 일괄 수집"""
     try:
@@ -108,8 +303,10 @@ async def scrape_amazon_bestsellers(
         # Amazon 스크래퍼 생성
         scraper = ScraperFactory.create_scraper('amazon')
         
-        # 베스트셀러 상품들 일괄 수집
-        products = await scraper.scrape_bestsellers_products(url, limit=limit, translate=translate)
+        # 베스트셀러 상품들 일괄 수집 (랭킹 순, 실패 항목은 리포트에만 포함)
+        results = await scraper.collect_bestsellers(url, limit=limit, translate=translate,
+                                                   concurrency=concurrency, max_age=max_age)
+        products = [result.product for result in results if result.success]
         
         if not products:
             raise HTTPException(status_code=404, detail="베스트셀러 페이지에서 상품을 찾을 수 없습니다")
@@ -120,14 +317,20 @@ async def scrape_amazon_bestsellers(
             "url": url,
             "translated": translate,
             "total_products": len(products),
+            "failed_count": len(results) - len(products),
             "limit": limit,
-            "data": [product.to_laravel_format() for product in products]
+            "data": [product.to_laravel_format() for product in products],
+            "items": [result.to_report() for result in results]
         }
         
     except UnsupportedSiteError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except ProductNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except CircuitOpenError as e:
+        raise _circuit_open_exception(e)
+    except BlockedPageError as e:
+        raise HTTPException(status_code=503, detail=f"차단 페이지 감지 ({e.kind}): {str(e)}")
     except ScrapingError as e:
         raise HTTPException(status_code=500, detail=f"베스트셀러 스크래핑 실패: {str(e)}")
 
@@ -135,7 +338,8 @@ async def scrape_amazon_bestsellers(
 @router.get("/scrape/amazon/bestsellers/asins")
 async def get_amazon_bestsellers_asins(
     url: str = Query(..., description="Amazon 베스트셀러 페이지 URL"),
-    limit: int = Query(20, description="추출할 최대 ASIN 개수")
+    limit: int = Query(20, description="추출할 최대 ASIN 개수"),
+    max_age: Optional[int] = Query(None, ge=0, description="이 시간(초) 이내에 캐시된 원본 HTML이 있으면 재사용")
 ):
     """Amazon 베스트셀러 페이지에서 ASIN 목록만 추출"""
     try:
@@ -154,7 +358,7 @@ async def get_amazon_bestsellers_asins(
         scraper = ScraperFactory.create_scraper('amazon')
         
         # ASIN 목록 추출
-        asins = await scraper.scrape_bestsellers_asins(url, limit=limit)
+        asins = await scraper.scrape_bestsellers_asins(url, limit=limit, max_age=max_age)
         
         if not asins:
             raise HTTPException(status_code=404, detail="베스트셀러 페이지에서 ASIN을 찾을 수 없습니다")
@@ -172,6 +376,10 @@ async def get_amazon_bestsellers_asins(
         raise HTTPException(status_code=400, detail=str(e))
     except ProductNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except CircuitOpenError as e:
+        raise _circuit_open_exception(e)
+    except BlockedPageError as e:
+        raise HTTPException(status_code=503, detail=f"차단 페이지 감지 ({e.kind}): {str(e)}")
     except ScrapingError as e:
         raise HTTPException(status_code=500, detail=f"베스트셀러 ASIN 추출 실패: {str(e)}")
 
@@ -186,4 +394,57 @@ async def get_supported_sites():
             "rakuten": "https://item.rakuten.co.jp/{shopId}/{itemCode}",
             "jins": "https://www.jins.com/jp/item/{productId}.html"
         }
-    }
\ No newline at end of file
+    }
+
+
+@router.get("/stats")
+async def get_runtime_stats():
+    """런타임 통계 조회 (커넥션 풀, 요청 속도 제한, 회로 차단기 등)"""
+    return {
+        "http_pool": http_client_manager.get_stats(),
+        "rate_limiter": rate_limiter.get_stats(),
+        "resilience": resilient_fetcher.get_stats(),
+        "page_classifier": page_classifier.get_stats(),
+        "page_regions": page_regions.get_stats(),
+        "extraction_sources": page_context.get_stats(),
+        "single_flight": scrape_single_flight.get_stats(),
+        "html_cache": await html_cache.get_stats(),
+        "product_cache": product_cache.get_stats(),
+        "parse_executor": parse_executor.get_stats(),
+        "content_fallback": content_fallback.get_stats(),
+        "translation": translation_service.get_stats(),
+        "translation_memory": await translation_memory.get_stats(),
+        "translation_jobs": translation_jobs.get_stats()
+    }
+
+
+@router.get("/translations/{job_id}")
+async def get_translation_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="번역이 끝나지 않았으면 이 시간(초)까지 기다림 (최대 TRANSLATION_JOB_MAX_WAIT)")
+):
+    """지연 번역(translate=deferred) 작업 상태/결과 조회"""
+    job = await translation_jobs.get(job_id, wait)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"번역 작업을 찾을 수 없습니다: {job_id}")
+    return job.to_response()
+
+
+@router.get("/translation-memory/export")
+async def export_translation_memory(
+    source_lang: Optional[str] = Query(None, description="원문 언어 필터 (예: ja)"),
+    target_lang: Optional[str] = Query(None, description="번역 언어 필터 (예: ko)")
+):
+    """번역 메모리 일괄 내보내기"""
+    entries = await translation_memory.export_entries(source_lang, target_lang)
+    return {"count": len(entries), "entries": entries}
+
+
+@router.post("/translation-memory/import")
+async def import_translation_memory(
+    entries: List[Dict[str, Any]] = Body(..., embed=True, description="export 형식의 번역 항목 목록"),
+    overwrite: bool = Query(True, description="이미 있는 원문의 번역을 덮어쓸지 여부")
+):
+    """번역 메모리 일괄 가져오기 (다른 인스턴스에서 내보낸 번역 재사용)"""
+    imported = await translation_memory.import_entries(entries, overwrite=overwrite)
+    return {"received": len(entries), "imported": imported}
@@ -0,0 +1,184 @@
+import os
+from dataclasses import dataclass, field
+
+from dotenv import load_dotenv
+
+# .env 파일이 있으면 환경변수로 로드
+load_dotenv()
+
+
+def _env_str(name: str, default: str) -> str:
+    """문자열 환경변수 조회"""
+    value = os.getenv(name)
+    return value if value not in (None, '') else default
+
+
+def _env_int(name: str, default: int) -> int:
+    """정수 환경변수 조회 (잘못된 값이면 기본값)"""
+    try:
+        return int(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    """실수 환경변수 조회 (잘못된 값이면 기본값)"""
+    try:
+        return float(os.getenv(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """불리언 환경변수 조회"""
+    value = os.getenv(name)
+    if value is None or value == '':
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+# 캐시 등 로컬 데이터 저장 기본 디렉터리
+DATA_DIR = _env_str('SCRAPER_DATA_DIR', 'data')
+
+
+@dataclass(frozen=True)
+class HttpClientSettings:
+    """공유 HTTP 클라이언트 풀 설정"""
+    connect_timeout: float = field(default_factory=lambda: _env_float('HTTP_CONNECT_TIMEOUT', 10.0))
+    read_timeout: float = field(default_factory=lambda: _env_float('HTTP_READ_TIMEOUT', 30.0))
+    write_timeout: float = field(default_factory=lambda: _env_float('HTTP_WRITE_TIMEOUT', 10.0))
+    pool_timeout: float = field(default_factory=lambda: _env_float('HTTP_POOL_TIMEOUT', 10.0))
+    max_connections_per_host: int = field(default_factory=lambda: _env_int('HTTP_MAX_CONNECTIONS_PER_HOST', 20))
+    max_keepalive_per_host: int = field(default_factory=lambda: _env_int('HTTP_MAX_KEEPALIVE_PER_HOST', 10))
+    keepalive_expiry: float = field(default_factory=lambda: _env_float('HTTP_KEEPALIVE_EXPIRY', 30.0))
+    http2: bool = field(default_factory=lambda: _env_bool('HTTP_HTTP2', True))
+
+
+@dataclass(frozen=True)
+class ScrapeSettings:
+    """스크래핑 동작 설정"""
+    bestseller_concurrency: int = field(default_factory=lambda: _env_int('BESTSELLER_CONCURRENCY', 5))
+    bestseller_max_concurrency: int = field(default_factory=lambda: _env_int('BESTSELLER_MAX_CONCURRENCY', 20))
+    batch_concurrency: int = field(default_factory=lambda: _env_int('BATCH_SCRAPE_CONCURRENCY', 5))  # POST /scrape/batch 기본 동시 수집 수
+    batch_max_concurrency: int = field(default_factory=lambda: _env_int('BATCH_SCRAPE_MAX_CONCURRENCY', 20))
+    batch_max_items: int = field(default_factory=lambda: _env_int('BATCH_SCRAPE_MAX_ITEMS', 1000))  # 요청 1건당 최대 상품 수
+
+
+@dataclass(frozen=True)
+class RateLimitSettings:
+    """호스트별 적응형(AIMD) 요청 속도 제한 설정"""
+    enabled: bool = field(default_factory=lambda: _env_bool('RATE_LIMIT_ENABLED', True))
+    default_rps: float = field(default_factory=lambda: _env_float('RATE_LIMIT_DEFAULT_RPS', 5.0))
+    default_max_rps: float = field(default_factory=lambda: _env_float('RATE_LIMIT_DEFAULT_MAX_RPS', 20.0))
+    amazon_rps: float = field(default_factory=lambda: _env_float('RATE_LIMIT_AMAZON_RPS', 1.0))
+    amazon_max_rps: float = field(default_factory=lambda: _env_float('RATE_LIMIT_AMAZON_MAX_RPS', 3.0))
+    min_rps: float = field(default_factory=lambda: _env_float('RATE_LIMIT_MIN_RPS', 0.1))
+    burst: float = field(default_factory=lambda: _env_float('RATE_LIMIT_BURST', 2.0))
+    increase_step: float = field(default_factory=lambda: _env_float('RATE_LIMIT_INCREASE_STEP', 0.05))
+    decrease_factor: float = field(default_factory=lambda: _env_float('RATE_LIMIT_DECREASE_FACTOR', 0.5))
+
+
+@dataclass(frozen=True)
+class ResilienceSettings:
+    """재시도/데드라인/회로 차단기 설정"""
+    max_attempts: int = field(default_factory=lambda: _env_int('FETCH_MAX_ATTEMPTS', 3))
+    base_delay: float = field(default_factory=lambda: _env_float('FETCH_RETRY_BASE_DELAY', 0.5))
+    max_delay: float = field(default_factory=lambda: _env_float('FETCH_RETRY_MAX_DELAY', 8.0))
+    deadline: float = field(default_factory=lambda: _env_float('FETCH_DEADLINE', 45.0))
+    breaker_failure_threshold: int = field(default_factory=lambda: _env_int('BREAKER_FAILURE_THRESHOLD', 5))
+    breaker_cooldown: float = field(default_factory=lambda: _env_float('BREAKER_COOLDOWN', 60.0))
+
+
+@dataclass(frozen=True)
+class HtmlCacheSettings:
+    """원본 HTML 디스크 캐시 설정"""
+    enabled: bool = field(default_factory=lambda: _env_bool('HTML_CACHE_ENABLED', True))
+    directory: str = field(default_factory=lambda: _env_str('HTML_CACHE_DIR', os.path.join(DATA_DIR, 'html_cache')))
+    max_bytes: int = field(default_factory=lambda: _env_int('HTML_CACHE_MAX_BYTES', 512 * 1024 * 1024))
+    product_ttl: float = field(default_factory=lambda: _env_float('HTML_CACHE_PRODUCT_TTL', 6 * 3600))
+    bestsellers_ttl: float = field(default_factory=lambda: _env_float('HTML_CACHE_BESTSELLERS_TTL', 1800))
+
+
+@dataclass(frozen=True)
+class ProductCacheSettings:
+    """파싱 완료된 상품 결과 캐시 설정 (stale-while-revalidate)"""
+    enabled: bool = field(default_factory=lambda: _env_bool('PRODUCT_CACHE_ENABLED', True))
+    max_entries: int = field(default_factory=lambda: _env_int('PRODUCT_CACHE_MAX_ENTRIES', 2000))
+    volatile_fresh: float = field(default_factory=lambda: _env_float('PRODUCT_CACHE_VOLATILE_FRESH', 300))
+    volatile_stale: float = field(default_factory=lambda: _env_float('PRODUCT_CACHE_VOLATILE_STALE', 1800))
+    static_ttl: float = field(default_factory=lambda: _env_float('PRODUCT_CACHE_STATIC_TTL', 24 * 3600))
+
+
+@dataclass(frozen=True)
+class ParseSettings:
+    """HTML 파싱 실행기 설정 (이벤트 루프 밖에서 파싱)"""
+    mode: str = field(default_factory=lambda: _env_str('PARSE_EXECUTOR', 'process'))  # process | thread | inline
+    max_workers: int = field(default_factory=lambda: _env_int('PARSE_MAX_WORKERS', min(4, os.cpu_count() or 1)))
+    task_timeout: float = field(default_factory=lambda: _env_float('PARSE_TASK_TIMEOUT', 30.0))
+    backend: str = field(default_factory=lambda: _env_str('PARSER_BACKEND', 'lxml'))  # lxml | bs4
+    partial: bool = field(default_factory=lambda: _env_bool('PARSE_PARTIAL', False))  # 필요한 영역만 파싱
+    description_max_chars: int = field(default_factory=lambda: _env_int('DESCRIPTION_HTML_MAX_CHARS', 200_000))  # 설명 HTML 출력 예산 (0 = 제한 없음)
+
+
+@dataclass(frozen=True)
+class ExtractFallbackSettings:
+    """trafilatura 본문 추출 fallback 설정 (설명/특징을 모두 찾지 못한 페이지용)"""
+    enabled: bool = field(default_factory=lambda: _env_bool('EXTRACT_FALLBACK_ENABLED', True))
+    mode: str = field(default_factory=lambda: _env_str('EXTRACT_FALLBACK_EXECUTOR', 'process'))  # process | thread | inline
+    max_workers: int = field(default_factory=lambda: _env_int('EXTRACT_FALLBACK_MAX_WORKERS', 1))
+    task_timeout: float = field(default_factory=lambda: _env_float('EXTRACT_FALLBACK_TIME_BUDGET', 5.0))  # 시간 예산 (초, 워커 기동 포함)
+
+
+@dataclass(frozen=True)
+class TranslationSettings:
+    """번역 API 호출 설정 (제공자/묶음 요청/헤징)"""
+    batch_max_bytes: int = field(default_factory=lambda: _env_int('TRANSLATION_BATCH_MAX_BYTES', 12_000))  # 요청 1건 원문 크기 (URL 인코딩 기준)
+    batch_max_segments: int = field(default_factory=lambda: _env_int('TRANSLATION_BATCH_MAX_SEGMENTS', 50))
+    concurrency: int = field(default_factory=lambda: _env_int('TRANSLATION_CONCURRENCY', 4))  # 동시 API 요청 수
+    segmentation: bool = field(default_factory=lambda: _env_bool('TRANSLATION_SEGMENTATION', True))  # 구간 분리 + 보호 구간 제외
+    provider: str = field(default_factory=lambda: _env_str('TRANSLATION_PROVIDER', 'google'))  # google | stub
+    timeout: float = field(default_factory=lambda: _env_float('TRANSLATION_TIMEOUT', 15.0))  # 요청 1건 타임아웃 (초)
+    hedge_enabled: bool = field(default_factory=lambda: _env_bool('TRANSLATION_HEDGE_ENABLED', False))  # 느린 요청에 2차 요청 병행
+    hedge_initial_delay: float = field(default_factory=lambda: _env_float('TRANSLATION_HEDGE_INITIAL_DELAY', 2.0))  # 지연 표본이 적을 때 (초)
+    hedge_min_delay: float = field(default_factory=lambda: _env_float('TRANSLATION_HEDGE_MIN_DELAY', 0.2))  # p95 기반 지연 하한 (초)
+    hedge_min_samples: int = field(default_factory=lambda: _env_int('TRANSLATION_HEDGE_MIN_SAMPLES', 20))
+    latency_samples: int = field(default_factory=lambda: _env_int('TRANSLATION_LATENCY_SAMPLES', 200))  # p50/p95 계산용 최근 표본 수
+    stub_latency_ms: float = field(default_factory=lambda: _env_float('TRANSLATION_STUB_LATENCY_MS', 0.0))  # stub 응답 지연 (벤치마크용)
+
+
+@dataclass(frozen=True)
+class TranslationMemorySettings:
+    """번역 메모리 설정 (메모리 LRU + SQLite 영구 저장)"""
+    enabled: bool = field(default_factory=lambda: _env_bool('TRANSLATION_MEMORY_ENABLED', True))
+    path: str = field(default_factory=lambda: _env_str('TRANSLATION_MEMORY_PATH', os.path.join(DATA_DIR, 'translation_memory.sqlite3')))
+    memory_entries: int = field(default_factory=lambda: _env_int('TRANSLATION_MEMORY_LRU_ENTRIES', 5000))
+    max_entries: int = field(default_factory=lambda: _env_int('TRANSLATION_MEMORY_MAX_ENTRIES', 500_000))
+
+
+@dataclass(frozen=True)
+class TranslationJobSettings:
+    """지연 번역(translate=deferred) 작업 설정"""
+    workers: int = field(default_factory=lambda: _env_int('TRANSLATION_JOB_WORKERS', 2))
+    max_jobs: int = field(default_factory=lambda: _env_int('TRANSLATION_JOB_MAX_JOBS', 5000))  # 보관하는 작업 수
+    result_ttl: float = field(default_factory=lambda: _env_float('TRANSLATION_JOB_RESULT_TTL', 3600))  # 완료 결과 보관 (초)
+    max_wait: float = field(default_factory=lambda: _env_float('TRANSLATION_JOB_MAX_WAIT', 30.0))  # 결과 조회 최대 대기 (초)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """스크래퍼 서비스 전체 설정 (환경변수 기반)"""
+    http: HttpClientSettings = field(default_factory=HttpClientSettings)
+    scrape: ScrapeSettings = field(default_factory=ScrapeSettings)
+    rate_limit: RateLimitSettings = field(default_factory=RateLimitSettings)
+    resilience: ResilienceSettings = field(default_factory=ResilienceSettings)
+    html_cache: HtmlCacheSettings = field(default_factory=HtmlCacheSettings)
+    product_cache: ProductCacheSettings = field(default_factory=ProductCacheSettings)
+    parse: ParseSettings = field(default_factory=ParseSettings)
+    extract_fallback: ExtractFallbackSettings = field(default_factory=ExtractFallbackSettings)
+    translation: TranslationSettings = field(default_factory=TranslationSettings)
+    translation_memory: TranslationMemorySettings = field(default_factory=TranslationMemorySettings)
+    translation_jobs: TranslationJobSettings = field(default_factory=TranslationJobSettings)
+
+
+# 전역 설정 인스턴스
+settings = Settings()
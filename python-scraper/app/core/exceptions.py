@@ -25,4 +25,21 @@ class ProxyError(ScrapingError):
 
 class ParsingError(ScrapingError):
     """HTML 파싱 예외"""
-    pass
\ No newline at end of file
+    pass
+
+
+class BlockedPageError(ScrapingError):
+    """상품 페이지 대신 로봇 확인/오류/빈 페이지를 받은 예외"""
+    
+    def __init__(self, message: str, kind: str = None):
+        super().__init__(message)
+        self.kind = kind
+
+
+class CircuitOpenError(ScrapingError):
+    """호스트 회로 차단기가 열려 요청을 보내지 않은 예외"""
+    
+    def __init__(self, message: str, host: str = None, retry_after: float = 0.0):
+        super().__init__(message)
+        self.host = host
+        self.retry_after = retry_after
\ No newline at end of file
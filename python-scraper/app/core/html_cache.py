@@ -0,0 +1,257 @@
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.config.settings import settings, HtmlCacheSettings
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 gzip 사용
+    zstandard = None
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """캐시에서 읽은 원본 페이지"""
+    url: str
+    content: bytes
+    encoding: Optional[str]
+    page_type: str
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+
+class RawHtmlCache:
+    """압축된 콘텐츠 주소 기반(content-addressed) 원본 HTML 디스크 캐시
+
+    - 본문은 SHA-256 다이제스트 이름의 blob 파일로 압축 저장 (동일 본문은 한 번만 저장)
+    - URL → blob 매핑과 LRU 정보는 SQLite 인덱스에 저장
+    - 페이지 종류별 TTL, 전체 용량 상한 초과 시 오래 사용하지 않은 항목부터 제거
+    - 모든 디스크 I/O는 asyncio.to_thread로 이벤트 루프 밖에서 수행
+    """
+
+    def __init__(self, config: Optional[HtmlCacheSettings] = None):
+        self.config = config or settings.html_cache
+        self.codec = 'zst' if zstandard else 'gz'
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._pending_writes: set = set()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def _ttl(self, page_type: str) -> float:
+        if page_type == 'bestsellers':
+            return self.config.bestsellers_ttl
+        return self.config.product_ttl
+
+    # ----- 동기 구현 (워커 스레드에서 실행) -----
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.join(self.config.directory, 'blobs'), exist_ok=True)
+            conn = sqlite3.connect(os.path.join(self.config.directory, 'index.sqlite3'), check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                ' url_key TEXT PRIMARY KEY, url TEXT NOT NULL, digest TEXT NOT NULL,'
+                ' page_type TEXT NOT NULL, encoding TEXT, size INTEGER NOT NULL,'
+                ' stored_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries (digest)')
+            self._conn = conn
+        return self._conn
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.config.directory, 'blobs', digest[:2], f"{digest}.{self.codec}")
+
+    def _compress(self, content: bytes) -> bytes:
+        if zstandard:
+            return zstandard.ZstdCompressor(level=10).compress(content)
+        return gzip.compress(content, compresslevel=6)
+
+    def _decompress(self, path: str, data: bytes) -> bytes:
+        if path.endswith('.zst'):
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    @staticmethod
+    def _url_key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _get_sync(self, url: str) -> Optional[CachedPage]:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                'SELECT digest, page_type, encoding, stored_at FROM entries WHERE url_key = ?',
+                (self._url_key(url),)
+            ).fetchone()
+            if not row:
+                return None
+            digest, page_type, encoding, stored_at = row
+            path = self._blob_path(digest)
+            try:
+                with open(path, 'rb') as f:
+                    content = self._decompress(path, f.read())
+            except (OSError, ValueError) as e:
+                logger.warning(f"HTML 캐시 blob 읽기 실패, 항목 제거: {url} ({e})")
+                conn.execute('DELETE FROM entries WHERE url_key = ?', (self._url_key(url),))
+                conn.commit()
+                return None
+            conn.execute('UPDATE entries SET accessed_at = ? WHERE url_key = ?', (time.time(), self._url_key(url)))
+            conn.commit()
+            return CachedPage(url=url, content=content, encoding=encoding, page_type=page_type, stored_at=stored_at)
+
+    def _put_sync(self, url: str, content: bytes, encoding: Optional[str], page_type: str) -> None:
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        compressed = None if os.path.exists(path) else self._compress(content)
+
+        with self._lock:
+            conn = self._connect()
+            if compressed is not None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(compressed)
+                os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+
+            previous = conn.execute('SELECT digest FROM entries WHERE url_key = ?', (self._url_key(url),)).fetchone()
+            now = time.time()
+            conn.execute(
+                'INSERT OR REPLACE INTO entries (url_key, url, digest, page_type, encoding, size, stored_at, accessed_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (self._url_key(url), url, digest, page_type, encoding, size, now, now)
+            )
+            if previous and previous[0] != digest:
+                self._drop_blob_if_unreferenced(conn, previous[0])
+            self._evict(conn)
+            conn.commit()
+
+    def _drop_blob_if_unreferenced(self, conn: sqlite3.Connection, digest: str) -> None:
+        if not conn.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone():
+            try:
+                os.remove(self._blob_path(digest))
+            except OSError:
+                pass
+
+    def _total_bytes(self, conn: sqlite3.Connection) -> int:
+        row = conn.execute('SELECT COALESCE(SUM(size), 0) FROM (SELECT digest, MAX(size) AS size FROM entries GROUP BY digest)').fetchone()
+        return row[0]
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """용량 상한 초과 시 가장 오래 사용하지 않은 항목부터 제거 (상한의 90%까지)"""
+        total = self._total_bytes(conn)
+        if total <= self.config.max_bytes:
+            return
+
+        target = self.config.max_bytes * 0.9
+        rows = conn.execute('SELECT url_key, digest FROM entries ORDER BY accessed_at ASC').fetchall()
+        for url_key, digest in rows:
+            if total <= target:
+                break
+            conn.execute('DELETE FROM entries WHERE url_key = ?', (url_key,))
+            if not conn.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone():
+                path = self._blob_path(digest)
+                try:
+                    total -= os.path.getsize(path)
+                    os.remove(path)
+                except OSError:
+                    pass
+            self.evictions += 1
+
+    def _summary_sync(self) -> Dict:
+        with self._lock:
+            conn = self._connect()
+            entries = conn.execute('SELECT COUNT(*), COUNT(DISTINCT digest) FROM entries').fetchone()
+            return {'entries': entries[0], 'blobs': entries[1], 'bytes': self._total_bytes(conn)}
+
+    def _close_sync(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ----- 비동기 API -----
+
+    async def get(self, url: str, max_age: float, page_type: str = 'product') -> Optional[CachedPage]:
+        """max_age(초)와 페이지 종류별 TTL 안에서 신선한 캐시 페이지 조회"""
+        if not self.config.enabled:
+            return None
+        try:
+            page = await asyncio.to_thread(self._get_sync, url)
+        except Exception as e:
+            logger.warning(f"HTML 캐시 조회 실패: {e}")
+            return None
+
+        if page is None:
+            self.misses += 1
+            return None
+        if page.age > min(max_age, self._ttl(page_type)):
+            self.stale += 1
+            return None
+
+        self.hits += 1
+        return page
+
+    async def put(self, url: str, content: bytes, encoding: Optional[str], page_type: str = 'product') -> None:
+        """원본 페이지 저장"""
+        if not self.config.enabled or not content:
+            return
+        try:
+            await asyncio.to_thread(self._put_sync, url, content, encoding, page_type)
+            self.writes += 1
+        except Exception as e:
+            logger.warning(f"HTML 캐시 저장 실패: {e}")
+
+    def put_background(self, url: str, content: bytes, encoding: Optional[str], page_type: str = 'product') -> None:
+        """응답 지연 없이 백그라운드로 저장"""
+        if not self.config.enabled or not content:
+            return
+        task = asyncio.ensure_future(self.put(url, content, encoding, page_type))
+        self._pending_writes.add(task)
+        task.add_done_callback(self._pending_writes.discard)
+
+    async def close(self) -> None:
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        await asyncio.to_thread(self._close_sync)
+
+    async def get_stats(self) -> Dict:
+        stats = {
+            'enabled': self.config.enabled,
+            'codec': self.codec,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'max_bytes': self.config.max_bytes
+        }
+        if self.config.enabled:
+            try:
+                stats.update(await asyncio.to_thread(self._summary_sync))
+            except Exception as e:
+                stats['error'] = str(e)
+        return stats
+
+
+# 전역 원본 HTML 캐시 인스턴스
+html_cache = RawHtmlCache()
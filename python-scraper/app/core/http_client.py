@@ -0,0 +1,198 @@
+import importlib.util
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from app.config.settings import settings, HttpClientSettings
+from app.core.rate_limiter import rate_limiter
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# h2 패키지가 설치된 경우에만 HTTP/2 사용 가능
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+
+@dataclass
+class HostPoolStats:
+    """호스트별 요청/커넥션 통계"""
+    requests_total: int = 0
+    in_flight: int = 0
+    max_in_flight: int = 0
+    errors_total: int = 0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+    total_elapsed: float = 0.0
+
+
+class HttpClientManager:
+    """애플리케이션 전역 HTTP 클라이언트 풀
+
+    호스트마다 하나의 httpx.AsyncClient를 만들어 재사용한다.
+    호스트별 커넥션 제한, keep-alive, HTTP/2(가능한 경우)를 적용하여
+    요청마다 TCP+TLS 핸드셰이크가 반복되지 않도록 한다.
+    """
+
+    def __init__(self, config: Optional[HttpClientSettings] = None):
+        self.config = config or settings.http
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, HostPoolStats] = {}
+        self._started = False
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self.config.http2 and HTTP2_AVAILABLE
+
+    async def start(self) -> None:
+        """FastAPI lifespan 시작 시 호출"""
+        self._started = True
+        logger.info(
+            f"🔌 HTTP 클라이언트 풀 시작 - 호스트당 최대 {self.config.max_connections_per_host}개 커넥션, "
+            f"HTTP/2: {'사용' if self.http2_enabled else '미사용'}"
+        )
+
+    async def close(self) -> None:
+        """FastAPI lifespan 종료 시 모든 클라이언트 정리"""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"HTTP 클라이언트 종료 중 오류: {e}")
+        self._started = False
+        logger.info("🔌 HTTP 클라이언트 풀 종료")
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """호스트 전용 클라이언트 생성"""
+        timeout = httpx.Timeout(
+            connect=self.config.connect_timeout,
+            read=self.config.read_timeout,
+            write=self.config.write_timeout,
+            pool=self.config.pool_timeout
+        )
+        limits = httpx.Limits(
+            max_connections=self.config.max_connections_per_host,
+            max_keepalive_connections=self.config.max_keepalive_per_host,
+            keepalive_expiry=self.config.keepalive_expiry
+        )
+        return httpx.AsyncClient(
+            timeout=timeout,
+            limits=limits,
+            http2=self.http2_enabled
+        )
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """URL에서 호스트명 추출"""
+        return urlsplit(url).hostname or url
+
+    def get_client(self, url: str) -> httpx.AsyncClient:
+        """URL의 호스트에 해당하는 공유 클라이언트 반환 (없으면 생성)"""
+        host = self.host_of(url)
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = self._build_client()
+            self._clients[host] = client
+            self._stats.setdefault(host, HostPoolStats())
+        return client
+
+    async def request(self, method: str, url: str,
+                      validate: Optional[Callable[[httpx.Response], Optional[str]]] = None,
+                      **kwargs) -> httpx.Response:
+        """공유 클라이언트로 요청 전송 및 통계 기록
+
+        모든 요청은 호스트별 속도 제한기를 거치며, 응답 상태로 속도가 조절된다.
+        validate가 차단 사유를 돌려주면(200 캡차 페이지 등) 정상 응답으로 세지 않고 감속한다.
+        """
+        host = self.host_of(url)
+        client = self.get_client(url)
+        stats = self._stats[host]
+
+        await rate_limiter.acquire(host)
+
+        stats.requests_total += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        started = time.monotonic()
+        try:
+            response = await client.request(method, url, **kwargs)
+            stats.status_counts[response.status_code] = stats.status_counts.get(response.status_code, 0) + 1
+            block_reason = validate(response) if validate else None
+            if block_reason:
+                rate_limiter.record_throttle(host, block_reason)
+            else:
+                rate_limiter.record_response(host, response.status_code)
+            return response
+        except httpx.TimeoutException:
+            stats.errors_total += 1
+            rate_limiter.record_throttle(host, 'timeout')
+            raise
+        except Exception:
+            stats.errors_total += 1
+            raise
+        finally:
+            stats.in_flight -= 1
+            stats.total_elapsed += time.monotonic() - started
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request('GET', url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request('POST', url, **kwargs)
+
+    @staticmethod
+    def _pool_snapshot(client: httpx.AsyncClient) -> Dict:
+        """httpcore 커넥션 풀 상태 조회 (내부 API라 실패 시 빈 값)"""
+        try:
+            pool = client._transport._pool
+            connections = list(pool.connections)
+            return {
+                'connections': len(connections),
+                'idle': sum(1 for c in connections if c.is_idle()),
+                'http2': sum(1 for c in connections if getattr(c, '_connection', None) is not None
+                             and c._connection.__class__.__name__.startswith('AsyncHTTP2')),
+                'waiting_requests': len(getattr(pool, '_requests', []))
+            }
+        except Exception:
+            return {}
+
+    def get_stats(self) -> Dict:
+        """풀 사이징을 위한 호스트별 통계"""
+        hosts = {}
+        for host, stats in self._stats.items():
+            completed = stats.requests_total - stats.in_flight
+            client = self._clients.get(host)
+            hosts[host] = {
+                'requests_total': stats.requests_total,
+                'in_flight': stats.in_flight,
+                'max_in_flight': stats.max_in_flight,
+                'errors_total': stats.errors_total,
+                'status_counts': dict(stats.status_counts),
+                'avg_elapsed_ms': round(stats.total_elapsed / completed * 1000, 1) if completed else None,
+                'pool': self._pool_snapshot(client) if client and not client.is_closed else {}
+            }
+
+        return {
+            'started': self._started,
+            'http2_enabled': self.http2_enabled,
+            'limits': {
+                'max_connections_per_host': self.config.max_connections_per_host,
+                'max_keepalive_per_host': self.config.max_keepalive_per_host,
+                'keepalive_expiry': self.config.keepalive_expiry
+            },
+            'timeouts': {
+                'connect': self.config.connect_timeout,
+                'read': self.config.read_timeout,
+                'write': self.config.write_timeout,
+                'pool': self.config.pool_timeout
+            },
+            'hosts': hosts
+        }
+
+
+# 전역 HTTP 클라이언트 매니저 인스턴스
+http_client_manager = HttpClientManager()
@@ -0,0 +1,144 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Union
+
+from app.config.settings import settings, ParseSettings, ExtractFallbackSettings
+from app.core.exceptions import ParsingError
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class ParseExecutor:
+    """CPU 작업(HTML 파싱)을 이벤트 루프 밖에서 실행하는 실행기
+
+    - process: spawn 방식 프로세스 풀 (GIL 영향 없음, 인자/결과는 pickle 가능해야 함)
+    - thread: 스레드 풀 (이벤트 루프 정지는 막지만 CPU 병렬성은 제한적)
+    - inline: 이벤트 루프에서 바로 실행 (디버깅용)
+
+    작업 함수는 모듈 최상위 함수여야 하며, 원본 HTML 같은 단순 값을 받아
+    직렬화 가능한 dict를 돌려주는 형태로 사용한다.
+
+    kill_on_timeout이 켜져 있으면 process 모드에서 시간 초과 시 워커 프로세스를 종료하고
+    풀을 새로 만든다 (같은 풀에서 실행 중이던 다른 작업도 함께 실패한다).
+    """
+
+    def __init__(self, config: Optional[Union[ParseSettings, ExtractFallbackSettings]] = None,
+                 name: str = 'parse', kill_on_timeout: bool = False):
+        self.config = config or settings.parse
+        self.name = name
+        self.kill_on_timeout = kill_on_timeout
+        self._executor: Optional[Executor] = None
+        self.in_flight = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.failed = 0
+        self.timeouts = 0
+        self.pool_restarts = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    @property
+    def mode(self) -> str:
+        return self.config.mode if self.config.mode in ('process', 'thread', 'inline') else 'process'
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == 'process':
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.max_workers,
+                    thread_name_prefix=self.name
+                )
+            logger.info(f"🧩 {self.name} 실행기 시작: {self.mode} (workers={self.config.max_workers})")
+        return self._executor
+
+    def start(self) -> None:
+        """풀 미리 생성 (inline 모드는 아무 것도 하지 않음)"""
+        if self.mode != 'inline':
+            self._get_executor()
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """작업 실행 후 결과 반환 (task_timeout 초과 시 ParsingError)
+
+        프로세스/스레드에서 이미 시작된 작업은 강제로 중단할 수 없으므로,
+        타임아웃 시 호출자만 먼저 실패 처리되고 워커는 작업을 마친 뒤 반환된다.
+        """
+        if self.mode == 'inline':
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        self.in_flight += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.in_flight - self.config.max_workers)
+        started = time.monotonic()
+        try:
+            future = loop.run_in_executor(self._get_executor(), func, *args)
+            result = await asyncio.wait_for(future, timeout=self.config.task_timeout)
+            self.completed += 1
+            return result
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            if self.kill_on_timeout and self.mode == 'process':
+                self._terminate_pool()
+            raise ParsingError(f"{self.name} 시간 초과 ({self.config.task_timeout:g}초)")
+        except BrokenProcessPool as e:
+            # 워커 프로세스가 비정상 종료된 경우 다음 요청을 위해 풀 재생성
+            self.failed += 1
+            self.pool_restarts += 1
+            self._executor = None
+            logger.error(f"❌ {self.name} 프로세스 풀 손상, 재생성 예정: {e}")
+            raise ParsingError(f"{self.name} 워커 오류: {e}")
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            elapsed_ms = (time.monotonic() - started) * 1000
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def _terminate_pool(self) -> None:
+        """멈춘 워커 프로세스를 강제 종료하고 다음 요청에서 풀 재생성"""
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        processes = getattr(executor, '_processes', None) or {}
+        for process in list(processes.values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+        self.pool_restarts += 1
+        logger.warning(f"⚠️ {self.name} 시간 초과로 워커 프로세스 종료, 풀 재생성 예정")
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict:
+        finished = self.completed + self.failed + self.timeouts
+        return {
+            'mode': self.mode,
+            'max_workers': self.config.max_workers,
+            'in_flight': self.in_flight,
+            'queue_depth': max(0, self.in_flight - self.config.max_workers),
+            'peak_queue_depth': self.peak_queue_depth,
+            'completed': self.completed,
+            'failed': self.failed,
+            'timeouts': self.timeouts,
+            'pool_restarts': self.pool_restarts,
+            'avg_ms': round(self.total_ms / finished, 1) if finished else 0.0,
+            'max_ms': round(self.max_ms, 1),
+            'task_timeout': self.config.task_timeout
+        }
+
+
+# 전역 파싱 실행기 인스턴스
+parse_executor = ParseExecutor()
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Hashable, Optional
+
+from app.config.settings import settings, ProductCacheSettings
+from app.models.product import Product
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 자주 바뀌는 필드 (가격/재고) - 나머지(상품명, 설명, 갤러리, 번역 등)는 정적 필드로 취급
+VOLATILE_FIELDS = ('price', 'original_price', 'in_stock', 'shipping_info')
+
+
+@dataclass
+class ProductCacheEntry:
+    product: Product
+    static_at: float      # 정적 필드(번역 포함) 갱신 시각
+    volatile_at: float    # 가격/재고 갱신 시각
+
+
+class ProductResultCache:
+    """파싱(및 번역) 완료된 Product 결과 캐시
+
+    - 가격/재고는 volatile_fresh 안이면 그대로 사용
+    - volatile_stale 안이면 즉시 응답하고 백그라운드에서 갱신 (stale-while-revalidate)
+    - 그 이후는 동기 갱신
+    - 갱신 시 정적 필드가 static_ttl 안이면 번역 없이 가격/재고만 다시 수집하여 병합
+    - 호출자가 결과를 수정해도 캐시 항목이 바뀌지 않도록 항상 복사본을 반환
+    """
+
+    def __init__(self, config: Optional[ProductCacheSettings] = None):
+        self.config = config or settings.product_cache
+        self._entries: "OrderedDict[Hashable, ProductCacheEntry]" = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self.hits_fresh = 0
+        self.hits_stale = 0
+        self.misses = 0
+        self.refresh_volatile = 0
+        self.refresh_full = 0
+        self.refresh_errors = 0
+
+    def _store(self, key: Hashable, entry: ProductCacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _refresh(self, key: Hashable, entry: Optional[ProductCacheEntry],
+                       load_full: Callable[[], Awaitable[Product]],
+                       load_volatile: Callable[[], Awaitable[Product]]) -> Product:
+        """캐시 갱신 (정적 필드가 아직 유효하면 가격/재고만 갱신)"""
+        now = time.time()
+        if entry is not None and now - entry.static_at <= self.config.static_ttl:
+            fresh = await load_volatile()
+            product = entry.product.model_copy(
+                update={field: getattr(fresh, field) for field in VOLATILE_FIELDS}
+            )
+            self._store(key, ProductCacheEntry(product=product, static_at=entry.static_at, volatile_at=time.time()))
+            self.refresh_volatile += 1
+            return product.model_copy(deep=True)
+
+        product = await load_full()
+        self._store(key, ProductCacheEntry(product=product, static_at=time.time(), volatile_at=time.time()))
+        self.refresh_full += 1
+        return product.model_copy(deep=True)
+
+    def _refresh_in_background(self, key: Hashable, entry: ProductCacheEntry,
+                               load_full: Callable[[], Awaitable[Product]],
+                               load_volatile: Callable[[], Awaitable[Product]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def run():
+            try:
+                await self._refresh(key, entry, load_full, load_volatile)
+            except Exception as e:
+                self.refresh_errors += 1
+                logger.warning(f"상품 캐시 백그라운드 갱신 실패 {key}: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.ensure_future(run())
+
+    async def get_or_load(self, key: Hashable,
+                          load_full: Callable[[], Awaitable[Product]],
+                          load_volatile: Callable[[], Awaitable[Product]]) -> Product:
+        """캐시 조회 후 필요하면 갱신
+
+        Args:
+            key: 캐시 키 (사이트, 상품 ID, 번역 여부)
+            load_full: 전체 스크래핑(번역 포함) 함수
+            load_volatile: 가격/재고 갱신용 스크래핑(번역 없음) 함수
+        """
+        if not self.config.enabled:
+            return await load_full()
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return await self._refresh(key, None, load_full, load_volatile)
+
+        self._entries.move_to_end(key)
+        now = time.time()
+        volatile_age = now - entry.volatile_at
+        static_fresh = now - entry.static_at <= self.config.static_ttl
+
+        if volatile_age <= self.config.volatile_fresh and static_fresh:
+            self.hits_fresh += 1
+            return entry.product.model_copy(deep=True)
+
+        if volatile_age <= self.config.volatile_stale:
+            self.hits_stale += 1
+            self._refresh_in_background(key, entry, load_full, load_volatile)
+            return entry.product.model_copy(deep=True)
+
+        self.misses += 1
+        return await self._refresh(key, entry, load_full, load_volatile)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        """진행 중인 백그라운드 갱신 취소"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        if self._refreshing:
+            await asyncio.gather(*self._refreshing.values(), return_exceptions=True)
+
+    def get_stats(self) -> Dict:
+        return {
+            'enabled': self.config.enabled,
+            'entries': len(self._entries),
+            'max_entries': self.config.max_entries,
+            'hits_fresh': self.hits_fresh,
+            'hits_stale': self.hits_stale,
+            'misses': self.misses,
+            'refresh_volatile': self.refresh_volatile,
+            'refresh_full': self.refresh_full,
+            'refresh_errors': self.refresh_errors,
+            'refreshing': len(self._refreshing),
+            'windows': {
+                'volatile_fresh': self.config.volatile_fresh,
+                'volatile_stale': self.config.volatile_stale,
+                'static_ttl': self.config.static_ttl
+            }
+        }
+
+
+# 전역 상품 결과 캐시 인스턴스
+product_cache = ProductResultCache()
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.config.settings import settings, RateLimitSettings
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 호스트가 과부하/차단 신호를 보낼 때의 상태 코드
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+@dataclass
+class HostBucket:
+    """호스트별 토큰 버킷 상태 및 지표"""
+    rate: float                  # 현재 허용 속도 (요청/초)
+    min_rate: float
+    max_rate: float
+    capacity: float              # 최대 버스트 토큰 수
+    tokens: float
+    updated_at: float
+
+    acquired_total: int = 0
+    waited_total: int = 0
+    wait_time_total: float = 0.0
+    max_wait: float = 0.0
+    throttled_total: int = 0
+    last_throttle_reason: Optional[str] = None
+    last_throttle_at: Optional[float] = None
+
+    def refill(self, now: float) -> None:
+        """경과 시간만큼 토큰 보충"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+
+class AdaptiveRateLimiter:
+    """프로세스 전역 호스트별 토큰 버킷 속도 제한기
+
+    AIMD 방식으로 속도를 조절한다.
+    - 정상 응답: 속도를 increase_step 만큼 가산 증가
+    - 503/429/캡차: 속도를 decrease_factor 배로 곱셈 감소
+    """
+
+    def __init__(self, config: Optional[RateLimitSettings] = None):
+        self.config = config or settings.rate_limit
+        self._buckets: Dict[str, HostBucket] = {}
+
+    def _initial_rates(self, host: str) -> tuple[float, float]:
+        """호스트별 초기 속도 / 최대 속도"""
+        if 'amazon.' in host:
+            return self.config.amazon_rps, self.config.amazon_max_rps
+        return self.config.default_rps, self.config.default_max_rps
+
+    def _bucket(self, host: str) -> HostBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate, max_rate = self._initial_rates(host)
+            capacity = max(1.0, self.config.burst)
+            bucket = HostBucket(
+                rate=rate,
+                min_rate=min(self.config.min_rps, rate),
+                max_rate=max(max_rate, rate),
+                capacity=capacity,
+                tokens=capacity,
+                updated_at=time.monotonic()
+            )
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, host: str) -> float:
+        """요청 1건의 토큰 확보 (부족하면 대기), 대기한 시간(초) 반환
+
+        토큰을 먼저 예약(음수 허용)한 뒤 부족분만큼 대기하므로
+        동시에 들어온 요청들도 도착 순서대로 간격이 벌어진다.
+        """
+        if not self.config.enabled:
+            return 0.0
+
+        bucket = self._bucket(host)
+        bucket.refill(time.monotonic())
+        bucket.tokens -= 1
+        bucket.acquired_total += 1
+
+        if bucket.tokens >= 0:
+            return 0.0
+
+        wait = -bucket.tokens / bucket.rate
+        bucket.waited_total += 1
+        bucket.wait_time_total += wait
+        bucket.max_wait = max(bucket.max_wait, wait)
+        await asyncio.sleep(wait)
+        return wait
+
+    def record_success(self, host: str) -> None:
+        """정상 응답 - 가산 증가"""
+        bucket = self._bucket(host)
+        bucket.rate = min(bucket.max_rate, bucket.rate + self.config.increase_step)
+
+    def record_throttle(self, host: str, reason: str) -> None:
+        """차단/과부하 신호 - 곱셈 감소 및 남은 버스트 토큰 제거"""
+        bucket = self._bucket(host)
+        previous = bucket.rate
+        bucket.rate = max(bucket.min_rate, bucket.rate * self.config.decrease_factor)
+        bucket.tokens = min(bucket.tokens, 0.0)
+        bucket.throttled_total += 1
+        bucket.last_throttle_reason = reason
+        bucket.last_throttle_at = time.time()
+        logger.warning(f"🐢 {host} 요청 속도 감소 ({reason}): {previous:.2f} → {bucket.rate:.2f} req/s")
+
+    def record_response(self, host: str, status_code: int) -> None:
+        """응답 상태 코드로 속도 조절"""
+        if status_code in THROTTLE_STATUS_CODES:
+            self.record_throttle(host, f"HTTP {status_code}")
+        elif status_code < 500:
+            self.record_success(host)
+
+    def get_stats(self) -> Dict:
+        """호스트별 현재 속도 및 대기 시간 지표"""
+        now = time.monotonic()
+        hosts = {}
+        for host, bucket in self._buckets.items():
+            bucket.refill(now)
+            hosts[host] = {
+                'rate_rps': round(bucket.rate, 3),
+                'min_rps': bucket.min_rate,
+                'max_rps': bucket.max_rate,
+                'tokens': round(bucket.tokens, 2),
+                'acquired_total': bucket.acquired_total,
+                'waited_total': bucket.waited_total,
+                'avg_wait_ms': round(bucket.wait_time_total / bucket.waited_total * 1000, 1) if bucket.waited_total else 0.0,
+                'max_wait_ms': round(bucket.max_wait * 1000, 1),
+                'throttled_total': bucket.throttled_total,
+                'last_throttle_reason': bucket.last_throttle_reason,
+                'last_throttle_at': bucket.last_throttle_at
+            }
+
+        return {
+            'enabled': self.config.enabled,
+            'hosts': hosts
+        }
+
+
+# 전역 속도 제한기 인스턴스
+rate_limiter = AdaptiveRateLimiter()
@@ -0,0 +1,241 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+
+import httpx
+
+from app.config.settings import settings, ResilienceSettings
+from app.core.exceptions import CircuitOpenError, ScrapingError, ScrapingTimeoutError
+from app.core.http_client import http_client_manager
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 재시도 대상 상태 코드 (일시적 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 응답 내용 검사 (차단/오류 페이지면 실패 사유, 정상이면 None)
+ResponseValidator = Callable[[httpx.Response], Optional[str]]
+
+
+def _memoized(validate: ResponseValidator) -> ResponseValidator:
+    """같은 응답은 한 번만 검사 (속도 제한기와 회로 차단기가 같은 판정을 사용)"""
+    last: list = [None, None]
+
+    def check(response: httpx.Response) -> Optional[str]:
+        if last[0] is not response:
+            last[:] = [response, validate(response)]
+        return last[1]
+
+    return check
+
+
+@dataclass
+class CircuitBreaker:
+    """호스트별 회로 차단기
+
+    연속 실패가 임계치를 넘으면 cooldown 동안 요청을 즉시 거부(open)하고,
+    cooldown 이후 한 번의 시험 요청(half_open)으로 회복 여부를 확인한다.
+    """
+    failure_threshold: int
+    cooldown: float
+    state: str = 'closed'
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    probe_in_flight: bool = False
+    opened_total: int = 0
+    rejected_total: int = 0
+    last_failure_reason: Optional[str] = None
+
+    def remaining_cooldown(self, now: float) -> float:
+        return max(0.0, self.opened_at + self.cooldown - now)
+
+    def allow_request(self, now: float) -> bool:
+        """요청 허용 여부 (half_open에서는 시험 요청 1건만 허용)"""
+        if self.state == 'open':
+            if self.remaining_cooldown(now) > 0:
+                return False
+            self.state = 'half_open'
+            self.probe_in_flight = False
+
+        if self.state == 'half_open':
+            if self.probe_in_flight:
+                return False
+            self.probe_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        self.state = 'closed'
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+
+    def record_failure(self, reason: str, now: float) -> bool:
+        """실패 기록, 이번 실패로 회로가 열렸으면 True"""
+        self.consecutive_failures += 1
+        self.last_failure_reason = reason
+        self.probe_in_flight = False
+
+        if self.state == 'half_open' or (self.state == 'closed' and self.consecutive_failures >= self.failure_threshold):
+            self.state = 'open'
+            self.opened_at = now
+            self.opened_total += 1
+            return True
+        return False
+
+
+class ResilientFetcher:
+    """재시도(지수 백오프 + 지터), 전체 데드라인, 회로 차단기를 적용한 GET 요청"""
+
+    def __init__(self, config: Optional[ResilienceSettings] = None):
+        self.config = config or settings.resilience
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self.retries_total = 0
+        self.deadline_exceeded_total = 0
+
+    def _breaker(self, host: str) -> CircuitBreaker:
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=self.config.breaker_failure_threshold,
+                cooldown=self.config.breaker_cooldown
+            )
+            self._breakers[host] = breaker
+        return breaker
+
+    def record_failure(self, url: str, reason: str) -> None:
+        """응답은 정상이지만 내용상 차단된 경우(캡차 등) 호출부에서 실패 기록"""
+        host = http_client_manager.host_of(url)
+        if self._breaker(host).record_failure(reason, time.monotonic()):
+            logger.error(f"⛔ {host} 회로 차단기 열림 ({reason}) - {self.config.breaker_cooldown:.0f}초간 요청 차단")
+
+    def _backoff_delay(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """지터가 적용된 지수 백오프 (Retry-After 헤더가 있으면 우선)"""
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.config.max_delay)
+        ceiling = min(self.config.max_delay, self.config.base_delay * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    async def get(self, url: str, deadline: Optional[float] = None,
+                  validate: Optional[ResponseValidator] = None, **kwargs) -> httpx.Response:
+        """회복력 있는 GET 요청
+
+        validate가 주어지면 재시도 대상이 아닌 응답의 내용을 검사한다. 상태 코드는 정상이어도
+        차단 페이지(캡차 등)로 판정되면 성공을 기록하지 않고 실패로 기록한 뒤 일시적 오류처럼
+        백오프 후 재시도한다. 같은 판정이 속도 제한기에도 감속 신호로 전달된다.
+
+        Returns:
+            httpx.Response: 마지막 응답 (재시도 후에도 일시적 오류/차단 페이지면 그 응답 그대로)
+
+        Raises:
+            CircuitOpenError: 회로 차단기가 열려 요청하지 않음
+            ScrapingTimeoutError: 전체 데드라인 초과 또는 타임아웃 재시도 소진
+            ScrapingError: 네트워크 오류 재시도 소진
+        """
+        host = http_client_manager.host_of(url)
+        breaker = self._breaker(host)
+        if validate is not None:
+            validate = _memoized(validate)
+            kwargs['validate'] = validate
+        deadline_at = time.monotonic() + (deadline or self.config.deadline)
+
+        last_error: Optional[Exception] = None
+        last_response: Optional[httpx.Response] = None
+        for attempt in range(self.config.max_attempts):
+            now = time.monotonic()
+            if not breaker.allow_request(now):
+                breaker.rejected_total += 1
+                retry_after = breaker.remaining_cooldown(now)
+                raise CircuitOpenError(
+                    f"{host} 회로 차단기 열림 - {retry_after:.0f}초 후 재시도 가능 "
+                    f"(최근 실패: {breaker.last_failure_reason})",
+                    host=host,
+                    retry_after=retry_after
+                )
+
+            remaining = deadline_at - now
+            if remaining <= 0:
+                break
+
+            response = None
+            block_reason = None
+            try:
+                response = await asyncio.wait_for(http_client_manager.get(url, **kwargs), timeout=remaining)
+            except asyncio.TimeoutError:
+                breaker.record_failure('deadline', time.monotonic())
+                last_error = None
+                last_response = None
+                break
+            except asyncio.CancelledError:
+                breaker.probe_in_flight = False
+                raise
+            except httpx.TimeoutException as e:
+                last_error = e
+                breaker.record_failure('timeout', time.monotonic())
+            except httpx.TransportError as e:
+                last_error = e
+                breaker.record_failure(type(e).__name__, time.monotonic())
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    block_reason = validate(response) if validate else None
+                    if block_reason is None:
+                        breaker.record_success()
+                        return response
+                last_error = None
+                last_response = response
+                reason = block_reason or f"HTTP {response.status_code}"
+                if breaker.record_failure(reason, time.monotonic()):
+                    logger.error(f"⛔ {host} 회로 차단기 열림 ({reason})")
+
+            if attempt + 1 >= self.config.max_attempts:
+                break
+
+            delay = self._backoff_delay(attempt, response)
+            if time.monotonic() + delay >= deadline_at:
+                break
+            self.retries_total += 1
+            if block_reason is not None:
+                reason = block_reason
+            else:
+                reason = f"HTTP {response.status_code}" if response is not None else type(last_error).__name__
+            logger.warning(f"🔁 {host} 요청 재시도 {attempt + 1}/{self.config.max_attempts - 1} ({reason}) - {delay:.2f}초 후")
+            await asyncio.sleep(delay)
+
+        if last_error is not None:
+            if isinstance(last_error, httpx.TimeoutException):
+                raise ScrapingTimeoutError(f"요청 타임아웃 (재시도 소진): {url}")
+            raise ScrapingError(f"요청 실패 ({type(last_error).__name__}): {url}")
+
+        # 일시적 오류/차단 페이지 응답으로 끝난 경우 호출부가 처리하도록 그대로 반환
+        if last_response is not None:
+            return last_response
+
+        self.deadline_exceeded_total += 1
+        raise ScrapingTimeoutError(f"요청 데드라인 초과: {url}")
+
+    def get_stats(self) -> Dict:
+        now = time.monotonic()
+        return {
+            'retries_total': self.retries_total,
+            'deadline_exceeded_total': self.deadline_exceeded_total,
+            'breakers': {
+                host: {
+                    'state': breaker.state,
+                    'consecutive_failures': breaker.consecutive_failures,
+                    'opened_total': breaker.opened_total,
+                    'rejected_total': breaker.rejected_total,
+                    'retry_after': round(breaker.remaining_cooldown(now), 1) if breaker.state == 'open' else 0,
+                    'last_failure_reason': breaker.last_failure_reason
+                }
+                for host, breaker in self._breakers.items()
+            }
+        }
+
+
+# 전역 회복력 요청기 인스턴스
+resilient_fetcher = ResilientFetcher()
@@ -0,0 +1,51 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """동일 키의 동시 요청 병합 (single-flight)
+
+    같은 키로 진행 중인 작업이 있으면 새로 실행하지 않고 그 결과를 함께 기다린다.
+    작업은 별도 태스크로 실행되므로 먼저 요청한 클라이언트가 연결을 끊어도
+    나머지 대기자는 결과를 정상적으로 받는다.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.leaders_total = 0
+        self.coalesced_total = 0
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """작업 실행 또는 진행 중인 작업에 합류
+
+        Returns:
+            Tuple[결과, 병합 여부]
+        """
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced_total += 1
+            return await asyncio.shield(task), True
+
+        task = asyncio.ensure_future(func())
+        self._in_flight[key] = task
+        self.leaders_total += 1
+        task.add_done_callback(lambda t: self._finish(key, t))
+        return await asyncio.shield(task), False
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # 모든 대기자가 취소된 경우에도 예외가 '미확인' 경고로 남지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict:
+        return {
+            'in_flight': len(self._in_flight),
+            'leaders_total': self.leaders_total,
+            'coalesced_total': self.coalesced_total
+        }
+
+
+# /scrape 요청 병합용 전역 인스턴스
+scrape_single_flight = SingleFlight()
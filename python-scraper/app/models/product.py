@@ -36,6 +36,8 @@ class Product(BaseModel):
     # 물리적 정보
     weight: Optional[str] = None       # 무게 (kg 단위 문자열)
     dimensions: Optional[str] = None   # 치수 (cm 단위)
+    weight_g: Optional[float] = None   # 무게 (g, 수치)
+    dimensions_cm: Optional[List[float]] = None  # 치수 [a, b, c] (cm, 수치)
     
     # 카테고리 및 분류
     category: Optional[str] = None     # 카테고리
@@ -84,6 +86,9 @@ class Product(BaseModel):
             'original_features': self.original_features,
             'weight': self.weight,
             'dimensions': self.dimensions,
+            'weight_g': self.weight_g,
+            'dimensions_cm': self.dimensions_cm,
+            'specifications': self.specifications,
             'category': self.category,
             'original_category': self.original_category,
             'brand': self.brand,
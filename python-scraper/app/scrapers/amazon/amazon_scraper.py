@@ -1,21 +1,105 @@
 import re
 import asyncio
-import json
-from typing import Dict, List
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 import httpx
-from bs4 import BeautifulSoup
 
 from app.core.base_scraper import BaseScraper
 from app.models.product import Product
-from app.core.exceptions import ProductNotFoundError, ParsingError, ScrapingError, ScrapingTimeoutError
+from app.core.exceptions import ProductNotFoundError, ParsingError, ScrapingError, ScrapingTimeoutError, BlockedPageError
+from app.core.resilience import resilient_fetcher
+from app.core.html_cache import html_cache
+from app.core.product_cache import product_cache
+from app.core.parse_executor import parse_executor
+from app.config.settings import settings
+from app.scrapers.amazon.page_classifier import classify_page, PageKind, BLOCKED_PAGE_KINDS
+from app.scrapers.amazon.page_context import PageContext, record_sources
+from app.scrapers.amazon.page_regions import extract_regions, record_parse_mode
+from app.scrapers.amazon import embedded_data
+from app.scrapers.amazon.product_details import (
+    PhysicalSpec, parse_product_details, physical_from_details, physical_scope_text
+)
 from app.utils.smart_extractor import SmartExtractor
+from app.utils.html_backend import parse_document
+from app.utils.html_sanitizer import SanitizePolicy, ImageSlotRule, sanitize_html
+from app.utils.embedded_json import iter_values_after, loads_tolerant
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.units import parse_weight_g, parse_dimensions_cm, format_weight_kg, format_dimensions_cm
 from app.services.translation_service import translation_service
+from app.services.content_fallback import content_fallback
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class FetchedPage:
+    """요청 또는 캐시에서 얻은 원본 페이지"""
+    url: str
+    content: bytes
+    encoding: Optional[str] = None
+    from_cache: bool = False
+    
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+@dataclass
+class BestsellerItemResult:
+    """베스트셀러 개별 상품 수집 결과"""
+    rank: int
+    asin: str
+    success: bool
+    elapsed_ms: float
+    product: Optional[Product] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    
+    def to_report(self) -> Dict:
+        """API 응답용 수집 리포트 (상품 데이터 제외)"""
+        return {
+            'rank': self.rank,
+            'asin': self.asin,
+            'success': self.success,
+            'elapsed_ms': self.elapsed_ms,
+            'error': self.error,
+            'error_type': self.error_type
+        }
+
+
+# 설명 후보 텍스트에서 CSS/JS 코드를 가려내는 지표
+CODE_INDICATORS = {
+    'code': [
+        '{', '}', 'function', 'var ', 'window.', 'document.',
+        'css', 'javascript', 'px', 'margin', 'padding',
+        'width:', 'height:', 'background', '.aplus', 'rgba', 'font-',
+        'border:', 'display:', 'position:', 'color:', 'ue.count',
+        'logShoppableMetrics', 'innerHTML', 'addEventListener'
+    ],
+}
+code_matcher = KeywordMatcher(CODE_INDICATORS, ignore_case=True)
+
+# A+ 콘텐츠 이미지 주소 표시
+APLUS_MEDIA_MARKER = 'aplus-media-library-service-media'
+
+# 상품 설명 HTML 정리 규칙 (Amazon 내부 class 제거, 절대 URL, 빈 A+ 모듈 자리를 그 자리의 지연 로딩 이미지로 채우기)
+DESCRIPTION_POLICY = SanitizePolicy(
+    drop_class_markers=('a-', 'aplus-', 'cr-', 'reviews-'),
+    base_url='https://www.amazon.co.jp',
+    default_img_alt='상품 이미지',
+    max_chars=settings.parse.description_max_chars,
+    image_slot=ImageSlotRule(
+        module_classes=frozenset(('celwidget', '3p-module-b')),
+        max_text=10,
+        img_attrs=(('alt', '商品の説明'), ('style', 'max-width:100%; height:auto; display:block; margin:10px 0;')),
+        src_marker=APLUS_MEDIA_MARKER
+    )
+)
+
+
 class AmazonScraper(BaseScraper):
     """Amazon.co.jp 스크래퍼"""
     
@@ -31,30 +115,116 @@ class AmazonScraper(BaseScraper):
             'Upgrade-Insecure-Requests': '1',
         }
     
-    async def scrape_product(self, asin: str, translate: bool = True, **kwargs) -> Product:
-        """ASIN으로 Amazon 상품 정보 스크래핑"""
+    async def scrape_product(self, asin: str, translate: bool = True, max_age: Optional[float] = None,
+                             use_cache: bool = True, extract_fallback: bool = True, **kwargs) -> Product:
+        """ASIN으로 Amazon 상품 정보 스크래핑
+        
+        Args:
+            asin: 상품 ASIN
+            translate: 번역 여부
+            max_age: 지정하면 이 시간(초) 이내에 캐시된 원본 HTML을 재사용
+            use_cache: 파싱 결과 캐시 사용 여부 (가격/재고는 짧은 주기로 갱신)
+            extract_fallback: 설명/특징을 찾지 못하면 trafilatura 본문 추출 시도
+        """
+        if not use_cache:
+            return await self._scrape_product_uncached(asin, translate, max_age, extract_fallback)
+        
+        return await product_cache.get_or_load(
+            ('amazon', asin, translate, extract_fallback),
+            load_full=lambda: self._scrape_product_uncached(asin, translate, max_age, extract_fallback),
+            # 가격/재고 갱신은 원본 HTML 캐시를 쓰지 않고 새로 받음 (본문 추출도 필요 없음)
+            load_volatile=lambda: self._scrape_product_uncached(asin, False, None, extract_fallback=False)
+        )
+    
+    async def _scrape_product_uncached(self, asin: str, translate: bool, max_age: Optional[float] = None,
+                                       extract_fallback: bool = True) -> Product:
+        """캐시 없이 페이지를 받아 파싱(및 번역)"""
         url = self.build_product_url(asin=asin)
         
-        async with httpx.AsyncClient(headers=self.headers, timeout=30.0) as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'lxml')
-                product = self._parse_product_page(soup, asin, url)
-                
-                # 번역 옵션이 활성화된 경우 번역 수행
-                if translate:
-                    product = await self._translate_product(product)
-                
-                return product
-                
-            except httpx.TimeoutException:
-                raise ScrapingTimeoutError(f"Amazon 스크래핑 타임아웃: {asin}")
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise ProductNotFoundError(f"Amazon 상품을 찾을 수 없습니다: {asin}")
-                raise ScrapingError(f"Amazon 스크래핑 실패: {e}")
+        try:
+            page = await self._fetch_page(url, max_age=max_age)
+            
+            # CPU 비용이 큰 파싱은 파싱 실행기(프로세스/스레드 풀)에서 수행
+            data, parse_info = await parse_executor.run(parse_product_html, page.text, asin, url)
+            record_parse_mode(parse_info['mode'])
+            record_sources(parse_info['sources'])
+            product = Product.model_validate(data)
+            
+            # 설명/특징을 모두 찾지 못한 경우 원본 바이트로 trafilatura fallback (전용 워커 풀, 시간 예산 적용)
+            if not product.description and not product.features:
+                product = await self._apply_content_fallback(product, page, extract_fallback)
+            
+            # 번역 옵션이 활성화된 경우 번역 수행
+            if translate:
+                product = await self._translate_product(product)
+            
+            return product
+            
+        except httpx.TimeoutException:
+            raise ScrapingTimeoutError(f"Amazon 스크래핑 타임아웃: {asin}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise ProductNotFoundError(f"Amazon 상품을 찾을 수 없습니다: {asin}")
+            raise ScrapingError(f"Amazon 스크래핑 실패: {e}")
+    
+    async def _apply_content_fallback(self, product: Product, page: FetchedPage, enabled: bool) -> Product:
+        """trafilatura 추출 결과로 설명/특징 채우기"""
+        smart_data = await content_fallback.extract(page.content, page.url, enabled=enabled)
+        if not smart_data.get('description') and not smart_data.get('features'):
+            return product
+        
+        record_sources({'description': 'trafilatura'})
+        site_specific_data = dict(product.site_specific_data)
+        site_specific_data['field_sources'] = {**site_specific_data.get('field_sources', {}), 'description': 'trafilatura'}
+        return product.model_copy(update={
+            'description': smart_data.get('description'),
+            'features': smart_data.get('features') or [],
+            'site_specific_data': site_specific_data
+        })
+    
+    async def _fetch_page(self, url: str, page_type: str = 'product', max_age: Optional[float] = None) -> FetchedPage:
+        """원본 HTML 조회 (max_age가 있으면 디스크 캐시 우선, 새로 받은 페이지는 캐시에 저장)"""
+        if max_age is not None:
+            cached = await html_cache.get(url, max_age, page_type)
+            if cached is not None:
+                logger.info(f"💾 HTML 캐시 사용 ({cached.age:.0f}초 전): {url}")
+                return FetchedPage(url=url, content=cached.content, encoding=cached.encoding, from_cache=True)
+        
+        response = await self._fetch(url, page_type)
+        html_cache.put_background(url, response.content, response.encoding, page_type)
+        return FetchedPage(url=url, content=response.content, encoding=response.encoding)
+    
+    async def _fetch(self, url: str, page_type: str = 'product') -> httpx.Response:
+        """공유 클라이언트로 Amazon 페이지 요청 (재시도/데드라인/회로 차단기 적용)
+        
+        파싱 전에 원본 바이트로 페이지 종류를 판별한다. 판별은 요청기 안에서 응답마다 실행되어
+        로봇 확인/오류/빈 페이지는 성공 대신 속도 제한기 감속 + 회로 차단기 실패로 기록되고
+        백오프 후 재시도된다.
+        재시도 후에도 차단 페이지면 BlockedPageError로 중단한다.
+        """
+        last: List = [None, None]      # 마지막으로 판별한 (응답, 페이지 종류)
+        
+        def classify(response: httpx.Response) -> PageKind:
+            # 같은 응답은 한 번만 판별
+            if last[0] is not response:
+                last[:] = [response, classify_page(response.content, page_type)]
+            return last[1]
+        
+        def validate(response: httpx.Response) -> Optional[str]:
+            if not response.is_success:
+                return None
+            kind = classify(response)
+            return kind.value if kind in BLOCKED_PAGE_KINDS else None
+        
+        response = await resilient_fetcher.get(url, validate=validate, headers=self.headers)
+        response.raise_for_status()
+        
+        kind = classify(response)
+        if kind in BLOCKED_PAGE_KINDS:
+            logger.warning(f"🚫 차단/오류 페이지 감지 ({kind.value}): {url}")
+            raise BlockedPageError(f"Amazon이 정상 페이지 대신 {kind.value} 페이지를 반환했습니다: {url}", kind=kind.value)
+        
+        return response
     
     async def scrape_variants(self, asin: str, **kwargs) -> List[Product]:
         """Amazon 변형 상품 스크래핑"""
@@ -80,98 +250,70 @@ class AmazonScraper(BaseScraper):
         """ASIN으로 Amazon URL 생성"""
         return f"https://www.amazon.co.jp/dp/{asin}"
     
-    def _parse_product_page(self, soup: BeautifulSoup, asin: str, url: str) -> Product:
-        """Amazon 상품 페이지 파싱"""
+    def _parse_product_page(self, root, asin: str, url: str, html: Optional[str] = None,
+                            sources: Optional[Dict[str, str]] = None) -> Product:
+        """Amazon 상품 페이지 파싱
+        
+        Args:
+            root: parse_document()로 만든 문서 노드 (lxml 또는 BeautifulSoup 백엔드)
+            asin: 상품 ASIN
+            url: 상품 URL
+            html: 원본 HTML (있으면 트리 직렬화 대신 사용)
+            sources: 필드별 추출 경로를 기록할 dict (지표용, 생략 가능)
+        """
         try:
+            # 텍스트/스크립트/이미지 등 파생 데이터는 컨텍스트에서 한 번만 계산
+            ctx = PageContext(root, url, html, sources)
+            
             # 1순위: JSON-LD 구조화 데이터에서 추출
-            structured_data = self._extract_json_ld_data(soup)
+            structured_data = self._extract_json_ld_data(ctx)
             
             # 상품명 추출
-            name = self._extract_title(soup, structured_data)
+            name = self._extract_title(ctx, structured_data)
             
             # 가격 추출  
-            price = self._extract_price(soup, structured_data)
+            price = self._extract_price(ctx, structured_data)
             
             # 이미지 URL 추출
-            image_url = self._extract_image_url(soup, structured_data)
+            image_url = self._extract_image_url(ctx, structured_data)
             
             # Amazon 일본 섹션별 정확한 추출 (HTML 태그 포함)
-            description = self._extract_description_html_jp(soup)
-            features = self._extract_features_jp(soup)
+            description = self._extract_description_html_jp(ctx)
+            features = self._extract_features_jp(ctx)
             
             # 설명 영역 이미지 추출
-            description_images = self._extract_description_images(soup)
-            
-            # description의 빈 div들을 실제 A+ Content 이미지로 채우기
-            if description and 'aplus-3p-module-b' in description:
-                # A+ Content 이미지들 수집 (aplus-media-library-service-media 포함)
-                aplus_images = []
-                all_img_elements = soup.find_all('img')
-                for img in all_img_elements:
-                    src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
-                    if src and 'aplus-media-library-service-media' in src:
-                        if src.startswith('//'):
-                            src = 'https:' + src
-                        elif src.startswith('/'):
-                            src = 'https://www.amazon.co.jp' + src
-                        if src not in aplus_images:
-                            aplus_images.append(src)
-                
-                # 빈 div들을 이미지로 교체
-                if aplus_images:
-                    from bs4 import BeautifulSoup as BS
-                    description_soup = BS(description, 'html.parser')
-                    
-                    # 빈 div들 찾기 (텍스트가 거의 없는 div)
-                    empty_divs = []
-                    for div in description_soup.find_all('div', class_='celwidget 3p-module-b'):
-                        inner_div = div.find('div')
-                        if inner_div and len(inner_div.get_text(strip=True)) < 10:  # 텍스트가 거의 없는 경우
-                            empty_divs.append(inner_div)
-                    
-                    # 빈 div들에 이미지 삽입
-                    for i, empty_div in enumerate(empty_divs):
-                        if i < len(aplus_images):
-                            empty_div.clear()
-                            img_tag = description_soup.new_tag('img', src=aplus_images[i])
-                            img_tag['alt'] = '商品の説明'
-                            img_tag['style'] = 'max-width:100%; height:auto; display:block; margin:10px 0;'
-                            empty_div.append(img_tag)
-                    
-                    description = str(description_soup)
+            description_images = self._extract_description_images(ctx)
             
             # 이미지 갤러리 추출 (썸네일 + 큰 이미지)
-            thumbnail_images, large_images = self._extract_image_gallery(soup)
+            thumbnail_images, large_images = self._extract_image_gallery(ctx)
             
-            # 둘 다 실패하면 trafilatura fallback
-            if not description and not features:
-                html_content = str(soup)
-                smart_data = SmartExtractor.extract_with_trafilatura(html_content, url)
-                description = description or smart_data.get('description')
-                features = features or smart_data.get('features', [])
+            # 둘 다 실패한 경우의 trafilatura fallback은 파싱 후 메인 프로세스에서 별도 실행 (_apply_content_fallback)
             
-            # 스마트 추출로 무게/치수
-            page_text = soup.get_text()
-            smart_physical = SmartExtractor.extract_smart_weight_dimensions(page_text)
+            # 登録情報 표 (사양 정보 + 무게/치수)
+            specifications = parse_product_details(ctx)
+            physical = self._extract_physical(ctx, specifications)
             
             # 카테고리 추출
-            category = self._extract_category(soup)
+            category = self._extract_category(ctx)
             
             # 브랜드 추출
-            brand = self._extract_brand(soup, structured_data)
+            brand = self._extract_brand(ctx, structured_data)
             
             # 재고 상태 확인
-            in_stock = self._check_stock_status(soup)
+            in_stock = self._check_stock_status(ctx)
             
-            # 무게/치수 (스마트 추출 우선)
-            weight = smart_physical.get('weight')
-            dimensions = smart_physical.get('dimensions')
+            # 무게/치수 (기존 문자열 필드는 수치에서 생성, kg / cm)
+            weight = format_weight_kg(physical.weight_g) if physical.weight_g is not None else None
+            dimensions = format_dimensions_cm(physical.dimensions_cm) if physical.dimensions_cm else physical.dimensions_text
             
             # 변형 상품 추출
-            variants = self._extract_variants(soup, asin)
+            variants = self._extract_variants(ctx, asin)
             
             # Amazon 고유 정보 추출
-            site_specific_data = self._extract_amazon_specific_data(soup, structured_data)
+            site_specific_data = self._extract_amazon_specific_data(ctx, structured_data)
+            
+            # 필드별 추출 경로 (json_ld / price_block / twister / color_images / html 등)
+            site_specific_data['field_sources'] = dict(ctx.sources)
             
             return Product(
                 site='amazon',
@@ -188,8 +330,11 @@ class AmazonScraper(BaseScraper):
                 category=category,
                 brand=brand,
                 in_stock=in_stock,
+                specifications=specifications,
                 weight=weight,
                 dimensions=dimensions,
+                weight_g=physical.weight_g,
+                dimensions_cm=list(physical.dimensions_cm) if physical.dimensions_cm else None,
                 variants=variants,
                 site_specific_data=site_specific_data
             )
@@ -197,31 +342,19 @@ class AmazonScraper(BaseScraper):
         except Exception as e:
             raise ParsingError(f"Amazon 상품 파싱 실패: {e}")
     
-    def _extract_json_ld_data(self, soup: BeautifulSoup) -> Dict:
+    def _extract_json_ld_data(self, ctx: PageContext) -> Dict:
         """JSON-LD 구조화 데이터 추출"""
-        json_ld_scripts = soup.find_all('script', {'type': 'application/ld+json'})
-        
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, list):
-                    data = data[0]
-                
-                # Product 스키마인지 확인
-                if data.get('@type') == 'Product':
-                    return data
-            except (json.JSONDecodeError, AttributeError):
-                continue
-        
-        return {}
+        return ctx.json_ld
     
-    def _extract_title(self, soup: BeautifulSoup, structured_data: Dict = None) -> str:
+    def _extract_title(self, ctx: PageContext, structured_data: Dict = None) -> str:
         """상품명 추출"""
         # 1순위: JSON-LD
         if structured_data and structured_data.get('name'):
+            ctx.sources['title'] = 'json_ld'
             return structured_data['name']
             
         # 2순위: HTML 셀렉터
+        ctx.sources['title'] = 'html'
         selectors = [
             '#productTitle',
             '.product-title',
@@ -229,24 +362,27 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in selectors:
-            element = soup.select_one(selector)
+            element = ctx.root.select_one(selector)
             if element:
                 return element.get_text(strip=True)
         
         raise ParsingError("상품명을 찾을 수 없습니다")
     
-    def _extract_price(self, soup: BeautifulSoup, structured_data: Dict = None) -> float:
+    def _extract_price(self, ctx: PageContext, structured_data: Dict = None) -> float:
         """가격 추출"""
         # 1순위: JSON-LD 구조화 데이터
-        if structured_data:
-            offers = structured_data.get('offers', {})
-            if isinstance(offers, list):
-                offers = offers[0]
-            price = offers.get('price') or offers.get('lowPrice')
-            if price:
-                return float(price)
-        
-        # 2순위: HTML 셀렉터
+        price = embedded_data.json_ld_price(structured_data or {})
+        if price:
+            ctx.sources['price'] = 'json_ld'
+            return price
+        
+        # 2순위: 구매 옵션 가격 블록 / a-state 데이터
+        price = embedded_data.buybox_price(ctx)
+        if price:
+            ctx.sources['price'] = 'price_block'
+            return price
+        
+        # 3순위: HTML 셀렉터
         price_selectors = [
             '.a-price-whole',
             '.a-offscreen',
@@ -255,18 +391,26 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in price_selectors:
-            element = soup.select_one(selector)
+            element = ctx.root.select_one(selector)
             if element:
                 price_text = element.get_text(strip=True)
                 # 숫자만 추출 (￥, 콤마 제거)
                 price_match = re.search(r'[\d,]+', price_text.replace('￥', '').replace(',', ''))
                 if price_match:
+                    ctx.sources['price'] = 'html'
                     return float(price_match.group())
         
         return None
     
-    def _extract_image_url(self, soup: BeautifulSoup, structured_data: Dict = None) -> str:
+    def _extract_image_url(self, ctx: PageContext, structured_data: Dict = None) -> str:
         """메인 이미지 URL 추출"""
+        # 1순위: JSON-LD 구조화 데이터
+        image_url = embedded_data.json_ld_image(structured_data or {})
+        if image_url:
+            ctx.sources['image'] = 'json_ld'
+            return image_url
+        
+        # 2순위: HTML 셀렉터
         image_selectors = [
             '#landingImage',
             '.a-dynamic-image',
@@ -274,13 +418,14 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in image_selectors:
-            element = soup.select_one(selector)
+            element = ctx.root.select_one(selector)
             if element:
+                ctx.sources['image'] = 'html'
                 return element.get('src') or element.get('data-src')
         
         return None
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, ctx: PageContext) -> str:
         """상품 설명 추출"""
         desc_selectors = [
             '#feature-bullets ul',
@@ -289,13 +434,13 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in desc_selectors:
-            element = soup.select_one(selector)
+            element = ctx.root.select_one(selector)
             if element:
                 return element.get_text(separator=' ', strip=True)
         
         return None
     
-    def _extract_description_jp(self, soup: BeautifulSoup) -> str:
+    def _extract_description_jp(self, ctx: PageContext) -> str:
         """Amazon 일본 - 商品の説明 키워드 기반 추출"""
         
         # 1순위: "商品の説明" 키워드 주변에서 찾기
@@ -303,7 +448,7 @@ class AmazonScraper(BaseScraper):
         
         for keyword in description_keywords:
             # 키워드를 포함한 요소의 부모/형제에서 찾기
-            keyword_elements = soup.find_all(text=re.compile(keyword))
+            keyword_elements = ctx.find_strings(keyword)
             
             for text_node in keyword_elements:
                 parent = text_node.parent
@@ -331,7 +476,7 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in description_selectors:
-            elements = soup.select(selector)
+            elements = ctx.root.select(selector)
             for element in elements:
                 text = element.get_text(strip=True)
                 if text and len(text) > 30 and not self._is_code_or_style(text):
@@ -340,7 +485,7 @@ class AmazonScraper(BaseScraper):
                         return cleaned_text[:200]
         
         # 3순위: 전체 페이지에서 패턴 매칭
-        page_text = soup.get_text()
+        page_text = ctx.text
         
         # "商品の説明" 섹션 다음에 나오는 텍스트들 추출
         sections = page_text.split('商品の説明')
@@ -366,12 +511,12 @@ class AmazonScraper(BaseScraper):
         
         return None
     
-    def _extract_description_html_jp(self, soup: BeautifulSoup) -> str:
+    def _extract_description_html_jp(self, ctx: PageContext) -> str:
         """Amazon 일본 - 商品の説明 HTML 태그 포함 추출"""
         
         # 1순위: "商品の説明" 헤더가 있는 섹션을 정확히 찾기
         # "商品の説明" 헤더를 포함한 전체 섹션 추출
-        product_description_h2 = soup.find('h2', string=re.compile('商品の説明'))
+        product_description_h2 = ctx.root.find('h2', string=re.compile('商品の説明'))
         if product_description_h2:
             # h2 태그의 부모 컨테이너 전체를 가져와서 이미지+텍스트 구조 보존
             parent_container = product_description_h2.find_parent(['div', 'section'])
@@ -392,7 +537,7 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in description_selectors:
-            element = soup.select_one(selector)
+            element = ctx.root.select_one(selector)
             if element:
                 # "この商品について"가 아닌 실제 상품 설명 섹션인지 확인
                 text_content = element.get_text()
@@ -407,7 +552,7 @@ class AmazonScraper(BaseScraper):
         
         for keyword in description_keywords:
             # 키워드를 포함한 요소들 검색
-            keyword_elements = soup.find_all(text=re.compile(keyword, re.IGNORECASE))
+            keyword_elements = ctx.find_strings(keyword, re.IGNORECASE)
             
             for text_node in keyword_elements:
                 parent = text_node.parent
@@ -437,7 +582,7 @@ class AmazonScraper(BaseScraper):
                     parent = parent.parent
         
         # 3순위: A+ Content 또는 상품 설명 이미지가 포함된 섹션 찾기
-        aplus_image_sections = soup.find_all('div', {'data-aplus': True}) or soup.find_all('div', class_=re.compile('aplus'))
+        aplus_image_sections = ctx.root.find_all('div', {'data-aplus': True}) or ctx.root.find_all('div', class_=re.compile('aplus'))
         for section in aplus_image_sections:
             if section.find('img'):  # 이미지가 포함된 섹션만
                 html_content = self._clean_description_html(section)
@@ -445,7 +590,7 @@ class AmazonScraper(BaseScraper):
                     return html_content
         
         # 4순위: 기존 텍스트 추출 방법을 HTML로 대체
-        description_text = self._extract_description_jp(soup)
+        description_text = self._extract_description_jp(ctx)
         if description_text:
             # 텍스트를 간단한 HTML로 변환
             return f"<p>{description_text}</p>"
@@ -453,80 +598,19 @@ class AmazonScraper(BaseScraper):
         return None
     
     def _clean_description_html(self, element) -> str:
-        """HTML 설명 콘텐츠 정리"""
+        """HTML 설명 콘텐츠 정리 (원본 트리를 한 번 순회하며 바로 직렬화)"""
         if not element:
             return None
         
-        # BeautifulSoup 복사본 생성
-        from copy import copy
-        clean_element = copy(element)
-        
-        # 불필요한 태그 제거
-        for tag in clean_element.find_all(['script', 'style', 'noscript']):
-            tag.decompose()
-        
-        # 위험한 속성 제거
-        for tag in clean_element.find_all():
-            # onclick, onload 등 이벤트 핸들러 제거
-            attrs_to_remove = [attr for attr in tag.attrs if attr.startswith('on')]
-            for attr in attrs_to_remove:
-                del tag[attr]
-            
-            # javascript: 프로토콜 제거
-            for attr in ['href', 'src']:
-                if tag.get(attr) and tag[attr].startswith('javascript:'):
-                    del tag[attr]
-        
-        # 이미지 src를 절대 URL로 변환
-        for img in clean_element.find_all('img'):
-            src = img.get('src') or img.get('data-src')
-            if src:
-                if src.startswith('//'):
-                    img['src'] = 'https:' + src
-                elif src.startswith('/'):
-                    img['src'] = 'https://www.amazon.co.jp' + src
-                elif not src.startswith('http'):
-                    img['src'] = 'https://www.amazon.co.jp/' + src
-                else:
-                    img['src'] = src
-                
-                # alt 속성 추가 (없는 경우)
-                if not img.get('alt'):
-                    img['alt'] = '상품 이미지'
-        
-        # 링크 URL을 절대 URL로 변환
-        for link in clean_element.find_all('a'):
-            href = link.get('href')
-            if href:
-                if href.startswith('/'):
-                    link['href'] = 'https://www.amazon.co.jp' + href
-                elif not href.startswith('http'):
-                    link['href'] = 'https://www.amazon.co.jp/' + href
-        
-        # 불필요한 CSS 클래스 제거 (Amazon 내부 클래스들)
-        for tag in clean_element.find_all():
-            if tag.get('class'):
-                # Amazon 특화 클래스들 제거
-                clean_classes = [cls for cls in tag['class'] 
-                               if not any(amazon_cls in cls for amazon_cls in 
-                                         ['a-', 'aplus-', 'cr-', 'reviews-'])]
-                if clean_classes:
-                    tag['class'] = clean_classes
-                else:
-                    del tag['class']
-        
-        # 빈 태그 제거
-        for tag in clean_element.find_all():
-            if not tag.get_text(strip=True) and not tag.find('img'):
-                tag.decompose()
-        
-        html_content = str(clean_element)
+        result = sanitize_html(element, DESCRIPTION_POLICY)
+        if result.truncated:
+            logger.info(f"✂️ 설명 HTML이 크기 예산({DESCRIPTION_POLICY.max_chars}자)을 넘어 잘림")
         
         # JavaScript 코드나 CSS 코드가 포함된 텍스트 필터링
-        if self._is_code_or_style(html_content):
+        if self._is_code_or_style(result.text):
             return None
         
-        return html_content.strip()
+        return result.html.strip()
     
     def _extract_meaningful_text(self, element) -> str:
         """요소에서 의미있는 텍스트 추출"""
@@ -551,17 +635,8 @@ class AmazonScraper(BaseScraper):
     
     def _is_code_or_style(self, text: str) -> bool:
         """텍스트가 코드나 스타일인지 판별"""
-        code_indicators = [
-            '{', '}', 'function', 'var ', 'window.', 'document.',
-            'css', 'javascript', 'px', 'margin', 'padding',
-            'width:', 'height:', 'background', '.aplus', 'rgba', 'font-',
-            'border:', 'display:', 'position:', 'color:', 'ue.count',
-            'logShoppableMetrics', 'innerHTML', 'addEventListener'
-        ]
-        
-        # CSS/JS 패턴 체크
-        text_lower = text.lower()
-        css_pattern_count = sum(1 for indicator in code_indicators if indicator in text_lower)
+        # CSS/JS 패턴 체크 (대소문자 무시, 한 번의 검색으로 모든 지표 확인)
+        css_pattern_count = code_matcher.scan(text).distinct('code')
         
         # 코드 패턴이 많거나 명확한 코드 구조면 코드로 판별
         return (css_pattern_count >= 2 or 
@@ -612,7 +687,7 @@ class AmazonScraper(BaseScraper):
         
         return None
     
-    def _extract_features_jp(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_features_jp(self, ctx: PageContext) -> List[str]:
         """Amazon 일본 - この商品について 섹션 추출"""
         features = []
         
@@ -627,7 +702,7 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in selectors_to_try:
-            feature_items = soup.select(selector)
+            feature_items = ctx.root.select(selector)
             
             if feature_items:
                 for item in feature_items:
@@ -646,7 +721,7 @@ class AmazonScraper(BaseScraper):
         
         return features[:5]
     
-    def _extract_features(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_features(self, ctx: PageContext) -> List[str]:
         """상품 특징 추출"""
         features = []
         
@@ -662,7 +737,7 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in feature_selectors:
-            elements = soup.select(selector)
+            elements = ctx.root.select(selector)
             for element in elements:
                 text = element.get_text(strip=True)
                 
@@ -684,7 +759,7 @@ class AmazonScraper(BaseScraper):
         
         # 특징이 없으면 상품 설명에서 문장 단위로 추출
         if not features:
-            description_elements = soup.select('#productDescription p, #aplus p')
+            description_elements = ctx.root.select('#productDescription p, #aplus p')
             for element in description_elements:
                 sentences = element.get_text().split('。')
                 for sentence in sentences:
@@ -696,30 +771,17 @@ class AmazonScraper(BaseScraper):
         
         return features
     
-    def _extract_category(self, soup: BeautifulSoup) -> str:
+    def _extract_category(self, ctx: PageContext) -> str:
         """카테고리 추출"""
-        category_selectors = [
-            '#wayfinding-breadcrumbs_feature_div',
-            '.a-breadcrumb',
-            '[data-automation-id="breadcrumb"]'
-        ]
-        
-        for selector in category_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.get_text(separator=' > ', strip=True)
-        
-        return None
+        return ctx.breadcrumb
     
-    def _extract_brand(self, soup: BeautifulSoup, structured_data: Dict = None) -> str:
+    def _extract_brand(self, ctx: PageContext, structured_data: Dict = None) -> str:
         """브랜드 추출"""
         # 1순위: JSON-LD 구조화 데이터
-        if structured_data:
-            brand = structured_data.get('brand')
-            if brand:
-                if isinstance(brand, dict):
-                    return brand.get('name', '')
-                return str(brand)
+        brand = embedded_data.json_ld_brand(structured_data or {})
+        if brand is not None:
+            ctx.sources['brand'] = 'json_ld'
+            return brand
         
         # 2순위: HTML 셀렉터
         brand_selectors = [
@@ -729,110 +791,85 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in brand_selectors:
-            element = soup.select_one(selector)
+            element = ctx.root.select_one(selector)
             if element:
+                ctx.sources['brand'] = 'html'
                 return element.get_text(strip=True)
         
         return None
     
-    def _check_stock_status(self, soup: BeautifulSoup) -> bool:
+    def _check_stock_status(self, ctx: PageContext) -> bool:
         """재고 상태 확인"""
-        # 품절 관련 텍스트 확인
+        # 1순위: JSON-LD offers.availability
+        availability = embedded_data.json_ld_availability(ctx.json_ld)
+        if availability is not None:
+            ctx.sources['availability'] = 'json_ld'
+            return availability
+        
+        # 2순위: 품절 관련 텍스트 확인 (재고 영역이 있으면 그 영역만 - 리뷰 등의 '在庫切れ' 무시)
+        ctx.sources['availability'] = 'text'
         out_of_stock_indicators = [
             '在庫切れ', '一時的に在庫切れ', 'Currently unavailable'
         ]
         
-        page_text = soup.get_text()
+        stock_regions = [element for element in (ctx.root.select_one('#availability'),
+                                                  ctx.root.select_one('#outOfStock')) if element]
+        page_text = ' '.join(element.get_text() for element in stock_regions) if stock_regions else ctx.text
         for indicator in out_of_stock_indicators:
             if indicator in page_text:
                 return False
         
         return True
     
-    def _extract_weight(self, soup: BeautifulSoup, structured_data: Dict = None) -> str:
-        """무게 정보 추출 (JSON-LD 우선, 텍스트 검색 후순위)"""
-        
-        # 1순위: JSON-LD 구조화 데이터
-        if structured_data:
-            weight = (structured_data.get('weight') or 
-                     structured_data.get('additionalProperty', {}).get('weight'))
-            if weight:
-                return str(weight)
-        
-        # 2순위: 전체 페이지 텍스트에서 스마트 검색
-        page_text = soup.get_text()
-        
-        # 무게 관련 패턴들 (더 유연하게)
-        weight_patterns = [
-            r'(?:重量|重さ|Weight|商品の重量|梱包重量|発送重量)[：:\s]*([0-9.,]+\s*(?:kg|g|キログラム|グラム|Kg|G))',
-            r'([0-9.,]+\s*(?:kg|g|キログラム|グラム|Kg|G))',  # 단순 무게 패턴
-        ]
-        
-        for pattern in weight_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    weight_str = match[0] if match[0] else match[1]
+    def _extract_physical(self, ctx: PageContext, specifications: Dict[str, str]) -> PhysicalSpec:
+        """무게/치수 추출 (登録情報 표 우선, 없으면 상품 정보 영역 텍스트 검색)"""
+        physical = physical_from_details(specifications)
+        
+        if physical.weight_g is None or physical.dimensions_cm is None:
+            # 리뷰 등의 숫자를 피하기 위해 상품 정보 영역으로 범위를 좁혀 검색
+            smart_physical = SmartExtractor.extract_smart_weight_dimensions(physical_scope_text(ctx))
+            if physical.weight_g is None and smart_physical.get('weight'):
+                physical.weight_g = parse_weight_g(f"{smart_physical['weight']} kg")
+                physical.weight_source = 'page_text' if physical.weight_g is not None else None
+            if physical.dimensions_cm is None and smart_physical.get('dimensions'):
+                physical.dimensions_cm = parse_dimensions_cm(smart_physical['dimensions'])
+                if physical.dimensions_cm:
+                    physical.dimensions_source = 'page_text'
                 else:
-                    weight_str = match
-                
-                # 숫자 부분 추출
-                number_match = re.search(r'([0-9.,]+)', weight_str)
-                if number_match:
-                    number = float(number_match.group(1).replace(',', ''))
-                    
-                    # kg로 정규화
-                    if 'g' in weight_str.lower() and 'kg' not in weight_str.lower():
-                        return f"{number/1000:.3f}"
-                    else:
-                        return f"{number:.3f}"
-        
-        return None
+                    # 2차원 치수 등 수치 변환이 안 되는 값은 문자열로만 유지
+                    physical.dimensions_text = smart_physical['dimensions']
+        
+        if physical.weight_source:
+            ctx.sources['weight'] = physical.weight_source
+        if physical.dimensions_source:
+            ctx.sources['dimensions'] = physical.dimensions_source
+        return physical
     
-    def _extract_dimensions(self, soup: BeautifulSoup, structured_data: Dict = None) -> str:
-        """치수 정보 추출 (JSON-LD 우선, 텍스트 검색 후순위)"""
-        
-        # 1순위: JSON-LD 구조화 데이터
-        if structured_data:
-            dimensions = (structured_data.get('depth') or 
-                         structured_data.get('width') or
-                         structured_data.get('height') or
-                         structured_data.get('additionalProperty', {}).get('dimensions'))
-            if dimensions:
-                return str(dimensions)
-        
-        # 2순위: 전체 페이지 텍스트에서 스마트 검색
-        page_text = soup.get_text()
-        
-        # 치수 관련 패턴들 (더 유연하게)
-        dimension_patterns = [
-            r'(?:商品寸法|製品サイズ|梱包サイズ|サイズ|Dimensions)[：:\s]*([0-9.,]+\s*[x×]\s*[0-9.,]+\s*[x×]\s*[0-9.,]+\s*(?:cm|mm))',
-            r'([0-9.,]+\s*[x×]\s*[0-9.,]+\s*[x×]\s*[0-9.,]+\s*(?:cm|mm))',  # 단순 치수 패턴
-            r'([0-9.,]+\s*[x×]\s*[0-9.,]+\s*(?:cm|mm))',  # 2차원 치수
-        ]
-        
-        for pattern in dimension_patterns:
-            matches = re.findall(pattern, page_text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    dim_str = match[0] if match[0] else match[1]
-                else:
-                    dim_str = match
-                
-                # 유효한 치수인지 확인 (숫자가 포함되어 있고 적절한 범위)
-                numbers = re.findall(r'([0-9.,]+)', dim_str)
-                if numbers and len(numbers) >= 2:
-                    # 첫 번째로 찾은 유효한 치수 반환
-                    return dim_str.strip()
-        
-        return None
-    
-    def _extract_variants(self, soup: BeautifulSoup, base_asin: str) -> List[Product]:
+    def _extract_variants(self, ctx: PageContext, base_asin: str) -> List[Product]:
         """Amazon 변형 상품 추출"""
+        # 1순위: twister 데이터 (모든 변형 조합을 ASIN별로 포함)
+        embedded_variants = embedded_data.twister_variants(ctx, base_asin)
+        if embedded_variants is not None:
+            ctx.sources['variants'] = 'twister'
+            return [
+                Product(
+                    site='amazon',
+                    product_id=variant.asin,
+                    url=f"https://www.amazon.co.jp/dp/{variant.asin}",
+                    name=f"변형상품 - {variant.variant_value}",
+                    is_variant=True,
+                    parent_id=base_asin,
+                    variant_type=variant.variant_type,
+                    variant_value=variant.variant_value
+                )
+                for variant in embedded_variants
+            ]
+        
+        # 2순위: HTML 셀렉터
         variants = []
         
         # 색상 변형 찾기
-        color_variants = soup.select('#variation_color_name li[data-defaultasin]')
+        color_variants = ctx.root.select('#variation_color_name li[data-defaultasin]')
         for variant in color_variants:
             variant_asin = variant.get('data-defaultasin')
             color_name = variant.get('title', '').strip()
@@ -850,7 +887,7 @@ class AmazonScraper(BaseScraper):
                 ))
         
         # 사이즈 변형 찾기
-        size_variants = soup.select('#variation_size_name li[data-defaultasin]')
+        size_variants = ctx.root.select('#variation_size_name li[data-defaultasin]')
         for variant in size_variants:
             variant_asin = variant.get('data-defaultasin')
             size_name = variant.get('title', '').strip()
@@ -867,50 +904,52 @@ class AmazonScraper(BaseScraper):
                     variant_value=size_name
                 ))
         
+        if variants:
+            ctx.sources['variants'] = 'html'
         return variants
     
-    def _extract_amazon_specific_data(self, soup: BeautifulSoup, structured_data: Dict = None) -> Dict:
+    def _extract_amazon_specific_data(self, ctx: PageContext, structured_data: Dict = None) -> Dict:
         """Amazon 고유 정보 추출"""
         amazon_data = {}
         
         # 아마존 초이스 확인
-        if soup.select_one('[data-csa-c-item-id="amzn1.sym.f3f9dd1d-4c77-4186-add7-9d2c6b15dbf0"]'):
+        if ctx.root.select_one('[data-csa-c-item-id="amzn1.sym.f3f9dd1d-4c77-4186-add7-9d2c6b15dbf0"]'):
             amazon_data['amazon_choice'] = True
         
         # 프라임 배송 확인
-        prime_elements = soup.select('[aria-label*="Prime"], .a-icon-prime')
+        prime_elements = ctx.root.select('[aria-label*="Prime"], .a-icon-prime')
         if prime_elements:
             amazon_data['prime_eligible'] = True
         
         # 판매자 정보
-        seller_element = soup.select_one('#merchant-info, #sellerProfileTriggerId')
+        seller_element = ctx.root.select_one('#merchant-info, #sellerProfileTriggerId')
         if seller_element:
             amazon_data['seller_name'] = seller_element.get_text(strip=True)
         
         # 리뷰 정보
-        rating_element = soup.select_one('[data-hook="average-star-rating"] .a-icon-alt')
+        rating_element = ctx.root.select_one('[data-hook="average-star-rating"] .a-icon-alt')
         if rating_element:
             rating_text = rating_element.get_text(strip=True)
             amazon_data['review_summary'] = rating_text
         
-        review_count_element = soup.select_one('[data-hook="total-review-count"]')
+        review_count_element = ctx.root.select_one('[data-hook="total-review-count"]')
         if review_count_element:
             amazon_data['review_count'] = review_count_element.get_text(strip=True)
         
         # 배송 옵션
-        delivery_elements = soup.select('#deliveryBlockMessage, #mir-layout-DELIVERY_BLOCK')
+        delivery_elements = ctx.root.select('#deliveryBlockMessage, #mir-layout-DELIVERY_BLOCK')
         if delivery_elements:
             delivery_texts = [elem.get_text(strip=True) for elem in delivery_elements]
             amazon_data['delivery_options'] = delivery_texts
         
         # ASIN 정보
-        amazon_data['asin'] = soup.select_one('[data-asin]')
+        amazon_data['asin'] = ctx.root.select_one('[data-asin]')
         if amazon_data['asin']:
             amazon_data['asin'] = amazon_data['asin'].get('data-asin')
         
         return amazon_data
     
-    def _extract_description_images(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_description_images(self, ctx: PageContext) -> List[str]:
         """상품 설명 영역의 이미지들 추출"""
         description_images = []
         
@@ -925,7 +964,7 @@ class AmazonScraper(BaseScraper):
         ]
         
         for selector in description_areas:
-            img_elements = soup.select(selector)
+            img_elements = ctx.root.select(selector)
             for img in img_elements:
                 src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
                 if src:
@@ -947,18 +986,163 @@ class AmazonScraper(BaseScraper):
         # 중복 제거 및 최대 10개로 제한
         return list(dict.fromkeys(description_images))[:10]
     
-    def _extract_image_gallery(self, soup: BeautifulSoup) -> tuple[List[str], List[str]]:
+    def _extract_image_gallery(self, ctx: PageContext) -> tuple[List[str], List[str]]:
         """Amazon 이미지 갤러리 추출 (썸네일 + 큰 이미지)"""
+        # 1순위: colorImages 데이터 블롭을 JSON(또는 JS 객체 리터럴)으로 해석
+        image_ids = self._extract_color_image_ids(ctx)
+        if image_ids:
+            ctx.sources['gallery'] = 'color_images'
+            return self._gallery_from_image_ids(image_ids)
+        
+        # 2순위: 블롭을 해석하지 못한 경우에만 스크립트 정규식 탐색 (최후 수단, 사용 빈도는 지표로 확인)
+        thumbnail_images, large_images = self._extract_image_gallery_by_regex(ctx)
+        if thumbnail_images:
+            ctx.sources['gallery'] = 'regex_cascade'
+        
+        # 3순위: HTML 셀렉터 기반 추출
+        if not thumbnail_images:
+            # 다양한 셀렉터로 이미지 찾기 - 더 광범위한 패턴
+            image_selectors = [
+                '#altImages li[data-defaultasin] img',
+                '#altImages li img', 
+                '#altImages img',
+                '#imageBlock img',
+                '.a-dynamic-image',
+                '.imageThumbnail img',
+                'img[data-a-dynamic-image]',
+                'img[src*="media-amazon.com"]',
+                'img[data-src*="media-amazon.com"]',
+                '.image img',
+                '[id*="image"] img',
+                'div[data-csa-c-content-id*="image"] img',
+                '.s-image',
+                '.imageBlockThumbs img'
+            ]
+            
+            alt_images = []
+            for selector in image_selectors:
+                alt_images = ctx.root.select(selector)
+                if alt_images:
+                    break
+                    
+            if alt_images:
+                seen_ids = set()
+                for img in alt_images:
+                    # src와 data-src 모두 확인
+                    src = img.get('src') or img.get('data-src') or img.get('data-a-dynamic-image')
+                    
+                    if src and self._is_valid_amazon_image_url(src):
+                        image_id = self._extract_image_id_from_url(src)
+                        if image_id and image_id not in seen_ids:
+                            seen_ids.add(image_id)
+                            thumb_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_US100_.jpg"
+                            large_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_SL1500_.jpg"
+                            
+                            final_thumb = self._normalize_amazon_image_url(thumb_url, size='thumbnail')
+                            final_large = self._normalize_amazon_image_url(large_url, size='large')
+                            
+                            if final_thumb not in thumbnail_images:
+                                thumbnail_images.append(final_thumb)
+                                large_images.append(final_large)
+                                
+                            # 더 많은 이미지 수집을 위해 제한 증가
+                            if len(thumbnail_images) >= 10:
+                                break
+            
+            if thumbnail_images:
+                ctx.sources['gallery'] = 'html'
+        
+        # 4순위: 메인 이미지 기반 fallback
+        if not thumbnail_images:
+            main_image_selectors = [
+                '#landingImage',
+                '.a-dynamic-image',
+                '#main-image img',
+                '.image-wrapper img'
+            ]
+            
+            for selector in main_image_selectors:
+                img_elements = ctx.root.select(selector)
+                for img in img_elements:
+                    src = img.get('src') or img.get('data-src')
+                    if src and self._is_valid_amazon_image_url(src):
+                        image_id = self._extract_image_id_from_url(src)
+                        if image_id:
+                            thumb_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_US100_.jpg"
+                            large_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_SL1500_.jpg"
+                            
+                            final_thumb = self._normalize_amazon_image_url(thumb_url, size='thumbnail')
+                            final_large = self._normalize_amazon_image_url(large_url, size='large')
+                            
+                            if final_thumb not in thumbnail_images:
+                                thumbnail_images.append(final_thumb)
+                                large_images.append(final_large)
+                            
+                        if len(thumbnail_images) >= 10:
+                            break
+                
+                if thumbnail_images:
+                    break
+            
+            if thumbnail_images:
+                ctx.sources['gallery'] = 'main_image'
+        
+        return thumbnail_images[:10], large_images[:10]  # 최대 10개로 제한
+    
+    def _extract_color_image_ids(self, ctx: PageContext) -> List[str]:
+        """ImageBlockATF 등의 colorImages 데이터에서 이미지 ID 목록 추출 (문서 순서, 중복 제거)
+        
+        현재 상품 이미지('initial')가 있으면 그것만, 없으면 모든 변형의 이미지를 사용한다.
+        """
+        for content in ctx.scripts:
+            if 'colorImages' not in content:
+                continue
+            
+            for blob in iter_values_after(content, 'colorImages'):
+                data = loads_tolerant(blob)
+                if not isinstance(data, dict):
+                    continue
+                
+                groups = [data['initial']] if isinstance(data.get('initial'), list) else list(data.values())
+                image_ids: Dict[str, None] = {}
+                for entries in groups:
+                    if not isinstance(entries, list):
+                        continue
+                    for entry in entries:
+                        if not isinstance(entry, dict):
+                            continue
+                        main = entry.get('main')
+                        url = entry.get('hiRes') or entry.get('large') or (next(iter(main), None) if isinstance(main, dict) else None)
+                        if self._is_valid_amazon_image_url(url):
+                            image_id = self._extract_image_id_from_url(url)
+                            if image_id:
+                                image_ids.setdefault(image_id, None)
+                
+                if image_ids:
+                    return list(image_ids)
+        
+        return []
+    
+    def _gallery_from_image_ids(self, image_ids: List[str]) -> tuple[List[str], List[str]]:
+        """이미지 ID 목록 → (썸네일, 큰 이미지) URL 쌍 (최대 10개)"""
+        thumbnail_images = []
+        large_images = []
+        for image_id in image_ids[:10]:
+            thumb_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_US100_.jpg"
+            large_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_SL1500_.jpg"
+            thumbnail_images.append(self._normalize_amazon_image_url(thumb_url, size='thumbnail'))
+            large_images.append(self._normalize_amazon_image_url(large_url, size='large'))
+        return thumbnail_images, large_images
+    
+    def _extract_image_gallery_by_regex(self, ctx: PageContext) -> tuple[List[str], List[str]]:
+        """colorImages가 언급된 스크립트를 정규식으로 탐색 (구 방식, 최후 수단)"""
         thumbnail_images = []
         large_images = []
         
-        # 1순위: Amazon JavaScript에서 colorImages 데이터 추출 (가장 정확한 방법)
-        script_tags = soup.find_all('script')
-        for script in script_tags:
-            if script.string and 'colorImages' in script.string:
+        for content in ctx.scripts:
+            if 'colorImages' in content:
                 try:
                     # colorImages JSON 구조에서 이미지 데이터 추출
-                    content = script.string
                     
                     # colorImages 오브젝트 찾기 - 더 유연한 패턴 (다양한 구조 지원)
                     colorImages_patterns = [
@@ -1095,89 +1279,7 @@ class AmazonScraper(BaseScraper):
                 except Exception as e:
                     continue
         
-        # 2순위: HTML 셀렉터 기반 추출
-        if not thumbnail_images:
-            # 다양한 셀렉터로 이미지 찾기 - 더 광범위한 패턴
-            image_selectors = [
-                '#altImages li[data-defaultasin] img',
-                '#altImages li img', 
-                '#altImages img',
-                '#imageBlock img',
-                '.a-dynamic-image',
-                '.imageThumbnail img',
-                'img[data-a-dynamic-image]',
-                'img[src*="media-amazon.com"]',
-                'img[data-src*="media-amazon.com"]',
-                '.image img',
-                '[id*="image"] img',
-                'div[data-csa-c-content-id*="image"] img',
-                '.s-image',
-                '.imageBlockThumbs img'
-            ]
-            
-            alt_images = []
-            for selector in image_selectors:
-                alt_images = soup.select(selector)
-                if alt_images:
-                    break
-                    
-            if alt_images:
-                seen_ids = set()
-                for img in alt_images:
-                    # src와 data-src 모두 확인
-                    src = img.get('src') or img.get('data-src') or img.get('data-a-dynamic-image')
-                    
-                    if src and self._is_valid_amazon_image_url(src):
-                        image_id = self._extract_image_id_from_url(src)
-                        if image_id and image_id not in seen_ids:
-                            seen_ids.add(image_id)
-                            thumb_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_US100_.jpg"
-                            large_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_SL1500_.jpg"
-                            
-                            final_thumb = self._normalize_amazon_image_url(thumb_url, size='thumbnail')
-                            final_large = self._normalize_amazon_image_url(large_url, size='large')
-                            
-                            if final_thumb not in thumbnail_images:
-                                thumbnail_images.append(final_thumb)
-                                large_images.append(final_large)
-                                
-                            # 더 많은 이미지 수집을 위해 제한 증가
-                            if len(thumbnail_images) >= 10:
-                                break
-        
-        # 3순위: 메인 이미지 기반 fallback
-        if not thumbnail_images:
-            main_image_selectors = [
-                '#landingImage',
-                '.a-dynamic-image',
-                '#main-image img',
-                '.image-wrapper img'
-            ]
-            
-            for selector in main_image_selectors:
-                img_elements = soup.select(selector)
-                for img in img_elements:
-                    src = img.get('src') or img.get('data-src')
-                    if src and self._is_valid_amazon_image_url(src):
-                        image_id = self._extract_image_id_from_url(src)
-                        if image_id:
-                            thumb_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_US100_.jpg"
-                            large_url = f"https://m.media-amazon.com/images/I/{image_id}._AC_SL1500_.jpg"
-                            
-                            final_thumb = self._normalize_amazon_image_url(thumb_url, size='thumbnail')
-                            final_large = self._normalize_amazon_image_url(large_url, size='large')
-                            
-                            if final_thumb not in thumbnail_images:
-                                thumbnail_images.append(final_thumb)
-                                large_images.append(final_large)
-                            
-                        if len(thumbnail_images) >= 10:
-                            break
-                
-                if thumbnail_images:
-                    break
-        
-        return thumbnail_images[:10], large_images[:10]  # 최대 10개로 제한
+        return thumbnail_images, large_images
     
     def _normalize_amazon_image_url(self, url: str, size: str = 'large') -> str:
         """Amazon 이미지 URL을 정규화하고 크기 조정"""
@@ -1303,90 +1405,165 @@ class AmazonScraper(BaseScraper):
             
             return product
     
-    async def scrape_bestsellers_asins(self, url: str, limit: int = 20) -> List[str]:
+    async def scrape_bestsellers_asins(self, url: str, limit: int = 20, max_age: Optional[float] = None) -> List[str]:
         """베스트셀러 페이지에서 상품 ASIN 목록 추출
         
         Args:
             url: 베스트셀러 페이지 URL
             limit: 추출할 최대 ASIN 개수 (기본 20개)
+            max_age: 지정하면 이 시간(초) 이내에 캐시된 원본 HTML을 재사용
             
         Returns:
             List[str]: ASIN 목록
         """
-        async with httpx.AsyncClient(headers=self.headers, timeout=30.0) as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, 'lxml')
-                asins = []
-                
-                # 베스트셀러 상품 링크에서 ASIN 추출
-                product_links = soup.find_all('a', href=True)
-                
-                for link in product_links:
-                    href = link.get('href')
-                    if href and '/dp/' in href:
-                        # ASIN 패턴 매칭
-                        asin_match = re.search(r'/dp/([A-Z0-9]{10})', href)
-                        if asin_match:
-                            asin = asin_match.group(1)
-                            if asin not in asins:  # 중복 제거
-                                asins.append(asin)
-                                if len(asins) >= limit:
-                                    break
-                
-                logger.info(f"베스트셀러 페이지에서 {len(asins)}개 ASIN 추출 완료: {url}")
-                return asins
-                
-            except httpx.TimeoutException:
-                raise ScrapingTimeoutError(f"베스트셀러 페이지 스크래핑 타임아웃: {url}")
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise ProductNotFoundError(f"베스트셀러 페이지를 찾을 수 없습니다: {url}")
-                raise ScrapingError(f"베스트셀러 페이지 스크래핑 실패: {e}")
-            except Exception as e:
-                raise ParsingError(f"베스트셀러 페이지 파싱 중 오류 발생: {e}")
-    
-    async def scrape_bestsellers_products(self, url: str, limit: int = 20, translate: bool = True) -> List[Product]:
+        try:
+            page = await self._fetch_page(url, page_type='bestsellers', max_age=max_age)
+            
+            root = parse_document(page.text, settings.parse.backend)
+            asins = []
+            
+            # 베스트셀러 상품 링크에서 ASIN 추출
+            product_links = root.find_all('a', href=True)
+            
+            for link in product_links:
+                href = link.get('href')
+                if href and '/dp/' in href:
+                    # ASIN 패턴 매칭
+                    asin_match = re.search(r'/dp/([A-Z0-9]{10})', href)
+                    if asin_match:
+                        asin = asin_match.group(1)
+                        if asin not in asins:  # 중복 제거
+                            asins.append(asin)
+                            if len(asins) >= limit:
+                                break
+            
+            logger.info(f"베스트셀러 페이지에서 {len(asins)}개 ASIN 추출 완료: {url}")
+            return asins
+            
+        except httpx.TimeoutException:
+            raise ScrapingTimeoutError(f"베스트셀러 페이지 스크래핑 타임아웃: {url}")
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                raise ProductNotFoundError(f"베스트셀러 페이지를 찾을 수 없습니다: {url}")
+            raise ScrapingError(f"베스트셀러 페이지 스크래핑 실패: {e}")
+        except ScrapingError:
+            # 회로 차단/데드라인 초과 등은 그대로 전달
+            raise
+        except Exception as e:
+            raise ParsingError(f"베스트셀러 페이지 파싱 중 오류 발생: {e}")
+
+    async def scrape_bestsellers_products(self, url: str, limit: int = 20, translate: bool = True,
+                                          concurrency: Optional[int] = None, max_age: Optional[float] = None) -> List[Product]:
         """베스트셀러 페이지에서 상품들을 일괄 수집
         
         Args:
             url: 베스트셀러 페이지 URL
             limit: 수집할 최대 상품 개수 (기본 20개)
             translate: 번역 여부 (기본 True)
+            concurrency: 동시 수집 개수 (기본값은 설정의 BESTSELLER_CONCURRENCY)
+            max_age: 지정하면 이 시간(초) 이내에 캐시된 원본 HTML을 재사용
+            
+        Returns:
+            List[Product]: 수집된 상품 목록 (랭킹 순)
+        """
+        results = await self.collect_bestsellers(url, limit=limit, translate=translate,
+                                                 concurrency=concurrency, max_age=max_age)
+        return [result.product for result in results if result.success]
+    
+    async def collect_bestsellers(self, url: str, limit: int = 20, translate: bool = True,
+                                  concurrency: Optional[int] = None,
+                                  max_age: Optional[float] = None) -> List[BestsellerItemResult]:
+        """베스트셀러 상품 일괄 수집 (ASIN별 소요시간/오류 리포트 포함)
+        
+        요청 간격은 고정 sleep 대신 호스트별 속도 제한기(rate_limiter)가 조절한다.
+        
+        Args:
+            url: 베스트셀러 페이지 URL
+            limit: 수집할 최대 상품 개수 (기본 20개)
+            translate: 번역 여부 (기본 True)
+            concurrency: 동시 수집 개수 (1이면 순차 수집)
+            max_age: 지정하면 이 시간(초) 이내에 캐시된 원본 HTML을 재사용
             
         Returns:
-            List[Product]: 수집된 상품 목록
+            List[BestsellerItemResult]: 랭킹 순 수집 결과 (실패 항목 포함)
         """
         # 1단계: ASIN 목록 추출
-        asins = await self.scrape_bestsellers_asins(url, limit)
+        asins = await self.scrape_bestsellers_asins(url, limit, max_age=max_age)
         
         if not asins:
             logger.warning(f"베스트셀러 페이지에서 ASIN을 찾을 수 없습니다: {url}")
             return []
         
-        # 2단계: 각 ASIN별 상품 정보 수집
-        products = []
-        failed_asins = []
+        if concurrency is None:
+            concurrency = settings.scrape.bestseller_concurrency
+        concurrency = max(1, min(concurrency, settings.scrape.bestseller_max_concurrency))
+        
+        # 2단계: 각 ASIN별 상품 정보 수집 (동시 수집 개수 제한)
+        semaphore = asyncio.Semaphore(concurrency)
         
-        for i, asin in enumerate(asins, 1):
-            try:
-                logger.info(f"상품 수집 중 ({i}/{len(asins)}): {asin}")
-                product = await self.scrape_product(asin, translate=translate)
-                products.append(product)
+        async def collect_one(rank: int, asin: str) -> BestsellerItemResult:
+            async with semaphore:
+                logger.info(f"상품 수집 중 ({rank}/{len(asins)}): {asin}")
+                started = time.monotonic()
+                try:
+                    product = await self.scrape_product(asin, translate=translate, max_age=max_age)
+                    result = BestsellerItemResult(
+                        rank=rank,
+                        asin=asin,
+                        success=True,
+                        elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+                        product=product
+                    )
+                except Exception as e:
+                    logger.error(f"상품 수집 실패 - ASIN: {asin}, 오류: {e}")
+                    result = BestsellerItemResult(
+                        rank=rank,
+                        asin=asin,
+                        success=False,
+                        elapsed_ms=round((time.monotonic() - started) * 1000, 1),
+                        error=str(e),
+                        error_type=type(e).__name__
+                    )
                 
-                # 요청 간격 조절 (너무 빠른 연속 요청 방지)
-                if i < len(asins):
-                    await asyncio.sleep(1)
-                    
-            except Exception as e:
-                logger.error(f"상품 수집 실패 - ASIN: {asin}, 오류: {e}")
-                failed_asins.append(asin)
-                continue
+                return result
+        
+        # gather는 입력 순서를 유지하므로 결과는 랭킹 순
+        results = await asyncio.gather(*(collect_one(rank, asin) for rank, asin in enumerate(asins, 1)))
         
-        logger.info(f"베스트셀러 상품 수집 완료: {len(products)}개 성공, {len(failed_asins)}개 실패")
+        failed_asins = [result.asin for result in results if not result.success]
+        logger.info(f"베스트셀러 상품 수집 완료 (동시 {concurrency}개): "
+                    f"{len(results) - len(failed_asins)}개 성공, {len(failed_asins)}개 실패")
         if failed_asins:
             logger.warning(f"수집 실패한 ASINs: {failed_asins}")
             
-        return products
\ No newline at end of file
+        return list(results)
+
+
+def parse_product_html(html: str, asin: str, url: str, partial: Optional[bool] = None,
+                       backend: Optional[str] = None) -> Tuple[Dict, Dict]:
+    """상품 페이지 HTML을 파싱해 직렬화 가능한 dict로 반환 (파싱 실행기 워커에서 실행)
+    
+    partial이 켜져 있으면 필요한 영역만 모은 축약 문서를 파싱하고,
+    필수 영역(상품명/설명/이미지)이 하나라도 없으면 전체 문서를 파싱한다.
+    partial/backend를 생략하면 설정값(PARSE_PARTIAL, PARSER_BACKEND)을 사용한다.
+    
+    Returns:
+        Tuple[Product dict, 파싱 정보 {'mode': 'partial' | 'full' | 'full:<누락 영역>', 'sources': 필드별 추출 경로}]
+    """
+    if partial is None:
+        partial = settings.parse.partial
+    
+    mode = 'full'
+    document = html
+    if partial:
+        regions = extract_regions(html)
+        if regions.complete:
+            mode = 'partial'
+            document = regions.html
+        else:
+            mode = 'full:' + ','.join(regions.missing_groups)
+    
+    root = parse_document(document, backend or settings.parse.backend)
+    sources: Dict[str, str] = {}
+    product = AmazonScraper()._parse_product_page(root, asin, url, html, sources)
+    return product.model_dump(mode='json'), {'mode': mode, 'sources': sources}
@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.scrapers.amazon.page_context import PageContext
+from app.utils.embedded_json import iter_values_after, loads_tolerant
+
+
+# schema.org availability → 재고 여부 (목록에 없는 값은 판단하지 않음)
+SCHEMA_AVAILABILITY = {
+    'InStock': True,
+    'InStoreOnly': True,
+    'OnlineOnly': True,
+    'LimitedAvailability': True,
+    'PreOrder': True,
+    'PreSale': True,
+    'BackOrder': True,
+    'OutOfStock': False,
+    'SoldOut': False,
+    'Discontinued': False,
+}
+
+# 구매 옵션 가격 데이터가 들어 있는 요소 (twister 가격 블록)
+PRICE_DATA_SELECTOR = '.twister-plus-buying-options-price-data'
+
+
+@dataclass
+class EmbeddedVariant:
+    """twister 데이터의 변형 상품 1건"""
+    asin: str
+    variant_type: str       # 'color', 'size', 여러 축이면 'color/size'
+    variant_value: str      # 여러 축이면 'ブラック / M'
+
+
+def json_ld_offer(json_ld: Dict) -> Dict:
+    """JSON-LD의 첫 번째 offer (없으면 빈 dict)"""
+    offers = json_ld.get('offers') or {}
+    if isinstance(offers, list):
+        offers = offers[0] if offers else {}
+    return offers if isinstance(offers, dict) else {}
+
+
+def json_ld_price(json_ld: Dict) -> Optional[float]:
+    offer = json_ld_offer(json_ld)
+    price = offer.get('price') or offer.get('lowPrice')
+    try:
+        return float(price) if price else None
+    except (TypeError, ValueError):
+        return None
+
+
+def json_ld_brand(json_ld: Dict) -> Optional[str]:
+    brand = json_ld.get('brand')
+    if not brand:
+        return None
+    if isinstance(brand, dict):
+        return brand.get('name', '')
+    return str(brand)
+
+
+def json_ld_availability(json_ld: Dict) -> Optional[bool]:
+    """offers.availability ('https://schema.org/InStock' 등) → 재고 여부"""
+    availability = json_ld_offer(json_ld).get('availability')
+    if not isinstance(availability, str):
+        return None
+    return SCHEMA_AVAILABILITY.get(availability.rstrip('/').rsplit('/', 1)[-1])
+
+
+def json_ld_image(json_ld: Dict) -> Optional[str]:
+    image = json_ld.get('image')
+    if isinstance(image, list):
+        image = image[0] if image else None
+    if isinstance(image, dict):
+        image = image.get('url') or image.get('contentUrl')
+    return image if isinstance(image, str) and image else None
+
+
+def _first_price_amount(data: Any) -> Optional[float]:
+    """중첩된 dict/list에서 처음 나오는 priceAmount 값"""
+    if isinstance(data, dict):
+        amount = data.get('priceAmount')
+        if isinstance(amount, (int, float)) and not isinstance(amount, bool) and amount > 0:
+            return float(amount)
+        values = data.values()
+    elif isinstance(data, list):
+        values = data
+    else:
+        return None
+
+    for value in values:
+        amount = _first_price_amount(value)
+        if amount is not None:
+            return amount
+    return None
+
+
+def buybox_price(ctx: PageContext) -> Optional[float]:
+    """구매 옵션 가격 블록 / a-state 데이터의 priceAmount"""
+    element = ctx.root.select_one(PRICE_DATA_SELECTOR)
+    if element:
+        amount = _first_price_amount(loads_tolerant(element.get_text(strip=True)))
+        if amount is not None:
+            return amount
+
+    for state in ctx.a_states.values():
+        amount = _first_price_amount(state)
+        if amount is not None:
+            return amount
+    return None
+
+
+def _variant_type(dimension: str) -> str:
+    # 'color_name' → 'color', 'size_name' → 'size'
+    return dimension[:-5] if dimension.endswith('_name') else dimension
+
+
+def twister_variants(ctx: PageContext, base_asin: str) -> Optional[List[EmbeddedVariant]]:
+    """twister 데이터(dimensionValuesDisplayData)의 변형 상품 목록
+
+    twister 데이터가 없으면 None, 있지만 다른 변형이 없으면 빈 목록.
+    """
+    for content in ctx.scripts:
+        if 'dimensionValuesDisplayData' not in content:
+            continue
+
+        display_data = next(
+            (data for data in map(loads_tolerant, iter_values_after(content, 'dimensionValuesDisplayData'))
+             if isinstance(data, dict)),
+            None
+        )
+        if display_data is None:
+            continue
+
+        dimensions = next(
+            (data for data in map(loads_tolerant, iter_values_after(content, 'dimensions'))
+             if isinstance(data, list) and all(isinstance(name, str) for name in data)),
+            []
+        )
+
+        variants = []
+        for asin, values in display_data.items():
+            if asin == base_asin:
+                continue
+            if isinstance(values, str):
+                values = [values]
+            if not isinstance(values, list) or not values:
+                continue
+            types = [_variant_type(name) for name in dimensions[:len(values)]] or ['variant']
+            variants.append(EmbeddedVariant(
+                asin=asin,
+                variant_type='/'.join(types),
+                variant_value=' / '.join(str(value).strip() for value in values)
+            ))
+        return variants
+
+    return None
+
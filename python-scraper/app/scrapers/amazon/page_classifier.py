@@ -0,0 +1,74 @@
+from collections import Counter
+from enum import Enum
+from typing import Dict
+
+
+class PageKind(str, Enum):
+    """Amazon 응답 페이지 종류"""
+    PRODUCT = 'product'        # 정상 상품/목록 페이지
+    CAPTCHA = 'captcha'        # 로봇 확인 (文字を入力してください)
+    DOG = 'dog'                # 강아지 오류 페이지 (Sorry! Something went wrong)
+    EMPTY = 'empty'            # 본문이 없는 빈 페이지
+    UNKNOWN = 'unknown'        # 판별 불가 (파싱 시도)
+
+
+# 파싱하지 않고 차단/오류로 처리하는 페이지 종류
+BLOCKED_PAGE_KINDS = frozenset((PageKind.CAPTCHA, PageKind.DOG, PageKind.EMPTY))
+
+
+# 정상 페이지임을 보여주는 마커 (페이지 종류별)
+PAGE_MARKERS = {
+    'product': (b'id="productTitle"', b'id="dp-container"', b'id="dp"', b'"@type":"Product"'),
+    'bestsellers': (b'zg-grid-general-faceout', b'id="zg"', b'zg_bs', b'p13n-sc-uncoverable-faceout'),
+}
+
+CAPTCHA_MARKERS = (
+    b'/errors/validateCaptcha',
+    b'captchacharacters',
+    b'Type the characters you see',
+    '表示されている文字を入力してください'.encode('utf-8'),
+    b'api-services-support@amazon.com',
+)
+
+DOG_MARKERS = (
+    b'Sorry! Something went wrong',
+    b'ref=cs_503_link',
+    b'ref=cs_404_link',
+    b'dogsofamazon',
+    'ページが見つかりません'.encode('utf-8'),
+)
+
+# 이보다 작은 본문은 빈 페이지로 판단
+EMPTY_PAGE_BYTES = 1024
+
+# 분류 결과 카운터 (지표용)
+classification_counts: Counter = Counter()
+
+
+def classify_page(content: bytes, page_type: str = 'product') -> PageKind:
+    """원본 응답 바이트로 페이지 종류를 판별 (파싱 없이 부분 문자열 검색만 수행)"""
+    kind = _classify(content or b'', page_type)
+    classification_counts[kind.value] += 1
+    return kind
+
+
+def _classify(content: bytes, page_type: str) -> PageKind:
+    # 정상 페이지 마커가 있으면 차단 마커는 검사하지 않음 (오탐 방지)
+    if any(marker in content for marker in PAGE_MARKERS.get(page_type, ())):
+        return PageKind.PRODUCT
+
+    if any(marker in content for marker in CAPTCHA_MARKERS):
+        return PageKind.CAPTCHA
+
+    if any(marker in content for marker in DOG_MARKERS):
+        return PageKind.DOG
+
+    if len(content.strip()) < EMPTY_PAGE_BYTES or (b'<body' not in content and b'<BODY' not in content):
+        return PageKind.EMPTY
+
+    return PageKind.UNKNOWN
+
+
+def get_stats() -> Dict:
+    """페이지 분류 지표"""
+    return dict(classification_counts)
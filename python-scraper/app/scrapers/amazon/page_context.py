@@ -0,0 +1,125 @@
+import json
+import re
+from collections import Counter
+from functools import cached_property
+from typing import Any, Dict, List, Optional
+
+from app.utils.embedded_json import loads_tolerant
+
+
+# 카테고리(브레드크럼) 셀렉터 (우선순위 순)
+BREADCRUMB_SELECTORS = (
+    '#wayfinding-breadcrumbs_feature_div',
+    '.a-breadcrumb',
+    '[data-automation-id="breadcrumb"]',
+)
+
+# 필드별 추출 경로 카운터 (지표용, 예: 'gallery:color_images')
+extraction_source_counts: Counter = Counter()
+
+
+class PageContext:
+    """상품 페이지 1건의 파싱 컨텍스트
+
+    전체 텍스트, 스크립트 본문, JSON-LD, 브레드크럼처럼 여러 추출 단계에서
+    반복 사용하는 파생 데이터를 처음 요청될 때 한 번만 계산해 보관한다.
+    추출기는 문서를 변경하지 않는다. 정리된 HTML이 필요하면 원본 트리를 변경하지 않는
+    html_sanitizer.sanitize_html로 만든다.
+
+    root는 파서 백엔드(app.utils.html_backend)가 만든 문서 노드로,
+    BeautifulSoup 객체 또는 같은 API를 제공하는 lxml 문서 래퍼이다.
+
+    sources에는 추출기가 어떤 경로로 값을 얻었는지 필드별로 남긴다 (예: {'gallery': 'color_images'}).
+    """
+
+    def __init__(self, root, url: str, html: Optional[str] = None, sources: Optional[Dict[str, str]] = None):
+        self.root = root
+        self.url = url
+        self._source_html = html
+        self.sources: Dict[str, str] = sources if sources is not None else {}
+
+    @cached_property
+    def text(self) -> str:
+        """페이지 전체 텍스트 (root.get_text())"""
+        return self.root.get_text()
+
+    @cached_property
+    def html(self) -> str:
+        """페이지 HTML (원본이 있으면 원본, 없으면 트리를 직렬화)"""
+        if self._source_html is not None:
+            return self._source_html
+        return str(self.root)
+
+    @cached_property
+    def strings(self) -> List:
+        """문서의 모든 텍스트 노드 (키워드 검색용)"""
+        return self.root.find_all(string=True)
+
+    @cached_property
+    def script_tags(self) -> List:
+        return self.root.find_all('script')
+
+    @cached_property
+    def scripts(self) -> List[str]:
+        """내용이 있는 <script> 본문 목록"""
+        return [tag.string for tag in self.script_tags if tag.string]
+
+    @cached_property
+    def json_ld(self) -> Dict:
+        """JSON-LD 중 Product 스키마 (없으면 빈 dict)"""
+        for tag in self.script_tags:
+            if tag.get('type') != 'application/ld+json':
+                continue
+            try:
+                data = json.loads(tag.string)
+                if isinstance(data, list):
+                    data = data[0]
+
+                # Product 스키마인지 확인
+                if data.get('@type') == 'Product':
+                    return data
+            except (json.JSONDecodeError, AttributeError, TypeError):
+                continue
+
+        return {}
+
+    @cached_property
+    def a_states(self) -> Dict[str, Any]:
+        """<script type="a-state" data-a-state='{"key": ...}'> 본문 (key별 디코딩 결과)"""
+        states = {}
+        for tag in self.script_tags:
+            if tag.get('type') != 'a-state' or not tag.string:
+                continue
+            try:
+                key = json.loads(tag.get('data-a-state') or '{}').get('key')
+            except (json.JSONDecodeError, AttributeError):
+                continue
+            data = loads_tolerant(tag.string)
+            if key and data is not None:
+                states[key] = data
+        return states
+
+    @cached_property
+    def breadcrumb(self) -> Optional[str]:
+        """카테고리 브레드크럼 ('상위 > 하위' 형식)"""
+        for selector in BREADCRUMB_SELECTORS:
+            element = self.root.select_one(selector)
+            if element:
+                return element.get_text(separator=' > ', strip=True)
+        return None
+
+    def find_strings(self, pattern: str, flags: int = 0) -> List:
+        """패턴을 포함한 텍스트 노드 검색 (soup.find_all(string=re.compile(...))와 동일한 결과)"""
+        regex = re.compile(pattern, flags)
+        return [node for node in self.strings if regex.search(node)]
+
+
+def record_sources(sources: Dict[str, str]) -> None:
+    """파싱 1건의 필드별 추출 경로 기록 (파싱 워커가 돌려준 값을 메인 프로세스에서 집계)"""
+    for field_name, source in sources.items():
+        extraction_source_counts[f'{field_name}:{source}'] += 1
+
+
+def get_stats() -> Dict:
+    """필드별 추출 경로 지표"""
+    return dict(extraction_source_counts)
@@ -0,0 +1,144 @@
+import bisect
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# 추출기가 실제로 보는 영역 (요소 id 기준)
+REGION_IDS = (
+    'productTitle', 'bylineInfo',                                               # 상품명/브랜드
+    'corePrice_feature_div', 'corePriceDisplay_desktop_feature_div', 'apex_desktop',  # 가격
+    'priceBadging_feature_div',                                                 # Prime 배지
+    'availability', 'outOfStock',                                               # 재고
+    'feature-bullets',                                                          # この商品について
+    'productDescription', 'aplus_feature_div', 'aplus', 'aplus-v2',             # 商品の説明 / A+
+    'wayfinding-breadcrumbs_feature_div',                                       # 카테고리
+    'imageBlock', 'altImages', 'main-image-container',                          # 이미지
+    'variation_color_name', 'variation_size_name',                              # 변형 상품
+    'productDetails_feature_div', 'detailBullets_feature_div', 'prodDetails',   # 登録情報
+    'desktop_buybox', 'merchant-info', 'sellerProfileTriggerId', 'averageCustomerReviews',
+    'acrCustomerReviewLink', 'deliveryBlockMessage', 'mir-layout-DELIVERY_BLOCK',
+)
+
+# 하나라도 없으면 전체 파싱으로 전환하는 필수 영역 그룹
+REQUIRED_REGION_GROUPS = {
+    'title': ('productTitle',),
+    'description': ('feature-bullets', 'productDescription', 'aplus_feature_div', 'aplus', 'aplus-v2'),
+    'images': ('imageBlock', 'altImages', 'main-image-container', 'script:colorImages'),
+}
+
+_ID_RE = re.compile(
+    r'<([a-zA-Z][\w-]*)\b[^>]*?(?<![\w-])id\s*=\s*["\'](' + '|'.join(re.escape(i) for i in REGION_IDS) + r')["\']',
+    re.IGNORECASE
+)
+_SCRIPT_RE = re.compile(r'<script\b([^>]*)>(.*?)</script\s*>', re.IGNORECASE | re.DOTALL)
+
+# 파싱 방식 카운터 (지표용)
+parse_mode_counts: Counter = Counter()
+
+
+@dataclass
+class PageRegions:
+    """부분 파싱용 영역 추출 결과"""
+    html: str                                   # 영역만 모은 축약 문서
+    found: List[str] = field(default_factory=list)
+    missing_groups: List[str] = field(default_factory=list)
+    source_bytes: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing_groups
+
+
+@lru_cache(maxsize=64)
+def _balance_re(tag: str) -> 're.Pattern':
+    # 주석/스크립트/스타일 안의 태그 문자열은 건너뛰고 같은 이름의 태그만 센다
+    return re.compile(
+        r'(<!--.*?-->|<script\b.*?</script\s*>|<style\b.*?</style\s*>)|<(/?)' + re.escape(tag) + r'\b[^>]*>',
+        re.IGNORECASE | re.DOTALL
+    )
+
+
+def _element_end(html: str, start: int, tag: str) -> Optional[int]:
+    """start 위치의 여는 태그에 대응하는 닫는 태그 끝 위치 (짝이 없으면 None)"""
+    depth = 0
+    for match in _balance_re(tag).finditer(html, start):
+        if match.group(1):
+            continue
+        if match.group(2):
+            depth -= 1
+            if depth == 0:
+                return match.end()
+        elif not match.group(0).endswith('/>'):
+            depth += 1
+    return None
+
+
+def extract_regions(html: str) -> PageRegions:
+    """원본 HTML에서 필요한 영역만 문자열 수준으로 찾아 축약 문서 생성
+
+    id로 시작 태그를 찾고 같은 이름의 태그 깊이를 세어 끝을 정한다.
+    JSON-LD, colorImages, twister, 가격 a-state 스크립트는 그대로 포함한다.
+    """
+    spans: List[Tuple[int, int, str]] = []
+    script_spans: List[Tuple[int, int]] = []
+
+    for match in _SCRIPT_RE.finditer(html):
+        script_spans.append((match.start(), match.end()))
+        attrs, body = match.group(1), match.group(2)
+        if 'application/ld+json' in attrs:
+            spans.append((match.start(), match.end(), 'script:json-ld'))
+        elif 'colorImages' in body:
+            spans.append((match.start(), match.end(), 'script:colorImages'))
+        elif 'dimensionValuesDisplayData' in body:
+            spans.append((match.start(), match.end(), 'script:twister'))
+        elif 'a-state' in attrs and 'priceAmount' in body:
+            spans.append((match.start(), match.end(), 'script:a-state'))
+
+    script_starts = [start for start, _ in script_spans]
+    seen = set()
+    for match in _ID_RE.finditer(html):
+        region_id = match.group(2)
+        if region_id in seen:
+            continue
+        # 스크립트 문자열 안의 id="..."는 무시
+        index = bisect.bisect_right(script_starts, match.start()) - 1
+        if index >= 0 and script_spans[index][1] > match.start():
+            continue
+        end = _element_end(html, match.start(), match.group(1).lower())
+        if end is None:
+            continue
+        seen.add(region_id)
+        spans.append((match.start(), end, region_id))
+
+    # 문서 순서 유지, 다른 영역에 포함된 영역은 제외
+    spans.sort()
+    kept: List[Tuple[int, int, str]] = []
+    found = []
+    for start, end, name in spans:
+        found.append(name)
+        if kept and start < kept[-1][1]:
+            continue
+        kept.append((start, end, name))
+
+    missing = [group for group, names in REQUIRED_REGION_GROUPS.items() if not set(found).intersection(names)]
+
+    body = '\n'.join(html[start:end] for start, end, _ in kept)
+    return PageRegions(
+        html=f'<html><head><meta charset="utf-8"></head><body>\n{body}\n</body></html>',
+        found=found,
+        missing_groups=missing,
+        source_bytes=len(html)
+    )
+
+
+def record_parse_mode(mode: str) -> None:
+    """파싱 방식 기록 ('partial', 'full', 'full:<누락 영역>')"""
+    parse_mode_counts[mode] += 1
+
+
+def get_stats() -> Dict:
+    """부분 파싱 지표"""
+    return dict(parse_mode_counts)
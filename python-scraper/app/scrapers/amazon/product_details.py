@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from app.scrapers.amazon.page_context import PageContext
+from app.utils.units import normalize_text, parse_weight_g, parse_dimensions_cm
+
+
+# 登録情報 / 商品の情報 표 (th/td 형식)
+DETAIL_TABLE_ROW_SELECTORS = (
+    '#productDetails_techSpec_section_1 tr',
+    '#productDetails_detailBullets_sections1 tr',
+    '#productDetails_feature_div tr',
+    '#prodDetails tr',
+    '#productOverview_feature_div tr',
+)
+
+# 登録情報 목록 (굵은 라벨 + 값 span 형식)
+DETAIL_BULLET_SELECTOR = '#detailBullets_feature_div li'
+
+# 필드별 라벨 (우선순위 순, 상품 자체 값 → 포장 값)
+WEIGHT_LABELS = (
+    '商品の重量', '本体重量', '商品重量', '重量', 'Item Weight', 'Weight',
+    '商品の寸法', '製品サイズ', 'Product Dimensions',          # '10 x 5 x 3 cm; 200 g' 형식
+    '梱包重量', '発送重量', '梱包サイズ', 'Package Dimensions',
+)
+DIMENSION_LABELS = (
+    '商品の寸法', '製品サイズ', '本体サイズ', '本体寸法', 'Product Dimensions', 'Item Dimensions',
+    '梱包サイズ', 'Package Dimensions', '発送サイズ',
+)
+
+# 범위가 정해지지 않은 텍스트 검색을 할 때 사용할 상품 정보 영역
+PHYSICAL_SCOPE_SELECTORS = (
+    '#productDetails_feature_div', '#detailBullets_feature_div', '#prodDetails',
+    '#productOverview_feature_div', '#feature-bullets', '#productDescription',
+)
+
+
+@dataclass
+class PhysicalSpec:
+    """무게/치수 수치와 출처"""
+    weight_g: Optional[float] = None
+    dimensions_cm: Optional[Tuple[float, float, float]] = None
+    weight_source: Optional[str] = None        # 'details_table:<라벨>' | 'page_text'
+    dimensions_source: Optional[str] = None
+    dimensions_text: Optional[str] = None      # 수치로 바꿀 수 없는 치수 문자열 (2차원 등)
+
+
+def _clean_label(text: str) -> str:
+    # '梱包サイズ ‏ : ‎' → '梱包サイズ'
+    return normalize_text(text).rstrip(':： ').strip()
+
+
+def parse_product_details(ctx: PageContext) -> Dict[str, str]:
+    """登録情報 표/목록을 {라벨: 값} dict로 추출 (문서 순서, 같은 라벨은 처음 값 유지)"""
+    details: Dict[str, str] = {}
+
+    for selector in DETAIL_TABLE_ROW_SELECTORS:
+        for row in ctx.root.select(selector):
+            header = row.find('th')
+            value = row.find('td')
+            if header and value:
+                label = _clean_label(header.get_text(' ', strip=True))
+                if label:
+                    details.setdefault(label, normalize_text(value.get_text(' ', strip=True)))
+
+    for item in ctx.root.select(DETAIL_BULLET_SELECTOR):
+        label_element = item.find('span', class_='a-text-bold')
+        if not label_element:
+            continue
+        value_elements = label_element.find_next_siblings('span')
+        label = _clean_label(label_element.get_text(' ', strip=True))
+        if label and value_elements:
+            details.setdefault(label, normalize_text(value_elements[0].get_text(' ', strip=True)))
+
+    return details
+
+
+def physical_from_details(details: Dict[str, str]) -> PhysicalSpec:
+    """상세 표 라벨 우선순위에 따라 무게/치수 추출"""
+    spec = PhysicalSpec()
+
+    for label in WEIGHT_LABELS:
+        weight = parse_weight_g(details.get(label))
+        if weight is not None:
+            spec.weight_g = weight
+            spec.weight_source = f'details_table:{label}'
+            break
+
+    for label in DIMENSION_LABELS:
+        dimensions = parse_dimensions_cm(details.get(label))
+        if dimensions is not None:
+            spec.dimensions_cm = dimensions
+            spec.dimensions_source = f'details_table:{label}'
+            break
+
+    return spec
+
+
+def physical_scope_text(ctx: PageContext) -> str:
+    """텍스트 검색 fallback 범위 (상품 정보 영역, 없으면 페이지 전체)
+
+    리뷰/광고 영역의 '500gと軽い' 같은 값을 피하기 위해 상품 정보 영역이 하나라도 있으면
+    그 영역만 사용한다.
+    """
+    parts = []
+    for selector in PHYSICAL_SCOPE_SELECTORS:
+        element = ctx.root.select_one(selector)
+        if element:
+            parts.append(element.get_text(' ', strip=True))
+    return '\n'.join(parts) if parts else ctx.text
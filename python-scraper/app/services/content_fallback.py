@@ -0,0 +1,74 @@
+import logging
+import time
+from typing import Dict, Optional
+
+from app.config.settings import settings, ExtractFallbackSettings
+from app.core.parse_executor import ParseExecutor
+from app.utils.smart_extractor import SmartExtractor
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class ContentFallbackService:
+    """trafilatura 본문 추출 fallback (설명/특징을 모두 찾지 못한 상품 페이지용)
+
+    원본 응답 바이트를 그대로 넘겨 전용 워커 풀에서 실행하고, 시간 예산(task_timeout)을
+    넘기면 결과 없이 돌아온다. process 모드에서는 시간 초과된 워커 프로세스를 종료하므로
+    비정상적으로 느린 페이지가 풀을 계속 점유하지 못한다.
+    """
+
+    def __init__(self, config: Optional[ExtractFallbackSettings] = None):
+        self.config = config or settings.extract_fallback
+        self.executor = ParseExecutor(self.config, name='trafilatura', kill_on_timeout=True)
+        self.attempts = 0
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.failures = 0
+        self.total_ms = 0.0
+
+    async def extract(self, content: bytes, url: str, enabled: bool = True) -> Dict:
+        """원본 바이트에서 설명/특징 추출 (건너뛰거나 실패하면 빈 결과)"""
+        empty = {'description': None, 'features': []}
+        if not (enabled and self.config.enabled):
+            self.skipped += 1
+            return empty
+
+        self.attempts += 1
+        started = time.monotonic()
+        try:
+            result = await self.executor.run(SmartExtractor.extract_with_trafilatura, content, url)
+        except Exception as e:
+            self.failures += 1
+            logger.warning(f"⏱️ trafilatura fallback 실패: {e} ({url})")
+            return empty
+        finally:
+            self.total_ms += (time.monotonic() - started) * 1000
+
+        if result.get('description') or result.get('features'):
+            self.hits += 1
+        else:
+            self.misses += 1
+        return result
+
+    def shutdown(self) -> None:
+        self.executor.shutdown()
+
+    def get_stats(self) -> Dict:
+        return {
+            'enabled': self.config.enabled,
+            'time_budget': self.config.task_timeout,
+            'attempts': self.attempts,
+            'hits': self.hits,
+            'misses': self.misses,
+            'skipped': self.skipped,
+            'failures': self.failures,
+            'hit_rate': round(self.hits / self.attempts, 3) if self.attempts else 0.0,
+            'avg_ms': round(self.total_ms / self.attempts, 1) if self.attempts else 0.0,
+            'executor': self.executor.get_stats()
+        }
+
+
+# 전역 본문 추출 fallback 인스턴스
+content_fallback = ContentFallbackService()
@@ -0,0 +1,213 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.config.settings import settings, TranslationJobSettings
+from app.models.product import Product
+from app.services.translation_service import translation_service
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 번역하는 상품 필드
+TRANSLATED_FIELDS = ('name', 'category', 'description', 'features')
+
+
+@dataclass
+class TranslationJob:
+    """지연 번역 작업 1건"""
+    job_id: str
+    site: str
+    product_id: str
+    source: Dict                                # 번역 전 필드 값
+    created_at: float
+    status: str = 'pending'                     # pending | running | done | failed
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict] = None               # 번역된 필드 값
+    services_info: List[Dict] = field(default_factory=list)
+    error: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('done', 'failed')
+
+    def to_summary(self) -> Dict:
+        """스크래핑 응답에 넣는 작업 정보"""
+        return {'job_id': self.job_id, 'status': self.status}
+
+    def to_response(self) -> Dict:
+        """결과 조회 응답 (번역 완료 시 Laravel 형식 필드 포함)"""
+        response = {
+            'job_id': self.job_id,
+            'status': self.status,
+            'site': self.site,
+            'product_id': self.product_id,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at,
+            'elapsed_ms': round((self.finished_at - self.created_at) * 1000, 1) if self.finished_at else None,
+            'error': self.error
+        }
+        if self.result is not None:
+            data = dict(self.result)
+            data.update({f'original_{name}': self.source.get(name) for name in TRANSLATED_FIELDS})
+            response['data'] = data
+            response['translation_services'] = self.services_info
+        return response
+
+
+class TranslationJobManager:
+    """지연 번역 작업 관리 (asyncio 워커 풀 + 결과 보관)
+
+    스크래핑 응답은 원문 그대로 바로 돌려주고, 번역은 워커가 큐에서 꺼내 실행한다.
+    같은 상품의 같은 원문으로 진행 중이거나 완료된 작업이 있으면 그 작업을 재사용한다.
+    완료된 작업은 result_ttl 동안, 최대 max_jobs개까지 보관한다.
+    """
+
+    def __init__(self, config: Optional[TranslationJobSettings] = None):
+        self.config = config or settings.translation_jobs
+        self._jobs: "OrderedDict[str, TranslationJob]" = OrderedDict()
+        self._by_source: Dict[Tuple[str, str, str], str] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self.submitted = 0
+        self.reused = 0
+        self.completed = 0
+        self.failed = 0
+        self.total_ms = 0.0
+
+    def start(self) -> None:
+        """워커 시작 (이미 실행 중이면 아무 것도 하지 않음)"""
+        if self._workers and not all(worker.done() for worker in self._workers):
+            return
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.ensure_future(self._worker()) for _ in range(max(1, self.config.workers))
+        ]
+        # 이전 루프에서 남은 대기 작업 다시 등록
+        for job in self._jobs.values():
+            if not job.finished:
+                job.status = 'pending'
+                self._queue.put_nowait(job)
+        logger.info(f"🈂️ 지연 번역 워커 시작 (workers={len(self._workers)})")
+
+    async def shutdown(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    @staticmethod
+    def _source_digest(source: Dict) -> str:
+        payload = json.dumps(source, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def submit(self, site: str, product: Product) -> TranslationJob:
+        """상품 번역 작업 등록 (같은 원문 작업이 있으면 재사용)"""
+        self.start()
+        self._prune()
+
+        source = {name: getattr(product, name) for name in TRANSLATED_FIELDS}
+        source_key = (site, product.product_id, self._source_digest(source))
+        existing = self._jobs.get(self._by_source.get(source_key, ''))
+        if existing is not None and existing.status != 'failed':
+            self.reused += 1
+            return existing
+
+        job = TranslationJob(
+            job_id=uuid.uuid4().hex,
+            site=site,
+            product_id=product.product_id,
+            source=source,
+            created_at=time.time()
+        )
+        self._jobs[job.job_id] = job
+        self._by_source[source_key] = job.job_id
+        self._queue.put_nowait(job)
+        self.submitted += 1
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: TranslationJob) -> None:
+        job.status = 'running'
+        job.started_at = time.time()
+        try:
+            translated, services_info = await translation_service.translate_product_data_with_info(dict(job.source))
+            job.result = {name: translated.get(name) for name in TRANSLATED_FIELDS}
+            job.services_info = services_info
+            failed = next((info for info in services_info if info.get('service') == 'translation_failed'), None)
+            job.status = 'failed' if failed else 'done'
+            job.error = failed.get('error') if failed else None
+        except Exception as e:
+            job.status = 'failed'
+            job.error = str(e)
+            logger.error(f"❌ 지연 번역 실패 {job.site}/{job.product_id}: {e}")
+        finally:
+            job.finished_at = time.time()
+            if job.status == 'done':
+                self.completed += 1
+            else:
+                self.failed += 1
+            self.total_ms += (job.finished_at - job.started_at) * 1000
+            job.done.set()
+
+    async def get(self, job_id: str, wait: float = 0) -> Optional[TranslationJob]:
+        """작업 조회 (wait초 동안 완료를 기다림, 최대 max_wait)"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if wait > 0 and not job.finished:
+            try:
+                await asyncio.wait_for(asyncio.shield(job.done.wait()), min(wait, self.config.max_wait))
+            except asyncio.TimeoutError:
+                pass
+        return job
+
+    def _prune(self) -> None:
+        """보관 기간이 지난 완료 작업 제거, 그래도 많으면 오래된 완료 작업부터 제거"""
+        now = time.time()
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished and now - job.finished_at > self.config.result_ttl]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+        if len(self._jobs) >= self.config.max_jobs:
+            for job_id in [job_id for job_id, job in self._jobs.items() if job.finished]:
+                if len(self._jobs) < self.config.max_jobs:
+                    break
+                del self._jobs[job_id]
+
+        if expired or len(self._by_source) > len(self._jobs):
+            self._by_source = {key: job_id for key, job_id in self._by_source.items() if job_id in self._jobs}
+
+    def get_stats(self) -> Dict:
+        finished = self.completed + self.failed
+        return {
+            'workers': len(self._workers),
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'running': sum(1 for job in self._jobs.values() if job.status == 'running'),
+            'stored_jobs': len(self._jobs),
+            'submitted': self.submitted,
+            'reused': self.reused,
+            'completed': self.completed,
+            'failed': self.failed,
+            'avg_ms': round(self.total_ms / finished, 1) if finished else 0.0
+        }
+
+
+# 전역 지연 번역 작업 관리자
+translation_jobs = TranslationJobManager()
@@ -0,0 +1,264 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.config.settings import settings, TranslationMemorySettings
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def normalize_source(text: str) -> str:
+    """번역 메모리 키용 원문 정규화 (NFKC + 공백 정리)
+
+    전각/반각 차이나 줄바꿈/공백 차이만 있는 원문은 같은 항목으로 취급한다.
+    """
+    return re.sub(r'\s+', ' ', unicodedata.normalize('NFKC', text)).strip()
+
+
+class TranslationMemory:
+    """번역 메모리 (2단계: 메모리 LRU → SQLite 영구 저장)
+
+    - 키: (원문 언어, 번역 언어, 정규화된 원문)
+    - 메모리 LRU에 없으면 SQLite에서 찾아 LRU로 올림
+    - SQLite 항목 수가 max_entries를 넘으면 오래 사용하지 않은 항목부터 제거
+    - 모든 디스크 I/O는 asyncio.to_thread로 이벤트 루프 밖에서 수행
+    """
+
+    # 이 횟수만큼 저장할 때마다 SQLite 항목 수 상한 확인
+    EVICT_CHECK_INTERVAL = 1000
+
+    def __init__(self, config: Optional[TranslationMemorySettings] = None):
+        self.config = config or settings.translation_memory
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._writes_since_evict = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.imported = 0
+        self.evictions = 0
+        self.errors = 0
+
+    @staticmethod
+    def _key(text: str, source_lang: str, target_lang: str) -> str:
+        return hashlib.sha256(f"{source_lang}\x1f{target_lang}\x1f{text}".encode('utf-8')).hexdigest()
+
+    def _remember(self, key: str, translated: str) -> None:
+        self._memory[key] = translated
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.config.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ----- 동기 구현 (워커 스레드에서 실행) -----
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.config.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.config.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS translations ('
+                ' key TEXT PRIMARY KEY, source_lang TEXT NOT NULL, target_lang TEXT NOT NULL,'
+                ' source_text TEXT NOT NULL, translated_text TEXT NOT NULL, provider TEXT,'
+                ' created_at REAL NOT NULL, used_at REAL NOT NULL)'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_translations_used ON translations (used_at)')
+            self._conn = conn
+        return self._conn
+
+    def _get_sync(self, key: str) -> Optional[str]:
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute('SELECT translated_text FROM translations WHERE key = ?', (key,)).fetchone()
+            if not row:
+                return None
+            conn.execute('UPDATE translations SET used_at = ? WHERE key = ?', (time.time(), key))
+            conn.commit()
+            return row[0]
+
+    def _put_many_sync(self, rows: List[Tuple], overwrite: bool = True) -> int:
+        verb = 'INSERT OR REPLACE' if overwrite else 'INSERT OR IGNORE'
+        with self._lock:
+            conn = self._connect()
+            before = conn.total_changes
+            conn.executemany(
+                f'{verb} INTO translations'
+                ' (key, source_lang, target_lang, source_text, translated_text, provider, created_at, used_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            written = conn.total_changes - before
+            self._writes_since_evict += written
+            if self._writes_since_evict >= self.EVICT_CHECK_INTERVAL:
+                self._evict(conn)
+                self._writes_since_evict = 0
+            conn.commit()
+            return written
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """항목 수 상한 초과 시 가장 오래 사용하지 않은 항목부터 제거 (상한의 90%까지)"""
+        total = conn.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        if total <= self.config.max_entries:
+            return
+        excess = total - int(self.config.max_entries * 0.9)
+        conn.execute(
+            'DELETE FROM translations WHERE key IN (SELECT key FROM translations ORDER BY used_at ASC LIMIT ?)',
+            (excess,)
+        )
+        self.evictions += excess
+
+    def _export_sync(self, source_lang: Optional[str], target_lang: Optional[str]) -> List[Dict]:
+        query = 'SELECT source_lang, target_lang, source_text, translated_text, provider, created_at FROM translations'
+        conditions, params = [], []
+        if source_lang:
+            conditions.append('source_lang = ?')
+            params.append(source_lang)
+        if target_lang:
+            conditions.append('target_lang = ?')
+            params.append(target_lang)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        with self._lock:
+            rows = self._connect().execute(query + ' ORDER BY created_at', params).fetchall()
+        return [
+            {'source_lang': row[0], 'target_lang': row[1], 'source_text': row[2],
+             'translated_text': row[3], 'provider': row[4], 'created_at': row[5]}
+            for row in rows
+        ]
+
+    def _summary_sync(self) -> Dict:
+        with self._lock:
+            row = self._connect().execute('SELECT COUNT(*) FROM translations').fetchone()
+            return {'disk_entries': row[0]}
+
+    def _close_sync(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ----- 비동기 API -----
+
+    async def get(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """저장된 번역 조회 (없으면 None)"""
+        if not self.config.enabled or not text:
+            return None
+        key = self._key(normalize_source(text), source_lang, target_lang)
+
+        translated = self._memory.get(key)
+        if translated is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return translated
+
+        try:
+            translated = await asyncio.to_thread(self._get_sync, key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"번역 메모리 조회 실패: {e}")
+            return None
+
+        if translated is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        self._remember(key, translated)
+        return translated
+
+    async def put(self, text: str, translated: str, source_lang: str, target_lang: str,
+                  provider: Optional[str] = None) -> None:
+        """번역 결과 저장"""
+        if not self.config.enabled or not text or not translated:
+            return
+        source_text = normalize_source(text)
+        key = self._key(source_text, source_lang, target_lang)
+        self._remember(key, translated)
+
+        now = time.time()
+        try:
+            await asyncio.to_thread(
+                self._put_many_sync, [(key, source_lang, target_lang, source_text, translated, provider, now, now)]
+            )
+            self.writes += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"번역 메모리 저장 실패: {e}")
+
+    async def export_entries(self, source_lang: Optional[str] = None,
+                             target_lang: Optional[str] = None) -> List[Dict]:
+        """저장된 번역 전체 내보내기 (언어 필터 선택)"""
+        return await asyncio.to_thread(self._export_sync, source_lang, target_lang)
+
+    async def import_entries(self, entries: Iterable[Dict], overwrite: bool = True) -> int:
+        """번역 일괄 가져오기 (export_entries 형식), 저장한 항목 수 반환
+
+        overwrite=False면 이미 있는 항목은 유지한다.
+        """
+        now = time.time()
+        rows = []
+        for entry in entries:
+            source_text = normalize_source(entry.get('source_text') or '')
+            translated = entry.get('translated_text')
+            source_lang = entry.get('source_lang') or 'ja'
+            target_lang = entry.get('target_lang') or 'ko'
+            if not source_text or not translated:
+                continue
+            key = self._key(source_text, source_lang, target_lang)
+            created_at = entry.get('created_at') or now
+            rows.append((key, source_lang, target_lang, source_text, translated, entry.get('provider'), created_at, now))
+            if overwrite:
+                self._memory.pop(key, None)
+
+        if not rows:
+            return 0
+        written = await asyncio.to_thread(self._put_many_sync, rows, overwrite)
+        self.imported += written
+        logger.info(f"📥 번역 메모리 가져오기: {written}/{len(rows)}개 저장")
+        return written
+
+    def clear_memory(self) -> None:
+        """메모리 LRU만 비움 (SQLite 항목은 유지)"""
+        self._memory.clear()
+
+    async def close(self) -> None:
+        await asyncio.to_thread(self._close_sync)
+
+    async def get_stats(self) -> Dict:
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        stats = {
+            'enabled': self.config.enabled,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': round((self.memory_hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            'writes': self.writes,
+            'imported': self.imported,
+            'evictions': self.evictions,
+            'errors': self.errors,
+            'memory_entries': len(self._memory),
+            'memory_capacity': self.config.memory_entries,
+            'max_entries': self.config.max_entries
+        }
+        if self.config.enabled:
+            try:
+                stats.update(await asyncio.to_thread(self._summary_sync))
+            except Exception as e:
+                stats['error'] = str(e)
+        return stats
+
+
+# 전역 번역 메모리 인스턴스
+translation_memory = TranslationMemory()
@@ -0,0 +1,213 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from app.config.settings import settings, TranslationSettings
+from app.core.http_client import http_client_manager
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 번역 응답 조각 (번역문, 해당 원문) - 원문 길이로 묶음 요청의 텍스트 경계를 찾는다
+TranslationParts = List[Tuple[str, str]]
+
+
+class ProviderMetrics:
+    """제공자별 요청 지연/오류 지표 (최근 성공 요청 지연 표본으로 p50/p95 계산)"""
+
+    def __init__(self, samples: int):
+        self._latencies = deque(maxlen=max(1, samples))
+        self.requests = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.total_ms = 0.0
+
+    @property
+    def sample_count(self) -> int:
+        return len(self._latencies)
+
+    def record(self, elapsed: float, ok: bool) -> None:
+        self.requests += 1
+        if ok:
+            self._latencies.append(elapsed)
+            self.total_ms += elapsed * 1000
+        else:
+            self.errors += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """최근 성공 요청 지연의 q 분위수 (초, 표본이 없으면 None)"""
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def to_dict(self) -> Dict:
+        succeeded = self.requests - self.errors
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'error_rate': round(self.errors / self.requests, 3) if self.requests else 0.0,
+            'cancelled': self.cancelled,
+            'hedged': self.hedged,
+            'hedge_wins': self.hedge_wins,
+            'avg_ms': round(self.total_ms / succeeded, 1) if succeeded else 0.0,
+            'p50_ms': round(p50 * 1000, 1) if p50 is not None else None,
+            'p95_ms': round(p95 * 1000, 1) if p95 is not None else None
+        }
+
+
+class TranslationProvider:
+    """번역 제공자 기본 클래스
+
+    하위 클래스는 _send(요청 1건)만 구현한다. translate는 지표를 기록하고, 헤징이 켜져 있으면
+    첫 요청이 최근 p95 지연 안에 끝나지 않을 때 같은 요청을 한 번 더 보내 먼저 성공한 응답을 쓴다.
+    """
+
+    name = 'base'
+    persist_results = True      # 번역 메모리에 저장할지 (stub 결과는 저장하지 않음)
+
+    def __init__(self, config: Optional[TranslationSettings] = None):
+        self.config = config or settings.translation
+        self.metrics = ProviderMetrics(self.config.latency_samples)
+
+    async def _send(self, text: str, target_lang: str, source_lang: str) -> Optional[TranslationParts]:
+        """요청 1건 (실패 응답이면 None, 네트워크 오류는 예외)"""
+        raise NotImplementedError
+
+    async def _attempt(self, text: str, target_lang: str, source_lang: str) -> Optional[TranslationParts]:
+        started = time.monotonic()
+        try:
+            parts = await self._send(text, target_lang, source_lang)
+        except asyncio.CancelledError:
+            self.metrics.cancelled += 1
+            raise
+        except Exception:
+            self.metrics.record(time.monotonic() - started, ok=False)
+            raise
+        self.metrics.record(time.monotonic() - started, ok=parts is not None)
+        return parts
+
+    def hedge_delay(self) -> Optional[float]:
+        """2차 요청을 보내기까지 기다릴 시간 (헤징 꺼짐이면 None)"""
+        if not self.config.hedge_enabled:
+            return None
+        if self.metrics.sample_count < self.config.hedge_min_samples:
+            return self.config.hedge_initial_delay
+        return max(self.config.hedge_min_delay, self.metrics.percentile(0.95))
+
+    async def translate(self, text: str, target_lang: str, source_lang: str) -> Optional[TranslationParts]:
+        """번역 요청 (헤징 적용), 응답 조각 목록 반환 (실패시 None 또는 예외)"""
+        delay = self.hedge_delay()
+        if delay is None:
+            return await self._attempt(text, target_lang, source_lang)
+
+        first = asyncio.ensure_future(self._attempt(text, target_lang, source_lang))
+        tasks = [first]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return first.result()
+
+            self.metrics.hedged += 1
+            logger.info(f"⏱️ {self.name} 번역 응답 지연 ({delay * 1000:.0f}ms 초과) - 2차 요청 병행")
+            hedge = asyncio.ensure_future(self._attempt(text, target_lang, source_lang))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result() is not None:
+                        if task is hedge:
+                            self.metrics.hedge_wins += 1
+                        return task.result()
+
+            # 두 요청 모두 실패하면 첫 요청 결과를 그대로 전달
+            return first.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def get_stats(self) -> Dict:
+        delay = self.hedge_delay()
+        return {
+            'provider': self.name,
+            'hedge_enabled': self.config.hedge_enabled,
+            'hedge_delay_ms': round(delay * 1000, 1) if delay is not None else None,
+            **self.metrics.to_dict()
+        }
+
+
+class GoogleTranslateProvider(TranslationProvider):
+    """Google Translate (translate.googleapis.com) 제공자"""
+
+    name = 'google'
+    api_url = "https://translate.googleapis.com/translate_a/single"
+
+    async def _send(self, text: str, target_lang: str, source_lang: str) -> Optional[TranslationParts]:
+        response = await http_client_manager.get(
+            self.api_url,
+            params={
+                'client': 'gtx',
+                'sl': source_lang,
+                'tl': target_lang,
+                'dt': 't',
+                'q': text
+            },
+            timeout=self.config.timeout
+        )
+
+        if response.status_code != 200:
+            logger.error(f"❌ Google API 오류: {response.status_code}")
+            return None
+        # 응답 형식: [[[번역문, 원문, ...], ...], ...]
+        return [
+            (part[0] or '', part[1])
+            for part in response.json()[0] or []
+            if isinstance(part, list) and len(part) >= 2 and isinstance(part[1], str)
+        ]
+
+
+class StubTranslateProvider(TranslationProvider):
+    """외부 요청 없이 결정적으로 번역하는 제공자 (오프라인 벤치마크/테스트용)
+
+    줄 단위로 '[대상 언어] 원문' 형태의 번역문을 돌려준다. TRANSLATION_STUB_LATENCY_MS로
+    응답 지연을 흉내 낼 수 있다.
+    """
+
+    name = 'stub'
+    persist_results = False
+
+    async def _send(self, text: str, target_lang: str, source_lang: str) -> Optional[TranslationParts]:
+        if self.config.stub_latency_ms > 0:
+            await asyncio.sleep(self.config.stub_latency_ms / 1000)
+
+        lines = text.split('\n')
+        parts: TranslationParts = []
+        for index, line in enumerate(lines):
+            newline = '\n' if index < len(lines) - 1 else ''
+            translated = f'[{target_lang}] {line}' if line.strip() else ''
+            parts.append((translated + newline, line + newline))
+        return parts
+
+
+# 설정값(TRANSLATION_PROVIDER) → 제공자 클래스
+PROVIDERS = {
+    GoogleTranslateProvider.name: GoogleTranslateProvider,
+    StubTranslateProvider.name: StubTranslateProvider,
+}
+
+
+def create_provider(config: Optional[TranslationSettings] = None) -> TranslationProvider:
+    """설정에 맞는 번역 제공자 생성 (알 수 없는 값이면 Google)"""
+    config = config or settings.translation
+    provider_class = PROVIDERS.get(config.provider.strip().lower())
+    if provider_class is None:
+        logger.warning(f"⚠️ 알 수 없는 번역 제공자 '{config.provider}' - Google Translate를 사용합니다")
+        provider_class = GoogleTranslateProvider
+    return provider_class(config)
@@ -1,8 +1,14 @@
 import asyncio
 import logging
-import httpx
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 from dataclasses import dataclass
+from urllib.parse import quote
+
+from app.config.settings import settings, TranslationSettings
+from app.services.translation_memory import translation_memory
+from app.services.translation_providers import TranslationParts, TranslationProvider, create_provider
+from app.utils.html_text import HtmlTextDocument
+from app.utils.text_segments import SegmentedText
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -18,98 +24,305 @@ class TranslationResult:
     success: bool
     error_message: Optional[str] = None
 
-class GoogleTranslationService:
-    """Google Translate 기반 번역 서비스"""
+class BatchTranslationService:
+    """번역 제공자 앞단의 일괄 번역 (번역 메모리 + 묶음 요청 + 동시 요청 수 제한)"""
     
-    def __init__(self):
-        logger.info("🌐 Google Translate 번역 서비스 초기화 완료")
+    # 묶음 요청에서 텍스트 사이 구분자 (Google은 줄바꿈에서 항상 문장을 나눔)
+    batch_separator = '\n'
+    
+    def __init__(self, config: Optional[TranslationSettings] = None, provider: Optional[TranslationProvider] = None):
+        self.config = config or settings.translation
+        self.provider = provider or create_provider(self.config)
+        self._semaphore = asyncio.Semaphore(max(1, self.config.concurrency))
+        self.requests = 0
+        self.batch_requests = 0
+        self.batch_segments = 0
+        self.split_fallbacks = 0
+        logger.info(f"🌐 번역 제공자 초기화 완료: {self.provider.name}")
+    
+    def _result(self, text: str, translated: Optional[str], source_lang: str, target_lang: str,
+                service: Optional[str] = None) -> TranslationResult:
+        """번역 결과 생성 (번역 실패시 원문 반환)"""
+        return TranslationResult(
+            original_text=text,
+            translated_text=translated if translated is not None else text,
+            source_language=source_lang,
+            target_language=target_lang,
+            service_used=service or self.provider.name,
+            success=translated is not None,
+            error_message=None if translated is not None else f"{self.provider.name} 번역 실패"
+        )
+    
+    async def _request(self, text: str, target_lang: str, source_lang: str) -> Optional[TranslationParts]:
+        """제공자 1회 호출 (동시 요청 수 제한), 응답 조각 목록 반환 (실패시 None)"""
+        async with self._semaphore:
+            self.requests += 1
+            return await self.provider.translate(text, target_lang, source_lang)
+    
+    async def _remember(self, text: str, translated: str, source_lang: str, target_lang: str) -> None:
+        if self.provider.persist_results:
+            await translation_memory.put(text, translated, source_lang, target_lang, provider=self.provider.name)
+    
+    async def _translate_one(self, text: str, target_lang: str, source_lang: str) -> Optional[str]:
+        """번역 메모리를 거치지 않는 단건 번역 (실패시 None)"""
+        try:
+            parts = await self._request(text, target_lang, source_lang)
+        except Exception as e:
+            logger.error(f"❌ {self.provider.name} 번역 실패: {str(e)}")
+            return None
+        if parts is None:
+            return None
+        return ''.join([translated for translated, _ in parts if translated])
     
     async def translate_text(self, text: str, target_lang: str = 'ko', source_lang: str = 'ja') -> TranslationResult:
         """텍스트 번역"""
         if not text or not text.strip():
-            return TranslationResult(
-                original_text=text,
-                translated_text=text,
-                source_language=source_lang,
-                target_language=target_lang,
-                service_used="google",
-                success=True
-            )
+            return self._result(text, text, source_lang, target_lang)
+        
+        # 번역 메모리에 같은 원문이 있으면 API 호출 없이 사용
+        cached = await translation_memory.get(text, source_lang, target_lang)
+        if cached is not None:
+            logger.info(f"💾 번역 메모리 사용: '{text[:50]}...'")
+            return self._result(text, cached, source_lang, target_lang, service="memory")
+        
+        logger.info(f"🔄 {self.provider.name}로 번역 중: '{text[:50]}...'")
+        translated = await self._translate_one(text, target_lang, source_lang)
         
+        if translated is not None:
+            logger.info(f"✅ {self.provider.name} 번역 성공:")
+            logger.info(f"   원문: '{text[:100]}...' " if len(text) > 100 else f"   원문: '{text}'")
+            logger.info(f"   번역: '{translated[:100]}...' " if len(translated) > 100 else f"   번역: '{translated}'")
+            await self._remember(text, translated, source_lang, target_lang)
+        
+        return self._result(text, translated, source_lang, target_lang)
+    
+    def _pack(self, texts: List[str]) -> List[List[str]]:
+        """요청 크기 한도(URL 인코딩 기준)와 텍스트 수 한도 안에서 텍스트 묶기 (한도보다 큰 텍스트는 단독 요청)"""
+        separator_size = len(quote(self.batch_separator))
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        chunk_size = 0
+        for text in texts:
+            size = len(quote(text))
+            if chunk and (chunk_size + separator_size + size > self.config.batch_max_bytes
+                          or len(chunk) >= self.config.batch_max_segments):
+                chunks.append(chunk)
+                chunk, chunk_size = [], 0
+            chunk_size += size + (separator_size if chunk else 0)
+            chunk.append(text)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+    
+    @staticmethod
+    def _split_parts(parts: TranslationParts, segments: List[str], separator: str) -> Optional[List[str]]:
+        """묶음 응답의 문장 조각을 원문 위치 기준으로 텍스트별 번역으로 되돌림
+        
+        각 조각의 원문 길이를 누적해 어느 텍스트에 속하는지 판단한다. 조각이 텍스트
+        경계를 넘거나, 원문 길이 합이 요청과 다르거나, 번역이 빈 텍스트가 있으면 None.
+        """
+        ends = []
+        offset = 0
+        for index, segment in enumerate(segments):
+            offset += len(segment) + (len(separator) if index < len(segments) - 1 else 0)
+            ends.append(offset)
+        
+        pieces: List[List[str]] = [[] for _ in segments]
+        position = 0
+        index = 0
+        for translated, original in parts or []:
+            start = position
+            position += len(original)
+            while index < len(ends) - 1 and start >= ends[index]:
+                index += 1
+            if position > ends[index]:
+                return None
+            if translated:
+                pieces[index].append(translated)
+        
+        if position != ends[-1]:
+            return None
+        translations = [''.join(piece).strip() for piece in pieces]
+        if not all(translations):
+            return None
+        return translations
+    
+    async def _translate_chunk(self, chunk: List[str], target_lang: str, source_lang: str) -> List[Optional[str]]:
+        """텍스트 묶음을 요청 1건으로 번역 (되돌릴 수 없으면 개별 요청으로 재시도)"""
+        if len(chunk) == 1:
+            return [await self._translate_one(chunk[0], target_lang, source_lang)]
+        
+        self.batch_requests += 1
+        self.batch_segments += len(chunk)
         try:
-            logger.info(f"🔄 Google로 번역 중: '{text[:50]}...'")
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://translate.googleapis.com/translate_a/single",
-                    params={
-                        'client': 'gtx',
-                        'sl': source_lang,
-                        'tl': target_lang,
-                        'dt': 't',
-                        'q': text
-                    },
-                    timeout=15
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    translated = ''.join([part[0] for part in result[0] if part[0]])
-                    
-                    logger.info(f"✅ Google 번역 성공:")
-                    logger.info(f"   원문: '{text[:100]}...' " if len(text) > 100 else f"   원문: '{text}'")
-                    logger.info(f"   번역: '{translated[:100]}...' " if len(translated) > 100 else f"   번역: '{translated}'")
-                    
-                    return TranslationResult(
-                        original_text=text,
-                        translated_text=translated,
-                        source_language=source_lang,
-                        target_language=target_lang,
-                        service_used="google",
-                        success=True
-                    )
-                else:
-                    logger.error(f"❌ Google API 오류: {response.status_code}")
-                    
+            parts = await self._request(self.batch_separator.join(chunk), target_lang, source_lang)
         except Exception as e:
-            logger.error(f"❌ Google 번역 실패: {str(e)}")
+            logger.error(f"❌ {self.provider.name} 묶음 번역 실패: {str(e)}")
+            parts = None
         
-        # 번역 실패시 원문 반환
-        return TranslationResult(
-            original_text=text,
-            translated_text=text,
-            source_language=source_lang,
-            target_language=target_lang,
-            service_used="google",
-            success=False,
-            error_message="Google 번역 실패"
-        )
+        translations = self._split_parts(parts, chunk, self.batch_separator) if parts is not None else None
+        if translations is None:
+            self.split_fallbacks += 1
+            logger.warning(f"⚠️ 묶음 번역 결과를 나눌 수 없어 {len(chunk)}개 개별 번역으로 재시도")
+            return list(await asyncio.gather(*(self._translate_one(text, target_lang, source_lang) for text in chunk)))
+        return translations
     
-    async def translate_list(self, texts: List[str], target_lang: str = 'ko', source_lang: str = 'ja') -> List[str]:
-        """텍스트 리스트 번역 (개별 번역)"""
-        if not texts:
-            return []
+    async def translate_batch(self, texts: List[str], target_lang: str = 'ko', source_lang: str = 'ja') -> List[TranslationResult]:
+        """여러 텍스트 일괄 번역 (입력 순서대로 결과 반환)
         
-        logger.info(f"🔄 Google로 {len(texts)}개 항목 개별 번역 중...")
-        
-        results = []
+        번역 메모리에 없는 원문만 중복 없이 모아 요청 크기 한도 안에서 줄바꿈으로 이어 보내고,
+        응답을 텍스트별로 되돌린다. 묶음 요청들은 동시 요청 수 제한 안에서 함께 실행한다.
+        """
+        results: List[Optional[TranslationResult]] = [None] * len(texts)
+        positions: Dict[str, List[int]] = {}
         for i, text in enumerate(texts):
-            if text and text.strip():
-                result = await self.translate_text(text.strip(), target_lang, source_lang)
-                results.append(result.translated_text if result.success else text)
-                logger.info(f"   {i+1}/{len(texts)} 완료")
+            if not text or not text.strip():
+                results[i] = self._result(text, text, source_lang, target_lang)
             else:
-                results.append(text)
+                positions.setdefault(text, []).append(i)
+        
+        unique = list(positions)
+        cached = await asyncio.gather(*(translation_memory.get(text, source_lang, target_lang) for text in unique))
+        missing = []
+        for text, translated in zip(unique, cached):
+            if translated is None:
+                missing.append(text)
+                continue
+            for i in positions[text]:
+                results[i] = self._result(text, translated, source_lang, target_lang, service="memory")
+        
+        if missing:
+            chunks = self._pack(missing)
+            logger.info(f"🔄 {self.provider.name}로 {len(missing)}개 항목 번역 중 (요청 {len(chunks)}건, 메모리 사용 {len(unique) - len(missing)}건)")
+            translated_chunks = await asyncio.gather(
+                *(self._translate_chunk(chunk, target_lang, source_lang) for chunk in chunks)
+            )
+            stores = []
+            for chunk, translations in zip(chunks, translated_chunks):
+                for text, translated in zip(chunk, translations):
+                    for i in positions[text]:
+                        results[i] = self._result(text, translated, source_lang, target_lang)
+                    if translated is not None:
+                        stores.append(self._remember(text, translated, source_lang, target_lang))
+            await asyncio.gather(*stores)
         
-        logger.info(f"✅ Google 개별 번역 완료: {len(results)}개 항목")
         return results
+    
+    async def translate_list(self, texts: List[str], target_lang: str = 'ko', source_lang: str = 'ja') -> List[str]:
+        """텍스트 리스트 번역 (일괄 번역)"""
+        if not texts:
+            return []
+        
+        stripped = [text.strip() if text and text.strip() else text for text in texts]
+        results = await self.translate_batch(stripped, target_lang, source_lang)
+        logger.info(f"✅ {self.provider.name} 일괄 번역 완료: {len(results)}개 항목")
+        return [result.translated_text if result.success else text for result, text in zip(results, texts)]
+    
+    def get_stats(self) -> Dict:
+        return {
+            'requests': self.requests,
+            'batch_requests': self.batch_requests,
+            'batch_segments': self.batch_segments,
+            'split_fallbacks': self.split_fallbacks,
+            'concurrency': self.config.concurrency,
+            'batch_max_bytes': self.config.batch_max_bytes,
+            'provider': self.provider.get_stats()
+        }
 
 class TranslationService:
-    """Google Translate 전용 번역 서비스"""
+    """상품 번역 서비스 (제공자는 TRANSLATION_PROVIDER로 선택, 기본 Google Translate)"""
     
     def __init__(self):
-        self.google_service = GoogleTranslationService()
-        logger.info("🚀 번역 서비스 초기화 완료 (Google Translate)")
+        self.batch_service = BatchTranslationService()
+        self.description_html_chars = 0
+        self.description_text_chars = 0
+        self.description_sent_chars = 0
+        self.segment_naive_chars = 0
+        self.segment_sent_chars = 0
+        self.segment_protected_chars = 0
+        self.segment_duplicate_chars = 0
+        logger.info(f"🚀 번역 서비스 초기화 완료 ({self.batch_service.provider.name})")
+    
+    def _description_report(self, document: HtmlTextDocument, results: List[TranslationResult]) -> Dict:
+        """설명 HTML 크기 대비 실제 번역 요청한 텍스트 크기"""
+        services = {}
+        for result in results:
+            services[result.original_text] = result.service_used
+        text_chars = sum(len(text) for text in services)
+        sent_chars = sum(len(text) for text, service in services.items() if service != "memory")
+        
+        self.description_html_chars += document.source_chars
+        self.description_text_chars += text_chars
+        self.description_sent_chars += sent_chars
+        return {
+            'html_chars': document.source_chars,
+            'text_nodes': len(document.texts),
+            'unique_texts': len(services),
+            'text_chars': text_chars,
+            'sent_chars': sent_chars
+        }
+    
+    def _segment_report(self, texts: List[str], results: List[TranslationResult]) -> Dict:
+        """원문 전체를 그대로 보내는 번역 대비 절감한 글자 수
+        
+        naive_chars(원문 전체) = protected_chars(보호 구간/경계) + duplicate_chars(중복 구간)
+        + memory_chars(번역 메모리 사용) + sent_chars(실제 API 전송)
+        """
+        services = {}
+        for result in results:
+            services[result.original_text] = result.service_used
+        naive_chars = sum(len(text) for text in texts)
+        segment_chars = sum(len(result.original_text) for result in results)
+        unique_chars = sum(len(text) for text in services)
+        memory_chars = sum(len(text) for text, service in services.items() if service == "memory")
+        sent_chars = unique_chars - memory_chars
+        
+        self.segment_naive_chars += naive_chars
+        self.segment_sent_chars += sent_chars
+        self.segment_protected_chars += naive_chars - segment_chars
+        self.segment_duplicate_chars += segment_chars - unique_chars
+        return {
+            'segments': len(results),
+            'unique_segments': len(services),
+            'naive_chars': naive_chars,
+            'protected_chars': naive_chars - segment_chars,
+            'duplicate_chars': segment_chars - unique_chars,
+            'memory_chars': memory_chars,
+            'sent_chars': sent_chars,
+            'saved_chars': naive_chars - sent_chars,
+            'saved_ratio': round((naive_chars - sent_chars) / naive_chars, 3) if naive_chars else 0.0
+        }
+    
+    async def _translate_segmented(self, texts: List[str]) -> Tuple[List[str], List[List[TranslationResult]], Dict]:
+        """텍스트 목록 번역 (구간 분리 → 번역 구간만 중복 없이 일괄 번역 → 다시 조립)
+        
+        모델번호/수치+단위/영문 브랜드 같은 보호 구간은 보내지 않고, 같은 구간은 모든 텍스트를
+        통틀어 한 번만 번역한다. TRANSLATION_SEGMENTATION=false면 텍스트 전체를 그대로 번역한다.
+        
+        Returns:
+            Tuple[텍스트별 번역문, 텍스트별 구간 번역 결과, 절감 리포트]
+        """
+        documents = None
+        if self.batch_service.config.segmentation:
+            documents = [SegmentedText.parse(text) for text in texts]
+            segment_lists = [document.texts for document in documents]
+        else:
+            segment_lists = [[text] for text in texts]
+        
+        segments = [segment for segment_list in segment_lists for segment in segment_list]
+        results = await self.batch_service.translate_batch(segments) if segments else []
+        
+        translations: List[str] = []
+        grouped: List[List[TranslationResult]] = []
+        position = 0
+        for index, segment_list in enumerate(segment_lists):
+            text_results = results[position:position + len(segment_list)]
+            position += len(segment_list)
+            grouped.append(text_results)
+            translated = [result.translated_text for result in text_results]
+            translations.append(documents[index].render(translated) if documents is not None else translated[0])
+        
+        return translations, grouped, self._segment_report(texts, results)
     
     async def translate_product_name(self, name: str) -> str:
         """상품명 번역"""
@@ -117,8 +330,8 @@ class TranslationService:
             return name
         
         logger.info("📦 상품명 번역 시작")
-        result = await self.google_service.translate_text(name.strip())
-        return result.translated_text if result.success else name
+        translations, _, _ = await self._translate_segmented([name.strip()])
+        return translations[0]
     
     async def translate_category(self, category: str) -> str:
         """카테고리 번역"""
@@ -126,8 +339,8 @@ class TranslationService:
             return category
         
         logger.info("🏷️ 카테고리 번역 시작")
-        result = await self.google_service.translate_text(category.strip())
-        return result.translated_text if result.success else category
+        translations, _, _ = await self._translate_segmented([category.strip()])
+        return translations[0]
     
     async def translate_description(self, description: str) -> str:
         """상품 설명 번역"""
@@ -135,8 +348,19 @@ class TranslationService:
             return description
         
         logger.info("📄 상품 설명 번역 시작")
-        result = await self.google_service.translate_text(description.strip())
-        return result.translated_text if result.success else description
+        translated, _ = await self.translate_description_html(description)
+        return translated
+    
+    async def translate_description_html(self, description: str) -> tuple[str, Dict]:
+        """상품 설명 HTML 번역 (텍스트 노드만 번역하고 태그/속성은 그대로 유지)
+        
+        Returns:
+            Tuple[번역된 HTML, 크기 리포트]
+        """
+        document = HtmlTextDocument.parse(description)
+        translations, grouped, _ = await self._translate_segmented(document.texts)
+        results = [result for text_results in grouped for result in text_results]
+        return document.render(translations), self._description_report(document, results)
     
     async def translate_features(self, features: List[str]) -> List[str]:
         """상품 특징 리스트 번역"""
@@ -149,61 +373,120 @@ class TranslationService:
         if not non_empty_features:
             return features
         
-        # 개별 번역 사용
-        translated_features = await self.google_service.translate_list(non_empty_features)
+        translated_features, _, _ = await self._translate_segmented(non_empty_features)
         return translated_features
     
+    def _field_status(self, results: List[TranslationResult]) -> Dict:
+        """필드 번역에 사용한 서비스 (구간 일부/전체가 실패해 원문으로 남았으면 partial/translation_failed)"""
+        if not results:
+            return {"service": "protected"}
+        failed = [result for result in results if not result.success]
+        if failed:
+            return {
+                "service": "translation_failed" if len(failed) == len(results) else "partial",
+                "failed_segments": len(failed),
+                "error": failed[0].error_message
+            }
+        if all(result.service_used == "memory" for result in results):
+            return {"service": "memory"}
+        return {"service": self.batch_service.provider.name}
+    
     async def translate_product_data_with_info(self, product_dict: Dict) -> tuple[Dict, List[Dict]]:
-        """상품 데이터 번역 및 서비스 정보 반환 (Amazon 스크래퍼 호환)"""
+        """상품 데이터 번역 및 서비스 정보 반환 (Amazon 스크래퍼 호환)
+        
+        상품명/카테고리/설명/특징을 한 번의 일괄 번역으로 처리한다 (구간 분리 + 묶음 요청 + 동시 실행).
+        마지막 항목(field='all', service='segmentation')에 원문 전체 번역 대비 절감 리포트를 넣는다.
+        구간 번역이 실패해 원문으로 남은 필드는 service가 'partial' 또는 'translation_failed'이다.
+        """
         logger.info("🔄 상품 데이터 전체 번역 시작")
         translated_dict = product_dict.copy()
         services_info = []
         
         try:
+            # 필드별 번역 대상 텍스트 수집 (필드, 시작 위치, 개수)
+            texts: List[str] = []
+            spans = {}
+            for field in ('name', 'category'):
+                value = product_dict.get(field)
+                if value and value.strip():
+                    spans[field] = (len(texts), 1)
+                    texts.append(value.strip())
+            
+            # 설명은 HTML의 텍스트 노드만 번역 대상 (태그/스타일/이미지 URL은 보내지 않음)
+            description_document = None
+            description = product_dict.get('description')
+            if description and description.strip():
+                description_document = HtmlTextDocument.parse(description)
+                spans['description'] = (len(texts), len(description_document.texts))
+                texts.extend(description_document.texts)
+            
+            features = product_dict.get('features')
+            if features and isinstance(features, list):
+                non_empty_features = [f.strip() for f in features if f and f.strip()]
+                spans['features'] = (len(texts), len(non_empty_features))
+                texts.extend(non_empty_features)
+            
+            translations, grouped, segment_report = await self._translate_segmented(texts)
+            
+            def field_translations(field: str) -> List[str]:
+                start, count = spans[field]
+                return translations[start:start + count]
+            
+            def field_results(field: str) -> List[TranslationResult]:
+                start, count = spans[field]
+                return [result for text_results in grouped[start:start + count] for result in text_results]
+            
             # 상품명 번역
-            if product_dict.get('name'):
-                translated_name = await self.translate_product_name(product_dict['name'])
+            if 'name' in spans:
+                translated_name = field_translations('name')[0]
                 translated_dict['name'] = translated_name
                 services_info.append({
                     "field": "name",
-                    "service": "google",
+                    **self._field_status(field_results('name')),
                     "original": product_dict['name'][:50] + "..." if len(product_dict['name']) > 50 else product_dict['name'],
                     "translated": translated_name[:50] + "..." if len(translated_name) > 50 else translated_name
                 })
             
             # 카테고리 번역
-            if product_dict.get('category'):
-                translated_category = await self.translate_category(product_dict['category'])
+            if 'category' in spans:
+                translated_category = field_translations('category')[0]
                 translated_dict['category'] = translated_category
                 services_info.append({
                     "field": "category", 
-                    "service": "google",
+                    **self._field_status(field_results('category')),
                     "original": product_dict['category'],
                     "translated": translated_category
                 })
             
             # 상품 설명 번역
-            if product_dict.get('description'):
-                translated_description = await self.translate_description(product_dict['description'])
+            if description_document is not None:
+                description_results = field_results('description')
+                translated_description = description_document.render(field_translations('description'))
                 translated_dict['description'] = translated_description
                 services_info.append({
                     "field": "description",
-                    "service": "google", 
+                    **self._field_status(description_results),
                     "original": product_dict['description'][:100] + "..." if len(product_dict['description']) > 100 else product_dict['description'],
-                    "translated": translated_description[:100] + "..." if len(translated_description) > 100 else translated_description
+                    "translated": translated_description[:100] + "..." if len(translated_description) > 100 else translated_description,
+                    **self._description_report(description_document, description_results)
                 })
             
             # 상품 특징 번역
-            if product_dict.get('features') and isinstance(product_dict['features'], list):
-                translated_features = await self.translate_features(product_dict['features'])
+            if 'features' in spans:
+                translated_features = field_translations('features') or features
                 translated_dict['features'] = translated_features
                 services_info.append({
                     "field": "features",
-                    "service": "google",
+                    **self._field_status(field_results('features')),
                     "original": f"{len(product_dict['features'])}개 특징",
                     "translated": f"{len(translated_features)}개 특징 번역 완료"
                 })
             
+            if texts:
+                services_info.append({"field": "all", "service": "segmentation", **segment_report})
+                logger.info(f"✂️ 구간 분리 번역: 원문 {segment_report['naive_chars']}자 중 "
+                            f"{segment_report['sent_chars']}자 전송 ({segment_report['saved_chars']}자 절감)")
+            
             logger.info(f"✅ 전체 번역 완료 - {len(services_info)}개 필드 번역")
             
         except Exception as e:
@@ -216,5 +499,26 @@ class TranslationService:
         
         return translated_dict, services_info
 
+    def get_stats(self) -> Dict:
+        html_chars = self.description_html_chars
+        naive_chars = self.segment_naive_chars
+        return {
+            'batch': self.batch_service.get_stats(),
+            'description': {
+                'html_chars': html_chars,
+                'text_chars': self.description_text_chars,
+                'sent_chars': self.description_sent_chars,
+                'sent_ratio': round(self.description_sent_chars / html_chars, 3) if html_chars else 0.0
+            },
+            'segments': {
+                'enabled': self.batch_service.config.segmentation,
+                'naive_chars': naive_chars,
+                'protected_chars': self.segment_protected_chars,
+                'duplicate_chars': self.segment_duplicate_chars,
+                'sent_chars': self.segment_sent_chars,
+                'saved_ratio': round((naive_chars - self.segment_sent_chars) / naive_chars, 3) if naive_chars else 0.0
+            }
+        }
+
 # 전역 번역 서비스 인스턴스
 translation_service = TranslationService()
\ No newline at end of file
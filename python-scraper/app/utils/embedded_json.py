@@ -0,0 +1,127 @@
+import json
+import re
+from typing import Any, Iterator, Optional
+
+# JS 객체 리터럴에서 JSON으로 바꿀 때 사용하는 키워드
+_JS_LITERALS = {'true': 'true', 'false': 'false', 'null': 'null', 'undefined': 'null'}
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_$][\w$]*')
+_NUMBER_RE = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+
+def find_balanced(text: str, start: int) -> Optional[str]:
+    """start 위치의 '{' 또는 '['부터 짝이 맞는 닫는 괄호까지 반환 (문자열 안의 괄호는 무시)"""
+    if start >= len(text) or text[start] not in '{[':
+        return None
+
+    depth = 0
+    quote = None
+    i = start
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if quote:
+            if char == '\\':
+                i += 2
+                continue
+            if char == quote:
+                quote = None
+        elif char in '"\'`':
+            quote = char
+        elif char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+        i += 1
+    return None
+
+
+def iter_values_after(text: str, key: str) -> Iterator[str]:
+    """'key': { ... } / "key" = [ ... ] 형태에서 key 뒤의 객체/배열 원문을 순서대로 반환"""
+    pattern = re.compile(r'["\']?' + re.escape(key) + r'["\']?\s*[:=]\s*(?=[{\[])')
+    for match in pattern.finditer(text):
+        value = find_balanced(text, match.end())
+        if value is not None:
+            yield value
+
+
+def js_to_json(text: str) -> str:
+    """관대한 JS 객체 리터럴 → JSON 변환
+
+    작은따옴표 문자열, 따옴표 없는 키, 끝에 남은 쉼표, undefined를 처리한다.
+    함수 호출 등 값이 아닌 표현식이 있으면 ValueError.
+    """
+    out = []
+    i = 0
+    length = len(text)
+    while i < length:
+        char = text[i]
+        if char in '"\'':
+            # 문자열 → JSON 문자열로 다시 인코딩
+            j = i + 1
+            chars = []
+            while j < length and text[j] != char:
+                if text[j] == '\\' and j + 1 < length:
+                    escaped = text[j + 1]
+                    if escaped == 'u' and j + 5 < length:
+                        chars.append(chr(int(text[j + 2:j + 6], 16)))
+                        j += 6
+                        continue
+                    chars.append({'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f'}.get(escaped, escaped))
+                    j += 2
+                    continue
+                chars.append(text[j])
+                j += 1
+            if j >= length:
+                raise ValueError('닫히지 않은 문자열')
+            out.append(json.dumps(''.join(chars), ensure_ascii=False))
+            i = j + 1
+        elif char in '{}[]:':
+            out.append(char)
+            i += 1
+        elif char == ',':
+            # 끝에 남은 쉼표 제거
+            k = i + 1
+            while k < length and text[k].isspace():
+                k += 1
+            if k < length and text[k] in '}]':
+                i += 1
+                continue
+            out.append(char)
+            i += 1
+        elif char.isspace():
+            i += 1
+        else:
+            number = _NUMBER_RE.match(text, i)
+            if number:
+                out.append(number.group())
+                i = number.end()
+                continue
+            identifier = _IDENTIFIER_RE.match(text, i)
+            if not identifier:
+                raise ValueError(f'해석할 수 없는 문자: {char!r}')
+            word = identifier.group()
+            i = identifier.end()
+            k = i
+            while k < length and text[k].isspace():
+                k += 1
+            if k < length and text[k] == ':':
+                out.append(json.dumps(word))       # 따옴표 없는 키
+            elif word in _JS_LITERALS:
+                out.append(_JS_LITERALS[word])
+            else:
+                raise ValueError(f'값이 아닌 표현식: {word}')
+    return ''.join(out)
+
+
+def loads_tolerant(text: str) -> Optional[Any]:
+    """JSON으로 먼저 디코딩하고, 실패하면 JS 객체 리터럴로 해석 (둘 다 실패하면 None)"""
+    try:
+        return json.loads(text)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return json.loads(js_to_json(text))
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,459 @@
+import logging
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Tag
+from bs4.element import PreformattedString
+from lxml import etree
+from lxml import html as lxml_html
+
+from app.core.exceptions import ParsingError
+
+try:
+    from cssselect import HTMLTranslator
+except ImportError:  # cssselect가 없으면 lxml 백엔드 대신 BeautifulSoup 사용
+    HTMLTranslator = None
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 파서 백엔드 종류
+BACKEND_LXML = 'lxml'
+BACKEND_BS4 = 'bs4'
+
+# BeautifulSoup이 별도 문자열 타입으로 취급하는 태그 (get_text()에서 제외됨)
+STRING_CONTAINER_TAGS = frozenset(('script', 'style', 'template', 'rt', 'rp'))
+
+# 공백 문자열을 축약하지 않는 태그
+PRESERVE_WHITESPACE_TAGS = frozenset(('pre', 'textarea'))
+
+# BeautifulSoup이 공백만 있는 문자열로 판단하는 문자
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+_STRIP_ASCII_SPACES = {ord(c): None for c in ASCII_SPACES}
+
+_warned_fallback = False
+
+
+def resolve_backend(name: Optional[str]) -> str:
+    """설정값을 실제 사용할 백엔드로 변환 (lxml 백엔드는 cssselect 필요)"""
+    global _warned_fallback
+    if name == BACKEND_BS4:
+        return BACKEND_BS4
+    if HTMLTranslator is None:
+        if not _warned_fallback:
+            logger.warning("⚠️ cssselect가 설치되지 않아 BeautifulSoup 파서 백엔드를 사용합니다")
+            _warned_fallback = True
+        return BACKEND_BS4
+    return BACKEND_LXML
+
+
+def parse_document(html: str, backend: Optional[str] = None):
+    """HTML 문서를 지정한 백엔드로 파싱
+
+    두 백엔드 모두 추출기가 사용하는 BeautifulSoup API 일부(select, find_all, get_text 등)를
+    같은 의미로 제공한다. lxml 백엔드는 BeautifulSoup('lxml')과 같은 libxml2 트리를 쓰되
+    파이썬 객체 트리를 만들지 않아 훨씬 빠르다.
+
+    lxml이 거부하는 입력(빈 문서, 인코딩 선언이 있는 str 등)은 빈 트리로 바꾸지 않고
+    ParsingError로 알린다.
+    """
+    if resolve_backend(backend) == BACKEND_BS4:
+        return BeautifulSoup(html, 'lxml')
+
+    try:
+        root = lxml_html.document_fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.error(f"❌ lxml 문서 파싱 실패 ({len(html)}자): {e}")
+        raise ParsingError(f"HTML 문서 파싱 실패: {e}") from e
+    return LxmlDocument(root)
+
+
+def iter_events(element) -> Iterator[Tuple[str, object]]:
+    """요소 하위 트리를 복사 없이 한 번 순회하는 이벤트 스트림 (두 백엔드 공통)
+
+    ('start', (태그명, [(속성명, 값), ...])), ('text', 문자열), ('end', 태그명)을 문서 순서로
+    내보낸다. 주석/선언은 제외하고, class처럼 여러 값을 갖는 속성은 공백으로 이은 문자열이다.
+    """
+    if isinstance(element, LxmlNode):
+        return element.iter_events()
+    return _iter_soup_events(element)
+
+
+def _soup_attrs(tag: Tag) -> List[Tuple[str, str]]:
+    return [(key, ' '.join(value) if isinstance(value, list) else value) for key, value in tag.attrs.items()]
+
+
+def _iter_soup_events(tag: Tag) -> Iterator[Tuple[str, object]]:
+    yield 'start', (tag.name, _soup_attrs(tag))
+    stack = [(tag.name, iter(tag.contents))]
+    while stack:
+        child = next(stack[-1][1], None)
+        if child is None:
+            yield 'end', stack.pop()[0]
+        elif isinstance(child, Tag):
+            yield 'start', (child.name, _soup_attrs(child))
+            stack.append((child.name, iter(child.contents)))
+        elif not isinstance(child, PreformattedString):
+            yield 'text', str(child)
+
+
+@lru_cache(maxsize=512)
+def _compile_selector(css: str, prefix: str) -> etree.XPath:
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix=prefix))
+
+
+def _walk(root) -> Iterator:
+    """주석/처리 명령을 포함한 모든 노드의 시작/종료 이벤트 (etree.iterwalk는 주석을 건너뜀)"""
+    yield 'start', root
+    nodes = [root]
+    children = [iter(root)]
+    while children:
+        child = next(children[-1], None)
+        if child is None:
+            children.pop()
+            yield 'end', nodes.pop()
+            continue
+        yield 'start', child
+        if isinstance(child.tag, str) and len(child):
+            nodes.append(child)
+            children.append(iter(child))
+        else:
+            yield 'end', child
+
+
+class TextNode(str):
+    """BeautifulSoup NavigableString에 대응하는 텍스트 노드"""
+
+    def __new__(cls, value: str, parent: 'LxmlNode', kind: str):
+        node = super().__new__(cls, value)
+        node.parent = parent
+        node.kind = kind    # 'text' | 'comment' | 문자열 컨테이너 태그명(script 등)
+        return node
+
+
+class LxmlNode:
+    """lxml 요소를 감싸 추출기가 쓰는 BeautifulSoup Tag API 일부를 제공"""
+
+    __slots__ = ('el', '_document')
+
+    def __init__(self, el, document: 'LxmlDocument'):
+        self.el = el
+        self._document = document
+
+    def _wrap(self, el) -> 'LxmlNode':
+        return LxmlNode(el, self._document)
+
+    # ----- 기본 속성 -----
+
+    @property
+    def name(self) -> str:
+        return self.el.tag
+
+    @property
+    def attrs(self) -> dict:
+        return {key: self._attr_value(key, value) for key, value in self.el.attrib.items()}
+
+    @staticmethod
+    def _attr_value(key: str, value: str):
+        # BeautifulSoup과 동일하게 class는 목록으로 반환
+        return value.split() if key == 'class' else value
+
+    def get(self, key: str, default=None):
+        value = self.el.get(key)
+        return default if value is None else self._attr_value(key, value)
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LxmlNode) and other.el is self.el
+
+    def __hash__(self) -> int:
+        return hash(self.el)
+
+    def outer_html(self) -> str:
+        return lxml_html.tostring(self.el, encoding='unicode', method='html', with_tail=False)
+
+    def __str__(self) -> str:
+        return self.outer_html()
+
+    def __repr__(self) -> str:
+        return f"<LxmlNode {self.name}>"
+
+    @property
+    def parent(self) -> Optional['LxmlNode']:
+        parent = self.el.getparent()
+        if parent is None:
+            return self._document if self.el is self._document.el else None
+        return self._wrap(parent)
+
+    # ----- 텍스트 -----
+
+    def _kind_of(self, el) -> str:
+        """요소 바로 아래 텍스트의 문자열 타입 (가장 가까운 문자열 컨테이너 태그 기준)"""
+        while el is not None:
+            if el.tag in STRING_CONTAINER_TAGS:
+                return el.tag
+            el = el.getparent()
+        return 'text'
+
+    @staticmethod
+    def _preserves_whitespace(el) -> bool:
+        while el is not None:
+            if el.tag in PRESERVE_WHITESPACE_TAGS:
+                return True
+            el = el.getparent()
+        return False
+
+    @staticmethod
+    def _collapse(value: str, preserve: bool) -> str:
+        # BeautifulSoup은 공백만 있는 문자열을 한 칸(또는 줄바꿈)으로 축약
+        if not preserve and value.translate(_STRIP_ASCII_SPACES) == '':
+            return '\n' if '\n' in value else ' '
+        return value
+
+    def _iter_strings(self) -> Iterator[TextNode]:
+        """하위 모든 텍스트 노드를 문서 순서로 순회 (주석 포함)"""
+        root = self.el
+        kinds = [self._kind_of(root)]
+        preserves = [self._preserves_whitespace(root.getparent())]
+        for event, el in _walk(root):
+            if event == 'start':
+                if isinstance(el.tag, str):
+                    kinds.append(el.tag if el.tag in STRING_CONTAINER_TAGS else kinds[-1])
+                    preserves.append(preserves[-1] or el.tag in PRESERVE_WHITESPACE_TAGS)
+                    if el.text:
+                        yield TextNode(self._collapse(el.text, preserves[-1]), self._wrap(el), kinds[-1])
+                elif el.tag is etree.Comment and el.text is not None:
+                    yield TextNode(el.text, self._wrap(el.getparent()), 'comment')
+            else:
+                if isinstance(el.tag, str):
+                    kinds.pop()
+                    preserves.pop()
+                if el is not root and el.tail:
+                    yield TextNode(self._collapse(el.tail, preserves[-1]), self._wrap(el.getparent()), kinds[-1])
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        own_kind = self.name if self.name in STRING_CONTAINER_TAGS else 'text'
+        parts = []
+        for node in self._iter_strings():
+            if node.kind != own_kind:
+                continue
+            if strip:
+                node = node.strip()
+                if not node:
+                    continue
+            parts.append(str(node))
+        return separator.join(parts)
+
+    @property
+    def string(self) -> Optional[TextNode]:
+        """자식이 하나뿐일 때 그 문자열 (BeautifulSoup .string과 동일)"""
+        el = self.el
+        children = []
+        if el.text:
+            children.append(TextNode(self._collapse(el.text, self._preserves_whitespace(el)), self, self._kind_of(el)))
+        for child in el:
+            children.append(child)
+            if child.tail:
+                children.append(child.tail)
+            if len(children) > 1:
+                return None
+        if len(children) != 1:
+            return None
+        child = children[0]
+        if isinstance(child, TextNode):
+            return child
+        if isinstance(child, str):
+            return TextNode(self._collapse(child, self._preserves_whitespace(el)), self, self._kind_of(el))
+        if child.tag is etree.Comment:
+            return TextNode(child.text or '', self, 'comment')
+        if isinstance(child.tag, str):
+            return self._wrap(child).string
+        return None
+
+    def iter_events(self) -> Iterator[Tuple[str, object]]:
+        """하위 트리의 시작/텍스트/종료 이벤트 (html_backend.iter_events 참고)"""
+        root = self.el
+        preserves = [self._preserves_whitespace(root.getparent())]
+        for event, el in _walk(root):
+            if event == 'start':
+                if isinstance(el.tag, str):
+                    yield 'start', (el.tag, list(el.attrib.items()))
+                    preserves.append(preserves[-1] or el.tag in PRESERVE_WHITESPACE_TAGS)
+                    if el.text:
+                        yield 'text', self._collapse(el.text, preserves[-1])
+            else:
+                if isinstance(el.tag, str):
+                    preserves.pop()
+                    yield 'end', el.tag
+                if el is not root and el.tail:
+                    yield 'text', self._collapse(el.tail, preserves[-1])
+
+    # ----- 검색 -----
+
+    def _selector_prefix(self) -> str:
+        return 'descendant::'
+
+    def _select_root(self):
+        return self.el
+
+    def select(self, css: str) -> List['LxmlNode']:
+        return [self._wrap(el) for el in _compile_selector(css, self._selector_prefix())(self._select_root())]
+
+    def select_one(self, css: str) -> Optional['LxmlNode']:
+        found = _compile_selector(css, self._selector_prefix())(self._select_root())
+        return self._wrap(found[0]) if found else None
+
+    def _iter_elements(self, recursive: bool = True) -> Iterator:
+        if recursive:
+            iterator = self.el.iterdescendants()
+        else:
+            iterator = iter(self.el)
+        for el in iterator:
+            if isinstance(el.tag, str):
+                yield el
+
+    @staticmethod
+    def _match_name(el, name) -> bool:
+        if name is None or name is True:
+            return True
+        if isinstance(name, (list, tuple, set, frozenset)):
+            return el.tag in name
+        return el.tag == name
+
+    @staticmethod
+    def _match_value(value: Optional[str], expected, multi_valued: bool) -> bool:
+        if expected is True:
+            return value is not None
+        if expected is None or expected is False:
+            return value is None
+        if value is None:
+            return False
+        candidates = value.split() + [value] if multi_valued else [value]
+        if hasattr(expected, 'search'):
+            return any(expected.search(candidate) for candidate in candidates)
+        return expected in candidates
+
+    def _match_attrs(self, el, attrs: dict) -> bool:
+        for key, expected in attrs.items():
+            if not self._match_value(el.get(key), expected, key == 'class'):
+                return False
+        return True
+
+    def find_all(self, name=None, attrs=None, recursive: bool = True, string=None,
+                 limit: Optional[int] = None, class_=None, text=None, **kwargs) -> list:
+        """BeautifulSoup find_all의 부분 구현 (태그명, 속성, class_, string 조건)"""
+        string = string if string is not None else text
+        attrs = dict(attrs or {})
+        attrs.update(kwargs)
+        if class_ is not None:
+            attrs['class'] = class_
+
+        # 태그 조건 없이 문자열만 찾는 경우 텍스트 노드를 반환
+        if string is not None and name is None and not attrs:
+            results = []
+            for node in self._iter_strings():
+                if string is True or (hasattr(string, 'search') and string.search(node)) or node == string:
+                    results.append(node)
+                    if limit and len(results) >= limit:
+                        break
+            return results
+
+        results = []
+        for el in self._iter_elements(recursive):
+            if not self._match_name(el, name) or not self._match_attrs(el, attrs):
+                continue
+            node = self._wrap(el)
+            if string is not None:
+                value = node.string
+                if value is None:
+                    continue
+                if hasattr(string, 'search'):
+                    if not string.search(value):
+                        continue
+                elif string is not True and value != string:
+                    continue
+            results.append(node)
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def find(self, name=None, attrs=None, recursive: bool = True, string=None, **kwargs) -> Optional['LxmlNode']:
+        found = self.find_all(name, attrs, recursive=recursive, string=string, limit=1, **kwargs)
+        return found[0] if found else None
+
+    def find_parent(self, name=None, attrs=None, **kwargs) -> Optional['LxmlNode']:
+        attrs = dict(attrs or {})
+        attrs.update(kwargs)
+        el = self.el.getparent()
+        while el is not None:
+            if self._match_name(el, name) and self._match_attrs(el, attrs):
+                return self._wrap(el)
+            el = el.getparent()
+        return None
+
+    def find_next_siblings(self, name=None, attrs=None, **kwargs) -> List['LxmlNode']:
+        attrs = dict(attrs or {})
+        attrs.update(kwargs)
+        return [
+            self._wrap(el) for el in self.el.itersiblings()
+            if isinstance(el.tag, str) and self._match_name(el, name) and self._match_attrs(el, attrs)
+        ]
+
+
+class LxmlDocument(LxmlNode):
+    """문서 노드 (BeautifulSoup 객체의 '[document]'에 대응, <html> 요소의 부모)"""
+
+    __slots__ = ()
+
+    def __init__(self, root):
+        super().__init__(root, self)
+
+    @property
+    def name(self) -> str:
+        return '[document]'
+
+    @property
+    def attrs(self) -> dict:
+        return {}
+
+    def get(self, key: str, default=None):
+        return default
+
+    @property
+    def parent(self) -> None:
+        return None
+
+    def _selector_prefix(self) -> str:
+        return 'descendant-or-self::'
+
+    def _iter_elements(self, recursive: bool = True) -> Iterator:
+        yield self.el
+        if recursive:
+            yield from LxmlNode(self.el, self)._iter_elements(True)
+
+    def _iter_strings(self) -> Iterator[TextNode]:
+        for el in self.el.itersiblings(preceding=True):
+            if el.tag is etree.Comment and el.text is not None:
+                yield TextNode(el.text, self, 'comment')
+        yield from LxmlNode(self.el, self)._iter_strings()
+
+    @property
+    def string(self) -> Optional[TextNode]:
+        return LxmlNode(self.el, self).string
+
+    def find_next_siblings(self, name=None, attrs=None, **kwargs) -> List[LxmlNode]:
+        return []
+
+    def find_parent(self, name=None, attrs=None, **kwargs) -> None:
+        return None
+
+    def outer_html(self) -> str:
+        return lxml_html.tostring(self.el.getroottree(), encoding='unicode', method='html')
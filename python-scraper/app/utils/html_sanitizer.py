@@ -0,0 +1,307 @@
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from app.utils.html_backend import iter_events
+
+# 하위 내용까지 통째로 버리는 태그
+DROP_CONTENT_TAGS = frozenset((
+    'script', 'style', 'noscript', 'template', 'iframe', 'frame', 'object', 'embed', 'applet',
+    'svg', 'math', 'canvas', 'audio', 'video', 'form', 'input', 'button', 'select', 'textarea',
+    'head', 'title', 'meta', 'link', 'base',
+))
+
+# 출력에 남기는 태그 (목록에 없는 태그는 태그만 빼고 내용은 유지)
+ALLOWED_TAGS = frozenset((
+    'div', 'span', 'p', 'br', 'hr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'blockquote', 'pre', 'center',
+    'section', 'article', 'header', 'footer', 'figure', 'figcaption',
+    'table', 'caption', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td', 'colgroup', 'col',
+    'a', 'img', 'b', 'strong', 'i', 'em', 'u', 's', 'small', 'sub', 'sup', 'mark', 'font',
+))
+
+# 태그별 허용 속성 ('*'는 모든 태그 공통)
+ALLOWED_ATTRIBUTES: Dict[str, FrozenSet[str]] = {
+    '*': frozenset(('class', 'style', 'title', 'lang', 'dir', 'align', 'width', 'height')),
+    'a': frozenset(('href', 'target', 'rel')),
+    'img': frozenset(('src', 'alt')),
+    'td': frozenset(('colspan', 'rowspan')),
+    'th': frozenset(('colspan', 'rowspan')),
+    'font': frozenset(('color', 'size')),
+}
+
+# 닫는 태그가 없는 태그
+VOID_TAGS = frozenset(('img', 'br', 'hr', 'col', 'wbr'))
+
+# 미디어 태그 (출력하지 않는 태그도 포함, 이미지 자리가 비어 있는지 판단에 사용)
+MEDIA_TAGS = frozenset(('img', 'picture', 'video', 'audio', 'iframe', 'object', 'embed', 'svg', 'canvas'))
+
+# 지연 로딩 이미지 주소 속성 (우선순위 순)
+LAZY_IMAGE_ATTRIBUTES = ('data-src', 'data-lazy-src', 'data-a-hires', 'data-original')
+
+# 값이 URL인 속성 / 허용하지 않는 URL 스킴
+URL_ATTRIBUTES = frozenset(('href', 'src'))
+UNSAFE_URL_SCHEMES = ('javascript:', 'vbscript:')
+
+
+@dataclass(frozen=True)
+class ImageSlotRule:
+    """빈 이미지 자리 채우기 규칙
+
+    class를 모두 가진 모듈 요소 안의 첫 번째 div(자리)에 미디어가 없고 텍스트가 max_text자
+    미만이면, 그 자리 안의 지연 로딩 속성(lazy_attrs)에 있는 이미지 주소로 div 내용을 바꾼다.
+    다른 자리나 문서 전체의 이미지는 사용하지 않는다.
+    """
+    module_classes: FrozenSet[str]
+    max_text: int = 10
+    img_attrs: Tuple[Tuple[str, str], ...] = ()
+    lazy_attrs: Tuple[str, ...] = LAZY_IMAGE_ATTRIBUTES
+    src_marker: Optional[str] = None            # 이 문자열을 포함하는 주소만 사용 (None이면 모두)
+
+
+@dataclass(frozen=True)
+class SanitizePolicy:
+    """HTML 정리 규칙 (허용 목록 방식)"""
+    allowed_tags: FrozenSet[str] = ALLOWED_TAGS
+    drop_content_tags: FrozenSet[str] = DROP_CONTENT_TAGS
+    allowed_attributes: Mapping[str, FrozenSet[str]] = field(default_factory=lambda: dict(ALLOWED_ATTRIBUTES))
+    drop_class_markers: Tuple[str, ...] = ()    # 이 문자열을 포함하는 class 제거
+    base_url: Optional[str] = None              # 상대 URL 기준 (None이면 변환하지 않음)
+    default_img_alt: Optional[str] = None       # alt가 없는 이미지에 넣을 값
+    drop_empty: bool = True                     # 텍스트/이미지가 없는 태그 제거 (최상위 요소 제외)
+    max_chars: int = 0                          # 출력 크기 예산 (0 = 제한 없음)
+    image_slot: Optional[ImageSlotRule] = None
+
+
+@dataclass
+class SanitizedHtml:
+    """정리 결과"""
+    html: str
+    text: str                   # 출력에 남은 텍스트 (공백으로 이음)
+    truncated: bool = False     # 크기 예산 때문에 뒷부분을 버렸는지
+    filled_images: int = 0      # 빈 자리에 채운 이미지 수
+
+
+class _Frame:
+    """열려 있는 요소 1개의 출력 상태"""
+
+    __slots__ = ('name', 'start_tag', 'out_pos', 'size', 'texts_pos', 'text_len', 'has_content',
+                 'has_media', 'is_module', 'slot_taken', 'is_slot', 'lazy_src')
+
+    def __init__(self, name: Optional[str], start_tag: str, out_pos: int, size: int, texts_pos: int):
+        self.name = name                # 출력하는 태그명 (내용만 남기는 태그는 None)
+        self.start_tag = start_tag
+        self.out_pos = out_pos          # 되돌리기 위치 (출력 조각 수 / 크기 / 텍스트 수)
+        self.size = size
+        self.texts_pos = texts_pos
+        self.text_len = 0               # 하위 텍스트 길이 (앞뒤 공백 제외)
+        self.has_content = False        # 하위에 텍스트나 이미지가 있는지
+        self.has_media = False          # 하위에 미디어 태그가 있는지 (출력 여부와 무관)
+        self.is_module = False
+        self.slot_taken = False
+        self.is_slot = False
+        self.lazy_src: Optional[str] = None     # 자리 안에서 찾은 지연 로딩 이미지 주소
+
+
+def _escape_text(text: str) -> str:
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _escape_attr(value: str) -> str:
+    return _escape_text(value).replace('"', '&quot;')
+
+
+def _absolute_url(url: str, base_url: str) -> str:
+    if url.startswith('//'):
+        return 'https:' + url
+    if url.startswith('/'):
+        return base_url + url
+    if url.startswith(('http:', 'https:', '#', 'mailto:')):
+        return url
+    return base_url + '/' + url
+
+
+def _render_start(name: str, attrs: Mapping[str, str]) -> str:
+    rendered = ''.join(f' {key}="{_escape_attr(value)}"' for key, value in attrs.items())
+    return f'<{name}{rendered}/>' if name in VOID_TAGS else f'<{name}{rendered}>'
+
+
+def _clean_attributes(name: str, attrs: List[Tuple[str, str]], policy: SanitizePolicy) -> Dict[str, str]:
+    allowed = policy.allowed_attributes.get(name, frozenset())
+    common = policy.allowed_attributes.get('*', frozenset())
+    source = {key.lower(): value for key, value in attrs}
+    cleaned: Dict[str, str] = {}
+
+    for key, value in source.items():
+        if key not in allowed and key not in common:
+            continue
+        if key in URL_ATTRIBUTES:
+            if value.strip().lower().startswith(UNSAFE_URL_SCHEMES):
+                continue
+        elif key == 'class':
+            classes = [cls for cls in value.split()
+                       if not any(marker in cls for marker in policy.drop_class_markers)]
+            if not classes:
+                continue
+            value = ' '.join(classes)
+        elif key == 'style' and ('expression(' in value or 'javascript:' in value.lower()):
+            continue
+        cleaned[key] = value
+
+    if name == 'img':
+        # 지연 로딩 이미지는 data-src에 실제 주소가 있음
+        if not cleaned.get('src') and source.get('data-src'):
+            cleaned['src'] = source['data-src']
+        if policy.default_img_alt and not cleaned.get('alt'):
+            cleaned['alt'] = policy.default_img_alt
+
+    if policy.base_url:
+        for key in URL_ATTRIBUTES.intersection(cleaned):
+            if cleaned[key]:
+                cleaned[key] = _absolute_url(cleaned[key], policy.base_url)
+    return cleaned
+
+
+def _lazy_image(attrs: List[Tuple[str, str]], rule: ImageSlotRule, base_url: Optional[str]) -> Optional[str]:
+    """요소 속성에서 지연 로딩 이미지 주소 찾기"""
+    values = {key.lower(): value for key, value in attrs}
+    for key in rule.lazy_attrs:
+        src = (values.get(key) or '').strip()
+        if not src or src.lower().startswith(UNSAFE_URL_SCHEMES + ('data:',)):
+            continue
+        if rule.src_marker and rule.src_marker not in src:
+            continue
+        return _absolute_url(src, base_url) if base_url else src
+    return None
+
+
+def sanitize_html(element, policy: SanitizePolicy) -> SanitizedHtml:
+    """원본 트리를 한 번 순회하며 정리된 HTML을 바로 직렬화
+
+    원본 트리는 변경하지 않는다. 요소를 열 때 출력 위치를 기억해 두고, 닫을 때 텍스트/이미지가
+    없으면 그 위치로 되돌려 빈 태그를 제거한다. 크기 예산(max_chars)을 넘으면 순회를 멈추고
+    열린 태그만 닫는다. policy.image_slot 규칙의 빈 자리는 그 자리 안의 지연 로딩 이미지로
+    채우며, 이미 출력된 이미지는 다시 넣지 않는다.
+    """
+    out: List[str] = []
+    texts: List[str] = []
+    frames: List[_Frame] = []
+    modules: List[_Frame] = []
+    slots: List[_Frame] = []
+    size = 0
+    skip_depth = 0
+    truncated = False
+    filled = 0
+    emitted_images = set()
+    budget = policy.max_chars
+    slot_rule = policy.image_slot
+
+    def close() -> None:
+        nonlocal size, filled
+        frame = frames.pop()
+        if frame.is_module:
+            modules.pop()
+        if frame.is_slot:
+            slots.pop()
+        has_content = frame.has_content
+
+        src = None
+        if frame.is_slot and not frame.has_media and frame.text_len < slot_rule.max_text:
+            src = frame.lazy_src if frame.lazy_src not in emitted_images else None
+        if src:
+            del out[frame.out_pos:]
+            del texts[frame.texts_pos:]
+            image = _render_start('img', {'src': src, **dict(slot_rule.img_attrs)})
+            chunk = (frame.start_tag + image + f'</{frame.name}>') if frame.name else image
+            out.append(chunk)
+            size = frame.size + len(chunk)
+            emitted_images.add(src)
+            filled += 1
+            has_content = True
+            frame.text_len = 0
+        elif policy.drop_empty and not has_content and frames:
+            del out[frame.out_pos:]
+            size = frame.size
+        elif frame.name and frame.name not in VOID_TAGS:
+            out.append(f'</{frame.name}>')
+            size += len(frame.name) + 3
+
+        if frames:
+            parent = frames[-1]
+            parent.has_content = parent.has_content or has_content
+            parent.has_media = parent.has_media or frame.has_media
+            parent.text_len += frame.text_len
+
+    for kind, value in iter_events(element):
+        if skip_depth:
+            if kind == 'start':
+                skip_depth += 1
+            elif kind == 'end':
+                skip_depth -= 1
+            continue
+
+        if kind == 'start':
+            name, attrs = value
+            if slots:
+                # 빈 자리 판단용 미디어 / 채울 이미지 (자리 안에서만 찾음)
+                if name in MEDIA_TAGS:
+                    frames[-1].has_media = True
+                if slots[-1].lazy_src is None:
+                    slots[-1].lazy_src = _lazy_image(attrs, slot_rule, policy.base_url)
+            if name in policy.drop_content_tags:
+                skip_depth = 1
+                continue
+
+            start_tag = ''
+            if name in policy.allowed_tags:
+                cleaned = _clean_attributes(name, attrs, policy)
+                # 주소가 없는 이미지는 출력하지 않음
+                if name != 'img' or cleaned.get('src'):
+                    start_tag = _render_start(name, cleaned)
+            if budget and size + len(start_tag) > budget:
+                truncated = True
+                break
+
+            frame = _Frame(name if start_tag else None, start_tag, len(out), size, len(texts))
+            if start_tag:
+                out.append(start_tag)
+                size += len(start_tag)
+                if name == 'img':
+                    frame.has_content = True
+                    frame.has_media = True
+                    emitted_images.add(cleaned['src'])
+
+            if slot_rule:
+                if modules and name == 'div' and not modules[-1].slot_taken:
+                    modules[-1].slot_taken = True
+                    frame.is_slot = True
+                    frame.lazy_src = _lazy_image(attrs, slot_rule, policy.base_url)
+                    slots.append(frame)
+                classes = next((val for key, val in attrs if key.lower() == 'class'), '')
+                if classes and slot_rule.module_classes.issubset(classes.split()):
+                    frame.is_module = True
+                    modules.append(frame)
+            frames.append(frame)
+
+        elif kind == 'text':
+            if not frames:
+                continue
+            chunk = _escape_text(value)
+            if budget and size + len(chunk) > budget:
+                truncated = True
+                break
+            out.append(chunk)
+            size += len(chunk)
+            stripped = value.strip()
+            if stripped:
+                texts.append(stripped)
+                frames[-1].text_len += len(stripped)
+                frames[-1].has_content = True
+
+        elif frames:
+            close()
+
+    # 예산 초과로 멈춘 경우 열린 태그 닫기
+    while frames:
+        close()
+
+    return SanitizedHtml(html=''.join(out), text=' '.join(texts), truncated=truncated, filled_images=filled)
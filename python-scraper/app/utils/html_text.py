@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from lxml import etree
+from lxml import html as lxml_html
+
+# 텍스트를 번역하지 않는 태그
+UNTRANSLATABLE_TAGS = frozenset(('script', 'style', 'code', 'pre', 'noscript', 'template'))
+
+
+def _is_translatable(text: str) -> bool:
+    # 숫자/기호/공백만 있는 텍스트는 번역하지 않음
+    return any(char.isalpha() for char in text)
+
+
+@dataclass
+class _TextSlot:
+    element: object
+    attr: str           # 'text' | 'tail'
+    leading: str        # 앞뒤 공백은 번역하지 않고 그대로 유지
+    core: str
+    trailing: str
+
+
+class HtmlTextDocument:
+    """HTML 조각의 번역 대상 텍스트 노드 목록과 원래 트리
+
+    태그/속성(스타일, 이미지 URL 등)은 그대로 두고 텍스트 노드만 꺼내 번역한 뒤
+    같은 위치에 다시 넣어 직렬화한다.
+    """
+
+    def __init__(self, wrapper, slots: List[_TextSlot], source_chars: int):
+        self._wrapper = wrapper
+        self._slots = slots
+        self.source_chars = source_chars
+
+    @classmethod
+    def parse(cls, content: str) -> 'HtmlTextDocument':
+        wrapper = lxml_html.fragment_fromstring(content, create_parent='div')
+        slots: List[_TextSlot] = []
+
+        def add(element, attr: str, value: str) -> None:
+            core = value.strip()
+            if core and _is_translatable(core):
+                start = value.index(core)
+                slots.append(_TextSlot(element, attr, value[:start], core, value[start + len(core):]))
+
+        # 문서 순서 순회 (요소의 text → 하위 요소 → 하위 요소의 tail), tail은 부모 기준으로 판단
+        stack = [('element', wrapper, False)]
+        while stack:
+            kind, element, skipped = stack.pop()
+            if kind == 'tail':
+                add(element, 'tail', element.tail)
+                continue
+            skip_inside = skipped or not isinstance(element.tag, str) or element.tag in UNTRANSLATABLE_TAGS
+            if not skip_inside and element.text:
+                add(element, 'text', element.text)
+            for child in reversed(element):
+                if not skip_inside and child.tail:
+                    stack.append(('tail', child, False))
+                stack.append(('element', child, skip_inside))
+
+        return cls(wrapper, slots, len(content))
+
+    @property
+    def texts(self) -> List[str]:
+        """번역할 텍스트 (문서 순서, 중복 포함)"""
+        return [slot.core for slot in self._slots]
+
+    def render(self, translations: Sequence[str]) -> str:
+        """번역문을 원래 위치에 넣어 HTML로 직렬화 (texts와 같은 순서)"""
+        for slot, translated in zip(self._slots, translations):
+            setattr(slot.element, slot.attr, slot.leading + translated + slot.trailing)
+
+        wrapper = self._wrapper
+        parts = [_escape(wrapper.text or '')]
+        parts.extend(etree.tostring(child, method='html', encoding='unicode') for child in wrapper)
+        return ''.join(parts)
+
+
+def _escape(text: str) -> str:
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
@@ -0,0 +1,140 @@
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional
+
+
+@dataclass
+class KeywordHits:
+    """텍스트 1건의 키워드 검색 결과"""
+    counts: Dict[str, int] = field(default_factory=dict)                              # 키워드 → 출현 횟수
+    group_keywords: Dict[str, FrozenSet[str]] = field(default_factory=dict, repr=False)  # 그룹 → 키워드 집합
+
+    @property
+    def groups(self) -> Dict[str, List[str]]:
+        """그룹 → 출현한 키워드 (처음 나온 순서)"""
+        return {
+            group: [keyword for keyword in self.counts if keyword in keywords]
+            for group, keywords in self.group_keywords.items()
+            if not keywords.isdisjoint(self.counts)
+        }
+
+    def distinct(self, group: str) -> int:
+        """그룹에서 한 번 이상 나온 키워드 수 (sum(1 for kw in keywords if kw in text)와 같음)"""
+        if not self.counts:
+            return 0
+        return len(self.counts.keys() & self.group_keywords.get(group, frozenset()))
+
+    def any(self, group: str) -> bool:
+        return bool(self.counts) and not self.group_keywords.get(group, frozenset()).isdisjoint(self.counts)
+
+
+class KeywordMatcher:
+    """다중 키워드 매처 (키워드 트라이를 정규식 하나로 컴파일)
+
+    그룹별 키워드 표(dict)로 한 번 만들어 두고, 텍스트를 한 번 훑어 모든 그룹의
+    키워드 출현을 함께 찾는다. 결과는 kw in text를 키워드마다 반복한 것과 같고,
+    출현 횟수는 겹치는 출현까지 센다.
+
+    문자 단위 탐색은 정규식 엔진이 맡는다. 각 위치에서 가장 긴 키워드를 찾고,
+    그 키워드 안에 들어 있는 더 짧은 키워드는 미리 계산해 둔 목록으로 함께 센다.
+    한 키워드의 끝과 다른 키워드의 시작이 겹칠 수 있는 표에서만 위치마다
+    검사하는 전방 탐색 패턴을 사용한다.
+    """
+
+    def __init__(self, tables: Mapping[str, Iterable[str]], ignore_case: bool = False):
+        self.ignore_case = ignore_case
+        self.tables: Dict[str, List[str]] = {group: list(keywords) for group, keywords in tables.items()}
+
+        self._group_keywords: Dict[str, FrozenSet[str]] = {
+            group: frozenset(self._normalize(keyword) for keyword in keywords if keyword)
+            for group, keywords in self.tables.items()
+        }
+        # 모든 그룹의 키워드 (중복 없음, 표 순서)
+        self._keywords = list(dict.fromkeys(
+            self._normalize(keyword) for keywords in self.tables.values() for keyword in keywords if keyword
+        ))
+        self._build(self._keywords)
+
+    def _normalize(self, text: str) -> str:
+        return text.lower() if self.ignore_case else text
+
+    def _build(self, keywords: List[str]) -> None:
+        # 트라이 구성 (키 '' 는 키워드 끝 표시)
+        trie: Dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        # 키워드 → 그 안에 들어 있는 다른 키워드와 횟수 (전체 / 접두어만)
+        contained_all: Dict[str, Counter] = {}
+        contained_prefix: Dict[str, Counter] = {}
+        overlapping = False
+        for keyword in keywords:
+            contained: Counter = Counter()
+            prefixes: Counter = Counter()
+            for start in range(len(keyword)):
+                node = trie
+                for end in range(start, len(keyword)):
+                    node = node.get(keyword[end])
+                    if node is None:
+                        break
+                    if '' in node and (start, end + 1) != (0, len(keyword)):
+                        contained[keyword[start:end + 1]] += 1
+                        if start == 0:
+                            prefixes[keyword[:end + 1]] += 1
+                else:
+                    # 키워드 끝을 넘어 이어지는 다른 키워드가 있음 (부분 겹침)
+                    if start > 0 and node is not None and len(node) > ('' in node):
+                        overlapping = True
+            if contained:
+                contained_all[keyword] = contained
+            if prefixes:
+                contained_prefix[keyword] = prefixes
+
+        # 전방 탐색 패턴은 모든 위치를 검사하므로 같은 위치의 접두어 키워드만 추가로 센다
+        pattern = self._trie_pattern(trie) if trie else None
+        if pattern is None:
+            self._regex = None
+        elif overlapping:
+            # 첫 글자 문자 집합으로 먼저 걸러 키워드가 시작할 수 없는 위치는 바로 건너뜀
+            first_chars = re.escape(''.join(sorted(key for key in trie if key)))
+            self._regex = re.compile(f'(?=[{first_chars}])(?=({pattern}))', re.DOTALL)
+        else:
+            self._regex = re.compile(pattern, re.DOTALL)
+        self._contained = contained_prefix if overlapping else contained_all
+
+    def _trie_pattern(self, node: Dict) -> str:
+        """트라이 → 정규식 (선택적 그룹은 greedy라 같은 위치에서는 가장 긴 키워드가 일치)"""
+        branches = []
+        for char in sorted(key for key in node if key):
+            branches.append(re.escape(char) + self._trie_pattern(node[char]))
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            body = (f'(?:{body})' if len(branches) == 1 else body) + '?'
+        return body
+
+    def with_tables(self, extra: Mapping[str, Iterable[str]]) -> 'KeywordMatcher':
+        """키워드 표를 합친 새 매처 (사이트별 키워드 추가용)"""
+        tables = {group: list(keywords) for group, keywords in self.tables.items()}
+        for group, keywords in extra.items():
+            tables.setdefault(group, []).extend(keywords)
+        return KeywordMatcher(tables, ignore_case=self.ignore_case)
+
+    def scan(self, text: Optional[str]) -> KeywordHits:
+        """텍스트를 한 번 훑어 모든 키워드 출현 수집"""
+        if not text or self._regex is None:
+            return KeywordHits(group_keywords=self._group_keywords)
+
+        counts = Counter(self._regex.findall(self._normalize(text)))
+        if self._contained and counts:
+            for keyword, count in list(counts.items()):
+                contained = self._contained.get(keyword)
+                if contained:
+                    for inner, inner_count in contained.items():
+                        counts[inner] += count * inner_count
+        return KeywordHits(counts=dict(counts), group_keywords=self._group_keywords)
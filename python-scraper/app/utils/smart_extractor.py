@@ -1,21 +1,80 @@
 import re
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 from bs4 import BeautifulSoup
 import trafilatura
+from trafilatura.utils import load_html
+
+from app.utils.keyword_matcher import KeywordMatcher, KeywordHits
+
+
+# 분류용 키워드 표 (그룹 → 키워드). 사이트별 키워드는 keyword_matcher.with_tables()로 추가
+CLASSIFIER_KEYWORDS = {
+    # 문장 단위 특징 키워드 (trafilatura 결과용)
+    'feature_sentence': [
+        '素材', '材質', '機能', '特徴', '仕様', '性能', '効果',
+        '対応', '搭載', '採用', '使用', '設計', '製造', '開発',
+        '防水', '防塵', '耐久', '軽量', '高品質', 'プレミアム',
+        'サイズ', '重量', '容量', '時間', '速度', '温度', '圧力'
+    ],
+    'description_sentence': [
+        'について', 'です', 'ます', 'である', 'であり',
+        '商品', '製品', 'ブランド', '会社', 'メーカー'
+    ],
+    # 텍스트 블록 단위 키워드 (HTML 셀렉터 결과용)
+    'feature_text': [
+        '素材', '材質', '機能', '特徴', '仕様', '性能',
+        '対応', '搭載', '採用', '使用', '設計', '製造',
+        'サイズ', '重量', '容量', '時間', '速度', '温度'
+    ],
+    'description_text': [
+        '商品の説明', '製品について', '概要', 'について',
+        'です', 'ます', 'である', 'であり'
+    ],
+}
+
+# 특징 문장 시작 패턴
+FEATURE_SENTENCE_PATTERNS = [
+    r'^【.*】',        # 【특징】 형태
+    r'^\*\s*',        # * 불릿
+    r'^・\s*',        # ・ 불릿
+    r'^-\s*',         # - 불릿
+    r'^\d+[.)]',      # 1. 숫자 리스트
+]
+FEATURE_TEXT_PATTERNS = [
+    r'^【.*】',  # 【브랜드】, 【특징】 형태
+    r'^\*',     # * 불릿 포인트
+    r'^・',     # ・ 불릿 포인트
+    r'^-',      # - 불릿 포인트
+    r'^\d+\.',  # 1. 숫자 리스트
+]
+
+_FEATURE_SENTENCE_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in FEATURE_SENTENCE_PATTERNS))
+_FEATURE_TEXT_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in FEATURE_TEXT_PATTERNS))
+
+# 모든 분류 키워드를 한 번에 찾는 매처 (임포트 시 1회 생성)
+keyword_matcher = KeywordMatcher(CLASSIFIER_KEYWORDS)
 
 
 class SmartExtractor:
     """AI 기반 스마트 데이터 추출기"""
     
     @staticmethod
-    def extract_with_trafilatura(html_content: str, url: str) -> Dict[str, any]:
-        """trafilatura로 메인 콘텐츠 추출"""
+    def extract_with_trafilatura(html_content: Union[str, bytes], url: str) -> Dict[str, any]:
+        """trafilatura로 메인 콘텐츠 추출
+        
+        원본 응답 바이트를 그대로 받을 수 있으며 (인코딩은 trafilatura가 판별),
+        문서는 한 번만 파싱해 메타데이터와 본문 추출에 함께 사용한다.
+        """
         try:
-            # 메인 콘텐츠 추출
-            main_content = trafilatura.extract(html_content, include_comments=False)
+            tree = load_html(html_content)
+            if tree is None:
+                return {'description': None, 'features': []}
+            
+            # 메타데이터 추출 (본문 추출이 트리를 정리하기 전에 수행)
+            metadata = trafilatura.extract_metadata(tree, default_url=url)
             
-            # 메타데이터 추출
-            metadata = trafilatura.extract_metadata(html_content)
+            # 메인 콘텐츠 추출
+            main_content = trafilatura.extract(tree, url=url, include_comments=False)
             
             if main_content:
                 # 문장별로 분리
@@ -26,9 +85,11 @@ class SmartExtractor:
                 descriptions = []
                 
                 for sentence in sentences:
-                    if SmartExtractor._is_feature_sentence(sentence):
+                    # 키워드는 문장당 한 번만 검색해 특징/설명 판별에 함께 사용
+                    hits = keyword_matcher.scan(sentence)
+                    if SmartExtractor._is_feature_sentence(sentence, hits):
                         features.append(sentence)
-                    elif SmartExtractor._is_description_sentence(sentence):
+                    elif SmartExtractor._is_description_sentence(sentence, hits):
                         descriptions.append(sentence)
                 
                 return {
@@ -43,33 +104,18 @@ class SmartExtractor:
         return {'description': None, 'features': []}
     
     @staticmethod
-    def _is_feature_sentence(sentence: str) -> bool:
-        """문장이 특징인지 판별 (개선된 로직)"""
-        
-        # 특징 패턴들
-        feature_patterns = [
-            r'^【.*】',        # 【특징】 형태
-            r'^\*\s*',        # * 불릿
-            r'^・\s*',        # ・ 불릿  
-            r'^-\s*',         # - 불릿
-            r'^\d+[.)]',      # 1. 숫자 리스트
-        ]
-        
-        # 특징 키워드 (일본어)
-        feature_keywords = [
-            '素材', '材質', '機能', '特徴', '仕様', '性能', '効果',
-            '対応', '搭載', '採用', '使用', '設計', '製造', '開発',
-            '防水', '防塵', '耐久', '軽量', '高品質', 'プレミアム',
-            'サイズ', '重量', '容量', '時間', '速度', '温度', '圧力'
-        ]
+    def _is_feature_sentence(sentence: str, hits: Optional[KeywordHits] = None) -> bool:
+        """문장이 특징인지 판별 (개선된 로직)
         
+        hits: 이미 검색한 키워드 결과 (없으면 새로 검색)
+        """
         # 패턴 체크
-        for pattern in feature_patterns:
-            if re.match(pattern, sentence):
-                return True
+        if _FEATURE_SENTENCE_RE.match(sentence):
+            return True
         
         # 키워드 밀도 체크 (30글자당 1개 이상)
-        keyword_count = sum(1 for kw in feature_keywords if kw in sentence)
+        hits = hits or keyword_matcher.scan(sentence)
+        keyword_count = hits.distinct('feature_sentence')
         keyword_density = keyword_count / max(len(sentence) / 30, 1)
         
         return (keyword_density >= 1.0 and 
@@ -78,17 +124,14 @@ class SmartExtractor:
                 '。' in sentence or '!' in sentence or sentence.endswith('ます'))
     
     @staticmethod
-    def _is_description_sentence(sentence: str) -> bool:
+    def _is_description_sentence(sentence: str, hits: Optional[KeywordHits] = None) -> bool:
         """문장이 설명인지 판별"""
+        if len(sentence) <= 50:
+            return False
         
-        description_indicators = [
-            'について', 'です', 'ます', 'である', 'であり',
-            '商品', '製品', 'ブランド', '会社', 'メーカー'
-        ]
-        
-        return (len(sentence) > 50 and
-                any(ind in sentence for ind in description_indicators) and
-                not SmartExtractor._is_feature_sentence(sentence))
+        hits = hits or keyword_matcher.scan(sentence)
+        return (hits.any('description_sentence') and
+                not SmartExtractor._is_feature_sentence(sentence, hits))
     
     @staticmethod
     def extract_smart_features_and_description(soup: BeautifulSoup) -> Dict[str, any]:
@@ -119,9 +162,10 @@ class SmartExtractor:
         feature_texts = []
         
         for text in text_blocks:
-            if SmartExtractor._is_feature_text(text):
+            hits = keyword_matcher.scan(text)
+            if SmartExtractor._is_feature_text(text, hits):
                 feature_texts.append(text)
-            elif SmartExtractor._is_description_text(text):
+            elif SmartExtractor._is_description_text(text, hits):
                 description_texts.append(text)
         
         # 중복 제거 및 정리
@@ -134,58 +178,33 @@ class SmartExtractor:
         }
     
     @staticmethod
-    def _is_feature_text(text: str) -> bool:
+    def _is_feature_text(text: str, hits: Optional[KeywordHits] = None) -> bool:
         """텍스트가 특징(feature)인지 판별"""
-        
-        # 특징을 나타내는 패턴들
-        feature_indicators = [
-            r'^【.*】',  # 【브랜드】, 【특징】 형태
-            r'^\*',     # * 불릿 포인트
-            r'^・',     # ・ 불릿 포인트
-            r'^-',      # - 불릿 포인트
-            r'^\d+\.',  # 1. 숫자 리스트
-        ]
-        
-        # 특징 키워드들
-        feature_keywords = [
-            '素材', '材質', '機能', '特徴', '仕様', '性能',
-            '対応', '搭載', '採用', '使用', '設計', '製造',
-            'サイズ', '重量', '容量', '時間', '速度', '温度'
-        ]
-        
         # 패턴 매칭
-        for pattern in feature_indicators:
-            if re.match(pattern, text):
-                return True
+        if _FEATURE_TEXT_RE.match(text):
+            return True
         
         # 키워드 매칭 (2개 이상 포함시 특징으로 판별)
-        keyword_count = sum(1 for keyword in feature_keywords if keyword in text)
+        hits = hits or keyword_matcher.scan(text)
+        keyword_count = hits.distinct('feature_text')
         if keyword_count >= 2:
             return True
         
         # 짧고 구체적인 텍스트는 특징
-        if 20 <= len(text) <= 100 and any(kw in text for kw in feature_keywords):
+        if 20 <= len(text) <= 100 and keyword_count:
             return True
         
         return False
     
     @staticmethod  
-    def _is_description_text(text: str) -> bool:
+    def _is_description_text(text: str, hits: Optional[KeywordHits] = None) -> bool:
         """텍스트가 설명(description)인지 판별"""
-        
-        # 설명을 나타내는 키워드들
-        description_keywords = [
-            '商品の説明', '製品について', '概要', 'について',
-            'です', 'ます', 'である', 'であり'
-        ]
-        
         # 긴 문장이면서 설명 키워드 포함
-        if (len(text) > 50 and 
-            any(kw in text for kw in description_keywords) and
-            not SmartExtractor._is_feature_text(text)):
-            return True
+        if len(text) <= 50:
+            return False
         
-        return False
+        hits = hits or keyword_matcher.scan(text)
+        return hits.any('description_text') and not SmartExtractor._is_feature_text(text, hits)
     
     @staticmethod
     def extract_smart_weight_dimensions(text: str) -> Dict[str, Optional[str]]:
@@ -0,0 +1,86 @@
+import re
+from dataclasses import dataclass
+from typing import List, Sequence
+
+# 구간 경계 (경계 문자열은 번역하지 않고 그대로 유지)
+# - 줄바꿈, 【…】 / […] 머리말 괄호
+# - 공백으로 둘러싼 구분자 (카테고리 ' > ', ' / ', ' | ' 등)
+# - 문장 끝 (。！？ 뒤, 문장부호는 앞 문장에 포함)
+SEGMENT_BOUNDARY_PATTERN = re.compile(
+    r'(\s*[\n【】［］\[\]]\s*|\s+[>›»/|｜・]\s+|(?<=[。！？])\s*)'
+)
+
+# 일본어 문자 (히라가나/가타카나/한자/반각 가타카나/々)
+JAPANESE_PATTERN = re.compile('[\u3005\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uff66-\uff9f]')
+
+WHITESPACE_PATTERN = re.compile(r'(\s+)')
+
+
+def is_protected(text: str) -> bool:
+    """번역하지 않는 구간인지 (일본어 문자가 없는 모델번호/수치+단위/영문 브랜드/기호)"""
+    return not JAPANESE_PATTERN.search(text)
+
+
+@dataclass
+class _Piece:
+    text: str
+    translatable: bool
+
+
+class SegmentedText:
+    """텍스트를 번역 구간과 보호 구간으로 나눈 결과
+
+    경계(줄바꿈, 【】 머리말, 카테고리 구분자, 문장 끝)에서 나눈 뒤, 공백으로 구분된 일본어가
+    없는 단어(모델번호, '500ml', 'Anker' 등)를 위치와 관계없이 보호 구간으로 떼어 낸다.
+    일본어에 붙어 있는 보호 대상('USB-C対応' 등)은 문장 번역 품질을 위해 구간 안에 그대로 둔다.
+    경계와 공백은 원문 그대로 보호 구간에 남으므로 번역 후 같은 순서로 이어 붙이기만 하면 된다.
+    """
+
+    def __init__(self, pieces: List[_Piece], source_chars: int):
+        self._pieces = pieces
+        self.source_chars = source_chars
+
+    @classmethod
+    def parse(cls, text: str) -> 'SegmentedText':
+        pieces: List[_Piece] = []
+
+        def add(value: str, translatable: bool) -> None:
+            if value:
+                pieces.append(_Piece(value, translatable))
+
+        for index, chunk in enumerate(SEGMENT_BOUNDARY_PATTERN.split(text)):
+            # 홀수 위치는 경계 문자열
+            if index % 2 or is_protected(chunk):
+                add(chunk, False)
+                continue
+
+            # 보호 단어 떼어 내기 (공백 단위, 짝수 위치가 단어) - 일본어 단어가 이어지는 범위만 번역 구간
+            tokens = WHITESPACE_PATTERN.split(chunk)
+            position = 0
+            run_start = run_end = None
+            for word in range(0, len(tokens), 2):
+                if not is_protected(tokens[word]):
+                    if run_start is None:
+                        run_start = word
+                    run_end = word + 1
+                elif run_start is not None:
+                    add(''.join(tokens[position:run_start]), False)
+                    add(''.join(tokens[run_start:run_end]), True)
+                    position, run_start = run_end, None
+            if run_start is not None:
+                add(''.join(tokens[position:run_start]), False)
+                add(''.join(tokens[run_start:run_end]), True)
+                position = run_end
+            add(''.join(tokens[position:]), False)
+
+        return cls(pieces, len(text))
+
+    @property
+    def texts(self) -> List[str]:
+        """번역할 구간 (순서대로, 중복 포함)"""
+        return [piece.text for piece in self._pieces if piece.translatable]
+
+    def render(self, translations: Sequence[str]) -> str:
+        """번역문을 보호 구간과 함께 원래 순서로 이어 붙임 (texts와 같은 순서, 구간 사이 공백은 원문 그대로)"""
+        remaining = iter(translations)
+        return ''.join(next(remaining, piece.text) if piece.translatable else piece.text for piece in self._pieces)
@@ -0,0 +1,96 @@
+import re
+import unicodedata
+from typing import Optional, Tuple
+
+# 무게 단위 → 그램 환산값
+WEIGHT_UNITS = {
+    'kg': 1000.0, 'キログラム': 1000.0, 'キロ': 1000.0, 'kilograms': 1000.0, 'kilogram': 1000.0,
+    'g': 1.0, 'グラム': 1.0, 'grams': 1.0, 'gram': 1.0,
+    'mg': 0.001, 'ミリグラム': 0.001,
+    'lb': 453.59237, 'lbs': 453.59237, 'pounds': 453.59237, 'pound': 453.59237, 'ポンド': 453.59237,
+    'oz': 28.349523, 'ounces': 28.349523, 'ounce': 28.349523, 'オンス': 28.349523,
+}
+
+# 길이 단위 → 센티미터 환산값
+LENGTH_UNITS = {
+    'cm': 1.0, 'センチメートル': 1.0, 'センチ': 1.0,
+    'mm': 0.1, 'ミリメートル': 0.1, 'ミリ': 0.1,
+    'm': 100.0, 'メートル': 100.0,
+    'inches': 2.54, 'inch': 2.54, 'in': 2.54, 'インチ': 2.54,
+}
+
+# 현실적인 범위 (벗어나면 무시)
+WEIGHT_RANGE_G = (1.0, 1_000_000.0)
+LENGTH_RANGE_CM = (0.1, 1000.0)
+
+_NUMBER = r'(\d+(?:,\d{3})*(?:\.\d+)?)'
+
+
+def _unit_pattern(units) -> str:
+    # 긴 단위부터 시도 ('kg'이 'g'보다, 'mm'이 'm'보다 먼저)
+    return '|'.join(re.escape(unit) for unit in sorted(units, key=len, reverse=True))
+
+
+_WEIGHT_RE = re.compile(
+    _NUMBER + r'\s*(' + _unit_pattern(WEIGHT_UNITS) + r')(?![a-z])',
+    re.IGNORECASE
+)
+_LENGTH_UNIT = r'(' + _unit_pattern(LENGTH_UNITS) + r')'
+_DIMENSIONS_RE = re.compile(
+    _NUMBER + r'\s*' + _LENGTH_UNIT + r'?\s*[x×*]\s*'
+    + _NUMBER + r'\s*' + _LENGTH_UNIT + r'?\s*[x×*]\s*'
+    + _NUMBER + r'\s*' + _LENGTH_UNIT + r'(?![a-z])',
+    re.IGNORECASE
+)
+
+# 방향 표시 문자 (Amazon 상세 표의 '‏ : ‎' 등)
+_BIDI_MARKS = dict.fromkeys(map(ord, '‎‏‪‫‬‭‮'), None)
+
+
+def normalize_text(text: str) -> str:
+    """NFKC 정규화 (전각 숫자/단위/기호 → 반각) + 방향 표시 문자 제거 + 공백 정리"""
+    text = unicodedata.normalize('NFKC', text).translate(_BIDI_MARKS)
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def _to_float(number: str) -> float:
+    return float(number.replace(',', ''))
+
+
+def parse_weight_g(text: Optional[str]) -> Optional[float]:
+    """텍스트에서 첫 번째 무게 값을 그램으로 반환 ('５００ ｇ' → 500.0, '1.2kg' → 1200.0)"""
+    if not text:
+        return None
+    for match in _WEIGHT_RE.finditer(normalize_text(text)):
+        grams = _to_float(match.group(1)) * WEIGHT_UNITS[match.group(2).lower()]
+        if WEIGHT_RANGE_G[0] <= grams <= WEIGHT_RANGE_G[1]:
+            return round(grams, 3)
+    return None
+
+
+def parse_dimensions_cm(text: Optional[str]) -> Optional[Tuple[float, float, float]]:
+    """텍스트에서 첫 번째 3차원 치수를 센티미터 (a, b, c)로 반환
+
+    '26.4 x 21.7 x 8.4 cm', '10cm x 5cm x 3cm', '300×200×100mm' 형식을 처리하며,
+    숫자별 단위가 없으면 마지막 단위를 사용한다.
+    """
+    if not text:
+        return None
+    for match in _DIMENSIONS_RE.finditer(normalize_text(text)):
+        last_unit = match.group(6).lower()
+        values = []
+        for number, unit in ((match.group(1), match.group(2)), (match.group(3), match.group(4)), (match.group(5), match.group(6))):
+            values.append(round(_to_float(number) * LENGTH_UNITS[(unit or last_unit).lower()], 2))
+        if all(LENGTH_RANGE_CM[0] <= value <= LENGTH_RANGE_CM[1] for value in values):
+            return values[0], values[1], values[2]
+    return None
+
+
+def format_weight_kg(grams: float) -> str:
+    """그램 → 기존 weight 필드 형식 (kg, 소수 3자리)"""
+    return f"{grams / 1000:.3f}"
+
+
+def format_dimensions_cm(dimensions: Tuple[float, float, float]) -> str:
+    """(a, b, c) cm → '26.4 x 21.7 x 8.4 cm'"""
+    return ' x '.join(f"{value:g}" for value in dimensions) + ' cm'
@@ -3,9 +3,17 @@ from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from app.api.scraper import router as scraper_router
+from app.core.http_client import http_client_manager
+from app.core.html_cache import html_cache
+from app.core.product_cache import product_cache
+from app.core.parse_executor import parse_executor
+from app.services.content_fallback import content_fallback
+from app.services.translation_memory import translation_memory
+from app.services.translation_jobs import translation_jobs
 
 # 로깅 설정
 def setup_logging():
@@ -43,10 +51,30 @@ def setup_logging():
 # 로깅 초기화
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명주기 - 공유 리소스 생성/정리"""
+    await http_client_manager.start()
+    parse_executor.start()
+    translation_jobs.start()
+    try:
+        yield
+    finally:
+        await translation_jobs.shutdown()
+        await product_cache.close()
+        await http_client_manager.close()
+        await html_cache.close()
+        await translation_memory.close()
+        parse_executor.shutdown()
+        content_fallback.shutdown()
+
+
 app = FastAPI(
     title="EctoKorea Multi-Site Scraper",
     description="일본 쇼핑몰 상품 정보 스크래핑 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 (Laravel 및 프론트엔드에서 호출 허용)
@@ -91,7 +119,8 @@ async def ectokorea_root():
             "scrape_amazon_bestsellers_asins": "/ectokorea/api/v1/scrape/amazon/bestsellers/asins?url={bestsellers_url}&limit={limit}",
             "scrape_rakuten": "/ectokorea/api/v1/scrape/rakuten?shopId={shopId}&itemCode={itemCode}",
             "scrape_jins": "/ectokorea/api/v1/scrape/jins?productId={productId}",
-            "supported_sites": "/ectokorea/api/v1/sites"
+            "supported_sites": "/ectokorea/api/v1/sites",
+            "stats": "/ectokorea/api/v1/stats"
         }
     }
 
@@ -0,0 +1,10 @@
+import os
+import sys
+import tempfile
+
+# app 모듈 import 전에 설정: 로컬 데이터는 임시 디렉터리, 파싱은 같은 프로세스에서 실행
+os.environ.setdefault('SCRAPER_DATA_DIR', tempfile.mkdtemp(prefix='scraper-test-'))
+os.environ.setdefault('PARSE_EXECUTOR', 'inline')
+os.environ.setdefault('EXTRACT_FALLBACK_EXECUTOR', 'inline')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
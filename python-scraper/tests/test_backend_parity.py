@@ -0,0 +1,38 @@
+from pathlib import Path
+
+import pytest
+
+from app.core.exceptions import ParsingError
+from app.scrapers.amazon.amazon_scraper import parse_product_html
+from app.utils.html_backend import BACKEND_BS4, BACKEND_LXML, parse_document
+
+FIXTURES = sorted((Path(__file__).parent / 'fixtures').glob('product_*.html'))
+URL = 'https://www.amazon.co.jp/dp/B000000001'
+
+# 기준 조합 (BeautifulSoup + 전체 문서)
+REFERENCE = (BACKEND_BS4, False)
+VARIANTS = [(BACKEND_LXML, False), (BACKEND_LXML, True), (BACKEND_BS4, True)]
+
+
+def _parse(path: Path, backend: str, partial: bool) -> dict:
+    """Product.model_dump(mode='json') 결과 (수집 시각 제외)"""
+    data, _ = parse_product_html(path.read_text(encoding='utf-8'), 'B000000001', URL, partial, backend)
+    data.pop('scraped_at')
+    return data
+
+
+@pytest.mark.parametrize('path', FIXTURES, ids=lambda path: path.stem)
+@pytest.mark.parametrize('backend,partial', VARIANTS, ids=lambda value: str(value))
+def test_product_matches_reference(path, backend, partial):
+    """PARSER_BACKEND(lxml/bs4) × PARSE_PARTIAL(on/off) 조합의 결과가 기준과 같음"""
+    assert _parse(path, backend, partial) == _parse(path, *REFERENCE)
+
+
+def test_fixtures_present():
+    assert len(FIXTURES) >= 3
+
+
+def test_lxml_parse_failure_is_raised():
+    """lxml이 거부하는 문서는 빈 트리 대신 ParsingError"""
+    with pytest.raises(ParsingError):
+        parse_document('', BACKEND_LXML)
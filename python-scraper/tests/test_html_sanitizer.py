@@ -0,0 +1,76 @@
+import pytest
+
+from app.scrapers.amazon.amazon_scraper import APLUS_MEDIA_MARKER, DESCRIPTION_POLICY, AmazonScraper
+from app.scrapers.amazon.page_context import PageContext
+from app.utils.html_backend import BACKEND_BS4, BACKEND_LXML, parse_document
+from app.utils.html_sanitizer import sanitize_html
+
+MEDIA = f'https://m.media-amazon.com/images/S/{APLUS_MEDIA_MARKER}-prod'
+MODULE = '<div class="celwidget 3p-module-b">{}</div>'
+
+
+def _sanitize(body: str, backend: str) -> str:
+    document = parse_document(f'<html><body><div id="aplus">{body}</div></body></html>', backend)
+    return sanitize_html(document.select_one('#aplus'), DESCRIPTION_POLICY).html
+
+
+@pytest.fixture(params=[BACKEND_LXML, BACKEND_BS4])
+def backend(request):
+    return request.param
+
+
+def test_modules_with_images_are_not_slot_filled(backend):
+    """이미지가 있는 모듈 자리는 그대로 두고 각 이미지를 한 번씩 순서대로 출력"""
+    body = (
+        MODULE.format(f'<div><img src="{MEDIA}/one.jpg"></div>')
+        + MODULE.format(f'<div><img src="{MEDIA}/two.jpg"></div><p>説明文です。</p>')
+    )
+    html = _sanitize(body, backend)
+
+    assert html.count('one.jpg') == 1
+    assert html.count('two.jpg') == 1
+    assert html.index('one.jpg') < html.index('two.jpg')
+    assert '商品の説明' not in html
+
+
+def test_empty_slot_filled_from_its_own_lazy_image(backend):
+    """빈 자리는 그 자리 안의 지연 로딩 이미지로만 채움 (다른 모듈 이미지는 사용하지 않음)"""
+    body = (
+        MODULE.format(f'<div><span data-src="{MEDIA}/lazy.jpg"></span></div>')
+        + MODULE.format('<div> </div>')
+        + MODULE.format(f'<div><img src="{MEDIA}/two.jpg"></div>')
+    )
+    html = _sanitize(body, backend)
+
+    assert html.count('lazy.jpg') == 1
+    assert 'alt="商品の説明"' in html
+    assert html.count('two.jpg') == 1
+    assert html.index('lazy.jpg') < html.index('two.jpg')
+
+
+def test_slot_with_other_media_or_foreign_lazy_image_is_kept(backend):
+    """동영상이 있는 자리와 A+ 이미지가 아닌 지연 로딩 주소는 채우지 않음"""
+    body = (
+        MODULE.format(f'<div><video data-src="{MEDIA}/clip.jpg"></video></div>')
+        + MODULE.format('<div><span data-src="https://example.com/banner.jpg"></span></div>')
+    )
+    html = _sanitize(body, backend)
+
+    assert '<img' not in html
+
+
+def test_description_keeps_each_module_image_once(backend):
+    """상품 설명 추출: 두 이미지 모듈의 이미지가 중복/누락 없이 한 번씩"""
+    html = (
+        '<html><body><div id="aplus"><h2>商品の説明</h2>'
+        + MODULE.format(f'<div><img src="{MEDIA}/one.jpg"></div>')
+        + MODULE.format(f'<div><img src="{MEDIA}/two.jpg"></div>')
+        + '<p>' + '高品質な素材を使用した使いやすい商品です。' * 5 + '</p>'
+        + '</div></body></html>'
+    )
+    ctx = PageContext(parse_document(html, backend), 'https://www.amazon.co.jp/dp/B000000001', html)
+    description = AmazonScraper()._extract_description_html_jp(ctx)
+
+    assert description.count('one.jpg') == 1
+    assert description.count('two.jpg') == 1
+    assert description.index('one.jpg') < description.index('two.jpg')
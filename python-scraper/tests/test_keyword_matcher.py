@@ -0,0 +1,79 @@
+import random
+
+import pytest
+
+from app.scrapers.amazon.amazon_scraper import CODE_INDICATORS, code_matcher
+from app.utils.keyword_matcher import KeywordMatcher
+from app.utils.smart_extractor import CLASSIFIER_KEYWORDS, keyword_matcher
+
+
+def _naive_counts(keywords, text):
+    """기준: 키워드마다 모든 위치에서 겹치는 출현까지 센 횟수"""
+    return {
+        keyword: count for keyword in dict.fromkeys(keywords)
+        if (count := sum(1 for i in range(len(text)) if text.startswith(keyword, i)))
+    }
+
+
+def _assert_parity(matcher, tables, text, ignore_case=False):
+    normalized = text.lower() if ignore_case else text
+    hits = matcher.scan(text)
+    all_keywords = [(kw.lower() if ignore_case else kw) for keywords in tables.values() for kw in keywords]
+    assert hits.counts == _naive_counts(all_keywords, normalized)
+    for group, keywords in tables.items():
+        keywords = [(kw.lower() if ignore_case else kw) for kw in keywords]
+        # 기존 분류 코드의 sum(1 for kw in keywords if kw in text) / any(...)
+        assert hits.distinct(group) == len({kw for kw in keywords if kw in normalized})
+        assert hits.any(group) == any(kw in normalized for kw in keywords)
+
+
+@pytest.mark.parametrize('text', [
+    'ああああ',
+    'abcabcab',
+    'ababa aba bab',
+    'この商品は軽量でコンパクト、持ち運びに便利です。',
+    '',
+])
+def test_overlapping_keywords_match_naive_loop(text):
+    """접두어/포함/자기 겹침/끝-시작 겹침 키워드"""
+    tables = {
+        'a': ['ああ', 'あ', 'aba', 'ab', 'b'],
+        'b': ['bab', 'abc', 'cab', 'ca', '軽量', '軽量で', '便利'],
+    }
+    matcher = KeywordMatcher(tables)
+    if text:
+        _assert_parity(matcher, tables, text)
+    else:
+        assert matcher.scan(text).counts == {}
+
+
+def test_random_tables_match_naive_loop():
+    """작은 문자 집합의 무작위 표/텍스트에서 기존 반복 검사와 같은 결과"""
+    rng = random.Random(16)
+    alphabet = 'abあい'
+    for _ in range(300):
+        tables = {
+            f'g{index}': [''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 4)))
+                          for _ in range(rng.randint(1, 6))]
+            for index in range(rng.randint(1, 3))
+        }
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 40)))
+        _assert_parity(KeywordMatcher(tables), tables, text)
+
+
+def test_ignore_case():
+    tables = {'code': ['Function', 'VAR ']}
+    _assert_parity(KeywordMatcher(tables, ignore_case=True), tables, 'function f() { var x; FUNCTION }', ignore_case=True)
+
+
+def test_shipped_tables_match_naive_loop():
+    """실제 분류 키워드 표 (smart_extractor / 코드 판별)"""
+    text = ('この商品は軽量で持ち運びに便利です。【特徴】防水仕様、サイズ: 30cm。'
+            'function(){var a=document.getElementById("x");} .a-box{display:none}')
+    _assert_parity(keyword_matcher, CLASSIFIER_KEYWORDS, text)
+    _assert_parity(code_matcher, CODE_INDICATORS, text, ignore_case=True)
+
+
+def test_groups_in_first_appearance_order():
+    matcher = KeywordMatcher({'g': ['c', 'a', 'b']})
+    assert matcher.scan('b a c b').groups == {'g': ['b', 'a', 'c']}
@@ -0,0 +1,60 @@
+import asyncio
+
+from app.config.settings import ProductCacheSettings
+from app.core.product_cache import ProductResultCache
+from app.models.product import Product
+from app.scrapers.amazon import amazon_scraper
+from app.scrapers.amazon.amazon_scraper import AmazonScraper
+
+ASIN = 'B000000001'
+
+
+def _product(price: float = 1000.0) -> Product:
+    return Product(site='amazon', product_id=ASIN, url=f'https://www.amazon.co.jp/dp/{ASIN}',
+                   name='テスト商品', price=price, features=['軽量'], site_specific_data={'asin': ASIN})
+
+
+def test_cached_product_is_not_shared_with_callers():
+    """호출자가 결과를 수정해도 캐시 항목은 그대로"""
+    cache = ProductResultCache(ProductCacheSettings(enabled=True, max_entries=10, volatile_fresh=300,
+                                                    volatile_stale=1800, static_ttl=3600))
+
+    async def load():
+        return _product()
+
+    async def run():
+        first = await cache.get_or_load('key', load, load)
+        first.name = '変更'
+        first.features.append('追加')
+        first.site_specific_data['translation_services'] = []
+        return await cache.get_or_load('key', load, load)
+
+    second = asyncio.run(run())
+    assert second.name == 'テスト商品'
+    assert second.features == ['軽量']
+    assert 'translation_services' not in second.site_specific_data
+    assert cache.hits_fresh == 1
+
+
+def test_volatile_refresh_bypasses_html_cache(monkeypatch):
+    """가격/재고 갱신은 호출자의 max_age와 관계없이 원본 HTML을 새로 받음"""
+    cache = ProductResultCache(ProductCacheSettings(enabled=True, max_entries=10, volatile_fresh=0,
+                                                    volatile_stale=0, static_ttl=3600))
+    monkeypatch.setattr(amazon_scraper, 'product_cache', cache)
+    calls = []
+
+    async def fake_uncached(self, asin, translate, max_age=None, extract_fallback=True):
+        calls.append((translate, max_age, extract_fallback))
+        return _product(price=1000.0 + len(calls))
+
+    monkeypatch.setattr(AmazonScraper, '_scrape_product_uncached', fake_uncached)
+
+    async def run():
+        scraper = AmazonScraper()
+        await scraper.scrape_product(ASIN, translate=True, max_age=3600)
+        return await scraper.scrape_product(ASIN, translate=True, max_age=3600)
+
+    product = asyncio.run(run())
+    assert calls == [(True, 3600, True), (False, None, False)]
+    assert product.price == 1002.0
+    assert cache.refresh_volatile == 1
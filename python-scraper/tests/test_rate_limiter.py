@@ -0,0 +1,61 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.config.settings import RateLimitSettings, ResilienceSettings
+from app.core.exceptions import BlockedPageError
+from app.core.http_client import http_client_manager
+from app.core.rate_limiter import rate_limiter
+from app.core.resilience import ResilientFetcher
+from app.scrapers.amazon import amazon_scraper
+from app.scrapers.amazon.amazon_scraper import AmazonScraper
+from tests.test_resilience import CAPTCHA_PAGE, HOST
+
+PRODUCT_PAGE = b'<html><body><span id="productTitle">' + b'x' * 2048 + b'</span></body></html>'
+LIMITS = RateLimitSettings(enabled=True, amazon_rps=1000.0, amazon_max_rps=2000.0, min_rps=1.0,
+                           burst=100.0, increase_step=10.0, decrease_factor=0.5)
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    """응답 본문을 pages 목록에서 차례로 돌려주는 Amazon 스크래퍼"""
+    pages = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=pages.pop(0), headers={'content-type': 'text/html'})
+
+    monkeypatch.setattr(http_client_manager, '_clients', {})
+    monkeypatch.setattr(http_client_manager, '_build_client',
+                        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(rate_limiter, 'config', LIMITS)
+    monkeypatch.setattr(rate_limiter, '_buckets', {})
+    monkeypatch.setattr(amazon_scraper, 'resilient_fetcher', ResilientFetcher(
+        ResilienceSettings(max_attempts=1, base_delay=0.0, max_delay=0.0, deadline=5.0,
+                           breaker_failure_threshold=100, breaker_cooldown=60.0)))
+    instance = AmazonScraper()
+    instance.pages = pages
+    return instance
+
+
+def test_captcha_page_decreases_rate(scraper):
+    scraper.pages.extend([CAPTCHA_PAGE] * 3)
+
+    async def run():
+        for _ in range(3):
+            with pytest.raises(BlockedPageError):
+                await scraper._fetch(f'https://{HOST}/dp/B000000001')
+
+    asyncio.run(run())
+    stats = rate_limiter.get_stats()['hosts'][HOST]
+    assert stats['rate_rps'] == pytest.approx(LIMITS.amazon_rps * LIMITS.decrease_factor ** 3)
+    assert stats['throttled_total'] == 3
+    assert stats['last_throttle_reason'] == 'captcha'
+
+
+def test_product_page_increases_rate(scraper):
+    scraper.pages.append(PRODUCT_PAGE)
+    asyncio.run(scraper._fetch(f'https://{HOST}/dp/B000000001'))
+    stats = rate_limiter.get_stats()['hosts'][HOST]
+    assert stats['rate_rps'] == pytest.approx(LIMITS.amazon_rps + LIMITS.increase_step)
+    assert stats['throttled_total'] == 0
@@ -0,0 +1,102 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.config.settings import ResilienceSettings, RateLimitSettings
+from app.core.exceptions import BlockedPageError, CircuitOpenError
+from app.core.http_client import http_client_manager
+from app.core.rate_limiter import rate_limiter
+from app.core.resilience import ResilientFetcher
+from app.core import resilience
+from app.scrapers.amazon import amazon_scraper
+from app.scrapers.amazon.amazon_scraper import AmazonScraper
+
+HOST = 'www.amazon.co.jp'
+CAPTCHA_PAGE = (
+    b'<html><body><form action="/errors/validateCaptcha">'
+    b'<h4>\xe6\x96\x87\xe5\xad\x97\xe3\x82\x92\xe5\x85\xa5\xe5\x8a\x9b\xe3\x81\x97\xe3\x81\xa6\xe3\x81\x8f\xe3\x81\xa0\xe3\x81\x95\xe3\x81\x84</h4>'
+    b'</form></body></html>'
+)
+CONFIG = ResilienceSettings(max_attempts=1, base_delay=0.0, max_delay=0.0, deadline=5.0,
+                            breaker_failure_threshold=5, breaker_cooldown=60.0)
+
+
+@pytest.fixture
+def mock_transport(monkeypatch):
+    """모든 요청에 captcha 페이지를 200으로 응답 (요청 수 기록)"""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, content=CAPTCHA_PAGE, headers={'content-type': 'text/html'})
+
+    monkeypatch.setattr(http_client_manager, '_clients', {})
+    monkeypatch.setattr(http_client_manager, '_build_client',
+                        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(rate_limiter, 'config', RateLimitSettings(enabled=False))
+    monkeypatch.setattr(rate_limiter, '_buckets', {})
+    return calls
+
+
+def test_validator_failures_open_breaker(mock_transport):
+    fetcher = ResilientFetcher(CONFIG)
+
+    async def run():
+        for _ in range(CONFIG.breaker_failure_threshold):
+            response = await fetcher.get(f'https://{HOST}/dp/B000000001', validate=lambda r: 'captcha')
+            assert response.status_code == 200
+        with pytest.raises(CircuitOpenError):
+            await fetcher.get(f'https://{HOST}/dp/B000000001', validate=lambda r: 'captcha')
+
+    asyncio.run(run())
+    breaker = fetcher.get_stats()['breakers'][HOST]
+    assert breaker['state'] == 'open'
+    assert breaker['opened_total'] == 1
+    assert breaker['last_failure_reason'] == 'captcha'
+    assert len(mock_transport) == CONFIG.breaker_failure_threshold
+
+
+def test_validator_passing_records_success(mock_transport):
+    fetcher = ResilientFetcher(CONFIG)
+
+    async def run():
+        for _ in range(CONFIG.breaker_failure_threshold * 2):
+            await fetcher.get(f'https://{HOST}/dp/B000000001', validate=lambda r: None)
+
+    asyncio.run(run())
+    breaker = fetcher.get_stats()['breakers'][HOST]
+    assert breaker['state'] == 'closed'
+    assert breaker['consecutive_failures'] == 0
+
+
+def test_blocked_page_retried_before_giving_up(mock_transport):
+    fetcher = ResilientFetcher(ResilienceSettings(max_attempts=3, base_delay=0.0, max_delay=0.0, deadline=5.0,
+                                                  breaker_failure_threshold=10, breaker_cooldown=60.0))
+    response = asyncio.run(fetcher.get(f'https://{HOST}/dp/B000000001', validate=lambda r: 'captcha'))
+    assert response.status_code == 200
+    assert len(mock_transport) == 3
+    assert fetcher.retries_total == 2
+    assert fetcher.get_stats()['breakers'][HOST]['consecutive_failures'] == 3
+
+
+def test_consecutive_captcha_pages_open_breaker(mock_transport, monkeypatch):
+    fetcher = ResilientFetcher(CONFIG)
+    monkeypatch.setattr(resilience, 'resilient_fetcher', fetcher)
+    monkeypatch.setattr(amazon_scraper, 'resilient_fetcher', fetcher)
+    scraper = AmazonScraper()
+    url = f'https://{HOST}/dp/B000000001'
+
+    async def run():
+        for _ in range(CONFIG.breaker_failure_threshold):
+            with pytest.raises(BlockedPageError) as blocked:
+                await scraper._fetch(url)
+            assert blocked.value.kind == 'captcha'
+        with pytest.raises(CircuitOpenError):
+            await scraper._fetch(url)
+
+    asyncio.run(run())
+    breaker = fetcher.get_stats()['breakers'][HOST]
+    assert breaker['state'] == 'open'
+    assert breaker['opened_total'] == 1
+    assert breaker['consecutive_failures'] == CONFIG.breaker_failure_threshold
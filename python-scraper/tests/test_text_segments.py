@@ -0,0 +1,71 @@
+import asyncio
+from dataclasses import replace
+
+import pytest
+
+from app.config.settings import settings
+from app.services.translation_providers import StubTranslateProvider
+from app.services.translation_service import BatchTranslationService, TranslationService
+from app.utils.text_segments import SegmentedText
+
+TITLE = 'ソニー ヘッドホン WH-1000XM5 ブラック'
+
+
+@pytest.mark.parametrize('text', [
+    TITLE,
+    'とても速い！USB-C対応',
+    'これは文です。 次の文。\n\n【特徴】 軽量 / 500ml / 防水',
+    '【2024年モデル】 SONY WH-1000XM5 ワイヤレスノイズキャンセリングヘッドホン ブラック',
+    '  前後に空白  ',
+    'Anker PowerCore 10000',
+    '',
+])
+def test_render_round_trip(text):
+    """원문 구간을 그대로 넣으면 원문 복원"""
+    document = SegmentedText.parse(text)
+    assert document.render(document.texts) == text
+
+
+def test_mid_sentence_codes_are_not_sent():
+    document = SegmentedText.parse('Anker 充電器 PowerCore 10000 大容量 モバイルバッテリー')
+    assert document.texts == ['充電器', '大容量 モバイルバッテリー']
+    assert document.render(['T1', 'T2']) == 'Anker T1 PowerCore 10000 T2'
+
+
+def test_render_keeps_original_separators():
+    """문장 끝 사이에 공백이 없으면 번역문 사이에도 공백을 넣지 않음"""
+    assert SegmentedText.parse('とても速い！USB-C対応').render(['T2', 'T3']) == 'T2T3'
+    assert SegmentedText.parse('速い。 安い。').render(['T1', 'T2']) == 'T1 T2'
+    assert SegmentedText.parse('速い。\n安い。').render(['T1', 'T2']) == 'T1\nT2'
+
+
+def test_fully_protected_text():
+    document = SegmentedText.parse('WH-1000XM5 / 500ml')
+    assert document.texts == []
+    assert document.render([]) == 'WH-1000XM5 / 500ml'
+
+
+def test_product_report_counts_saved_chars(monkeypatch):
+    """상품 1건의 구간 분리 절감 리포트 (보호/중복 구간은 보내지 않음)"""
+    config = replace(settings.translation, provider='stub', segmentation=True, hedge_enabled=False, stub_latency_ms=0)
+    service = TranslationService()
+    monkeypatch.setattr(service, 'batch_service', BatchTranslationService(config, StubTranslateProvider(config)))
+
+    product = {'name': TITLE, 'features': [TITLE, '容量 500ml', 'ブラック']}
+    translated, services_info = asyncio.run(service.translate_product_data_with_info(product))
+
+    assert translated['name'] == '[ko] ソニー ヘッドホン WH-1000XM5 [ko] ブラック'
+    assert translated['features'][1] == '[ko] 容量 500ml'
+    report = services_info[-1]
+    assert report['field'] == 'all' and report['service'] == 'segmentation'
+    # 원문 62자 = 보호 30자 + 중복 17자 + 전송 15자 ('ソニー ヘッドホン', 'ブラック', '容量')
+    assert report['naive_chars'] == 2 * len(TITLE) + len('容量 500ml') + len('ブラック') == 62
+    assert report['segments'] == 6
+    assert report['unique_segments'] == 3
+    assert report['protected_chars'] == 30
+    assert report['duplicate_chars'] == 17
+    assert report['memory_chars'] == 0
+    assert report['sent_chars'] == 15
+    assert report['saved_chars'] == 47
+    assert report['saved_ratio'] == round(47 / 62, 3)
+    assert service.get_stats()['segments']['naive_chars'] == 62
@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+from app.config.settings import TranslationMemorySettings
+from app.services.translation_memory import TranslationMemory
+
+
+def _memory(tmp_path, name: str) -> TranslationMemory:
+    return TranslationMemory(TranslationMemorySettings(enabled=True, path=str(tmp_path / f'{name}.sqlite3'),
+                                                       memory_entries=100, max_entries=1000))
+
+
+def test_export_import_round_trip(tmp_path):
+    """내보낸 항목을 다른 메모리로 가져오면 같은 번역 조회 / 같은 내보내기 결과"""
+    source, target = _memory(tmp_path, 'source'), _memory(tmp_path, 'target')
+
+    async def run():
+        await source.put('軽量  コンパクト', '가볍고 컴팩트', 'ja', 'ko', provider='google')
+        await source.put('ＵＳＢ充電', 'USB 충전', 'ja', 'ko', provider='google')
+        await source.put('防水', 'Waterproof', 'ja', 'en', provider='google')
+        exported = await source.export_entries()
+
+        # API처럼 JSON으로 주고받아도 그대로 복원
+        imported = await target.import_entries(json.loads(json.dumps(exported, ensure_ascii=False)))
+        results = (
+            await target.get('軽量 コンパクト', 'ja', 'ko'),
+            await target.get('USB充電', 'ja', 'ko'),       # NFKC 정규화된 키
+            await target.get('防水', 'ja', 'en'),
+            await target.get('防水', 'ja', 'ko'),
+        )
+        return exported, imported, results, await target.export_entries(), await target.export_entries('ja', 'en')
+
+    exported, imported, results, round_trip, filtered = asyncio.run(run())
+    assert imported == 3
+    assert results == ('가볍고 컴팩트', 'USB 충전', 'Waterproof', None)
+    assert round_trip == exported
+    assert [entry['source_text'] for entry in exported] == ['軽量 コンパクト', 'USB充電', '防水']
+    assert filtered == [entry for entry in exported if entry['target_lang'] == 'en']
+    asyncio.run(source.close())
+    asyncio.run(target.close())
+
+
+def test_import_overwrite(tmp_path):
+    """overwrite=False는 기존 항목 유지, True는 덮어쓰고 메모리 LRU도 갱신"""
+    memory = _memory(tmp_path, 'memory')
+    entry = {'source_lang': 'ja', 'target_lang': 'ko', 'source_text': '防水', 'translated_text': '방수 (수정)'}
+
+    async def run():
+        await memory.put('防水', '방수', 'ja', 'ko')
+        kept = await memory.import_entries([entry], overwrite=False)
+        before = await memory.get('防水', 'ja', 'ko')
+        replaced = await memory.import_entries([entry, {'source_text': '', 'translated_text': 'x'}])
+        after = await memory.get('防水', 'ja', 'ko')
+        await memory.close()
+        return kept, before, replaced, after
+
+    assert asyncio.run(run()) == (0, '방수', 1, '방수 (수정)')
@@ -0,0 +1,169 @@
+import asyncio
+from dataclasses import replace
+
+from app.config.settings import settings
+from app.services.translation_providers import ProviderMetrics, StubTranslateProvider
+from app.services.translation_service import BatchTranslationService, TranslationService
+
+# 헤징: 표본이 적으므로 hedge_initial_delay(50ms) 뒤에 2차 요청
+HEDGE_CONFIG = replace(settings.translation, provider='stub', hedge_enabled=True, hedge_initial_delay=0.05,
+                       hedge_min_delay=0.05, hedge_min_samples=20, stub_latency_ms=0)
+
+
+class ScriptedProvider(StubTranslateProvider):
+    """호출 순서대로 지연(ms)과 결과를 정하는 stub ('ok' | 'none' | 'error')"""
+
+    def __init__(self, config, script):
+        super().__init__(config)
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled_calls = []
+
+    async def _send(self, text, target_lang, source_lang):
+        call = self.calls
+        self.calls += 1
+        latency_ms, outcome = self.script[call]
+        try:
+            await asyncio.sleep(latency_ms / 1000)
+        except asyncio.CancelledError:
+            self.cancelled_calls.append(call)
+            raise
+        if outcome == 'error':
+            raise RuntimeError(f'call {call} failed')
+        if outcome == 'none':
+            return None
+        return [(f'[{target_lang}#{call}] {text}', text)]
+
+
+def _translate(provider, text='テスト'):
+    return asyncio.run(provider.translate(text, 'ko', 'ja'))
+
+
+def test_first_request_wins_without_hedge():
+    config = replace(HEDGE_CONFIG, stub_latency_ms=5, hedge_initial_delay=1.0)
+    provider = StubTranslateProvider(config)
+
+    assert _translate(provider) == [('[ko] テスト', 'テスト')]
+    assert provider.metrics.hedged == 0
+    assert provider.metrics.requests == 1
+
+
+def test_hedge_wins_and_slow_first_request_is_cancelled():
+    provider = ScriptedProvider(HEDGE_CONFIG, [(500, 'ok'), (10, 'ok')])
+
+    assert _translate(provider) == [('[ko#1] テスト', 'テスト')]
+    assert provider.metrics.hedged == 1
+    assert provider.metrics.hedge_wins == 1
+    assert provider.cancelled_calls == [0]
+    assert provider.metrics.cancelled == 1
+    assert provider.metrics.requests == 1
+
+
+def test_first_wins_after_hedge_and_hedge_is_cancelled():
+    provider = ScriptedProvider(HEDGE_CONFIG, [(100, 'ok'), (500, 'ok')])
+
+    assert _translate(provider) == [('[ko#0] テスト', 'テスト')]
+    assert provider.metrics.hedged == 1
+    assert provider.metrics.hedge_wins == 0
+    assert provider.cancelled_calls == [1]
+
+
+def test_failed_first_request_falls_through_to_hedge():
+    provider = ScriptedProvider(HEDGE_CONFIG, [(80, 'error'), (100, 'ok')])
+
+    assert _translate(provider) == [('[ko#1] テスト', 'テスト')]
+    assert provider.metrics.errors == 1
+    assert provider.metrics.hedge_wins == 1
+
+
+def test_both_requests_fail():
+    provider = ScriptedProvider(HEDGE_CONFIG, [(80, 'none'), (100, 'none')])
+
+    assert _translate(provider) is None
+    assert provider.metrics.requests == 2
+    assert provider.metrics.errors == 2
+    assert provider.cancelled_calls == []
+
+
+def test_both_requests_raise():
+    provider = ScriptedProvider(HEDGE_CONFIG, [(80, 'error'), (100, 'error')])
+
+    try:
+        _translate(provider)
+    except RuntimeError as e:
+        assert str(e) == 'call 0 failed'
+    else:
+        raise AssertionError('RuntimeError not raised')
+    assert provider.metrics.errors == 2
+
+
+def test_caller_cancellation_cancels_both_requests():
+    provider = ScriptedProvider(HEDGE_CONFIG, [(500, 'ok'), (500, 'ok')])
+
+    async def run():
+        task = asyncio.ensure_future(provider.translate('テスト', 'ko', 'ja'))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(run())
+    assert sorted(provider.cancelled_calls) == [0, 1]
+    assert provider.metrics.cancelled == 2
+
+
+def test_metrics_percentile():
+    metrics = ProviderMetrics(samples=5)
+    assert metrics.percentile(0.5) is None
+
+    for elapsed in (0.5, 0.1, 0.4, 0.2, 0.3):
+        metrics.record(elapsed, ok=True)
+    metrics.record(9.0, ok=False)      # 실패 요청은 지연 표본에서 제외
+    assert metrics.percentile(0.5) == 0.3
+    assert metrics.percentile(0.95) == 0.5
+    assert metrics.errors == 1
+
+    # 최근 samples개만 유지
+    metrics.record(0.05, ok=True)
+    assert metrics.sample_count == 5
+    assert metrics.percentile(0.0) == 0.05
+    assert metrics.to_dict()['p95_ms'] == 400.0
+
+
+def test_hedge_delay_follows_p95_after_min_samples():
+    config = replace(HEDGE_CONFIG, hedge_min_samples=3, hedge_initial_delay=2.0, hedge_min_delay=0.05)
+    provider = StubTranslateProvider(config)
+    assert provider.hedge_delay() == 2.0
+
+    for elapsed in (0.2, 0.3, 0.4):
+        provider.metrics.record(elapsed, ok=True)
+    assert provider.hedge_delay() == 0.4
+
+    fast = StubTranslateProvider(config)
+    for elapsed in (0.001, 0.002, 0.003):
+        fast.metrics.record(elapsed, ok=True)
+    assert fast.hedge_delay() == 0.05
+    assert StubTranslateProvider(replace(config, hedge_enabled=False)).hedge_delay() is None
+
+
+def test_failed_segments_are_reported_per_field(monkeypatch):
+    """구간 번역이 실패해 원문으로 남은 필드는 partial / translation_failed"""
+    config = replace(settings.translation, provider='stub', hedge_enabled=False, batch_max_segments=1)
+
+    class FailingProvider(StubTranslateProvider):
+        async def _send(self, text, target_lang, source_lang):
+            if '失敗' in text:
+                return None
+            return await super()._send(text, target_lang, source_lang)
+
+    service = TranslationService()
+    monkeypatch.setattr(service, 'batch_service', BatchTranslationService(config, FailingProvider(config)))
+    product = {'name': '成功する商品名', 'category': '失敗するカテゴリ', 'features': ['軽量。', '失敗する特徴。']}
+    translated, services_info = asyncio.run(service.translate_product_data_with_info(product))
+    fields = {info['field']: info for info in services_info}
+
+    assert fields['name']['service'] == 'stub'
+    assert fields['category']['service'] == 'translation_failed'
+    assert fields['category']['failed_segments'] == 1
+    assert translated['category'] == '失敗するカテゴリ'
+    assert fields['features']['service'] == 'partial'
+    assert translated['features'] == ['[ko] 軽量。', '失敗する特徴。']